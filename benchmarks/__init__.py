@@ -0,0 +1,7 @@
+"""
+Benchmarks for TTR
+==================
+
+Standalone micro-benchmarks. Run each module directly, e.g.:
+    python benchmarks/bench_match_engine.py
+"""
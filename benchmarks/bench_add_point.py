@@ -0,0 +1,68 @@
+"""
+add_point Microbenchmark
+========================
+
+Measures the per-point cost of MatchEngine.add_point() on its own, and the
+number of memory blocks still allocated per point afterwards (tracemalloc),
+which shows whether the hot path leaves garbage behind.
+
+Run with: python benchmarks/bench_add_point.py
+"""
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+
+# Alternating points never finish a set: 10:10, then a long deuce.
+# A fresh engine is started every POINTS_PER_ENGINE points.
+POINTS = 200_000
+POINTS_PER_ENGINE = 1000
+REPEAT = 5
+
+
+def run_points(use_transition_table: bool) -> None:
+    """Play POINTS alternating points."""
+    for _ in range(POINTS // POINTS_PER_ENGINE):
+        engine = MatchEngine(use_transition_table=use_transition_table)
+        add_point = engine.add_point
+        for _ in range(POINTS_PER_ENGINE // 2):
+            add_point(PLAYER_1)
+            add_point(PLAYER_2)
+
+
+def measure_allocations(use_transition_table: bool) -> float:
+    """Memory blocks allocated per point that are still alive afterwards."""
+    engine = MatchEngine(use_transition_table=use_transition_table)
+    add_point = engine.add_point
+    results = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(POINTS_PER_ENGINE // 2):
+        # Keep the results alive so allocated return values show up
+        results.append(add_point(PLAYER_1))
+        results.append(add_point(PLAYER_2))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / len(results)
+
+
+def main() -> None:
+    for label, use_table in (("scalar", False), ("table", True)):
+        best = min(timeit.repeat(lambda: run_points(use_table), number=1, repeat=REPEAT))
+        blocks = measure_allocations(use_table)
+        print(
+            f"add_point {label:<7} {best / POINTS * 1e9:7.1f} ns/point  "
+            f"{POINTS / best:>12,.0f} points/s  {blocks:5.2f} live blocks/point"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Batch Replay Benchmark
+======================
+
+Re-validates a synthetic archive of random matches once with the scalar
+MatchEngine (replay_points per match) and once with the vectorized
+replay_matches() from src/core/batch_replay.py.
+
+Run with: python benchmarks/bench_batch_replay.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.batch_replay import replay_matches
+
+MATCHES = 20000
+POINTS_PER_MATCH = 200
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    matrix = rng.integers(1, 3, size=(MATCHES, POINTS_PER_MATCH), dtype=np.uint8)
+    sequences = [row.tobytes() for row in matrix]
+    
+    start = time.perf_counter()
+    for points in sequences:
+        MatchEngine(sets_to_win=3, use_transition_table=True).replay_points(points)
+    scalar = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    replay_matches(matrix, sets_to_win=3)
+    batch = time.perf_counter() - start
+    
+    print(f"scalar: {MATCHES} matches in {scalar:6.3f}s  -> {MATCHES / scalar:>10,.0f} matches/s")
+    print(f"batch:  {MATCHES} matches in {batch:6.3f}s  -> {MATCHES / batch:>10,.0f} matches/s")
+    print(f"speedup: {scalar / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Match Codec Benchmark
+=====================
+
+Compares the binary codec in src/core/codec.py with the
+dataclass -> dict -> JSON route, for the live state only and for a full
+match with history: encoded size and round trips per second.
+
+Run with: python benchmarks/bench_codec.py
+"""
+
+import json
+import random
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.codec import decode_engine, decode_state, encode_engine
+from core.constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET
+from core.match_engine import MatchEngine
+from core.models import MatchState
+
+MATCHES = 500
+REPEAT = 5
+
+
+def json_encode(engine: MatchEngine, include_history: bool = True) -> bytes:
+    data = asdict(engine.get_current_state())
+    data["initial_server"] = engine.initial_server
+    data["sets_to_win"] = engine.sets_to_win
+    if include_history:
+        data["history"] = list(engine.timeline.events)
+    return json.dumps(data).encode("utf-8")
+
+
+def json_decode_state(data: bytes) -> MatchState:
+    values = json.loads(data)
+    return MatchState(
+        score_player1=values["score_player1"],
+        score_player2=values["score_player2"],
+        sets_player1=values["sets_player1"],
+        sets_player2=values["sets_player2"],
+        server=values["server"],
+    )
+
+
+def json_decode_engine(data: bytes) -> MatchEngine:
+    values = json.loads(data)
+    history = values["history"]
+    # The first server is not stored; derive it like a reader of the old format would
+    resets = history.count(EVENT_RESET_SET)
+    first_server = values["initial_server"] if resets % 2 == 0 else 3 - values["initial_server"]
+    engine = MatchEngine(sets_to_win=values["sets_to_win"], initial_server=first_server)
+    for event in history:
+        if event == EVENT_RESET_SET:
+            engine.reset_set()
+        else:
+            engine.add_point(event)
+    return engine
+
+
+def make_matches() -> list[MatchEngine]:
+    rng = random.Random(0)
+    engines = []
+    for _ in range(MATCHES):
+        engine = MatchEngine(sets_to_win=3)
+        while not engine.is_match_finished():
+            result = engine.add_point(rng.choice((PLAYER_1, PLAYER_2)))
+            if result.set_won and not result.match_won:
+                engine.reset_set()
+        engines.append(engine)
+    return engines
+
+
+def bench(label: str, engines, encode, decode) -> None:
+    sizes = [len(encode(engine)) for engine in engines]
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for engine in engines:
+            decode(encode(engine))
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{label:<26} {sum(sizes) / len(sizes):7.1f} bytes  "
+        f"{len(engines) / best:>12,.0f} round trips/s"
+    )
+
+
+def main() -> None:
+    engines = make_matches()
+    print(f"{MATCHES} finished best-of-5 matches")
+    bench("state: codec", engines, lambda e: encode_engine(e, include_history=False), decode_state)
+    bench("state: JSON", engines, lambda e: json_encode(e, include_history=False), json_decode_state)
+    bench("full match: codec", engines, encode_engine, decode_engine)
+    bench("full match: JSON", engines, json_encode, json_decode_engine)
+
+
+if __name__ == "__main__":
+    main()
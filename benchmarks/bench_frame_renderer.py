@@ -0,0 +1,99 @@
+"""
+Frame Renderer Benchmark
+========================
+
+Cost of one broadcast frame (1920x1080, offscreen Qt platform): full
+redraw, a point (dirty-region repaint), an unchanged tick, and the
+per-frame cost of each sink for changed and unchanged frames.
+
+Run with: python benchmarks/bench_frame_renderer.py
+"""
+
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtGui import QGuiApplication
+
+from src.core.match_engine import MatchEngine
+from src.ui.frame_renderer import (
+    DEFAULT_FRAME_SIZE,
+    FrameState,
+    LatestFrameSink,
+    PngSequenceSink,
+    RawPipeSink,
+    ScoreboardFrameRenderer,
+)
+
+POINTS = 500
+TICKS = 10_000
+SINK_FRAMES = 50
+
+
+def point_states(count: int) -> list[FrameState]:
+    """States after each of ``count`` random points (new set / match as needed)."""
+    rng = random.Random(0)
+    engine = MatchEngine("Anna", "Bernd", 3)
+    states = []
+    for _ in range(count):
+        if engine.is_match_finished():
+            engine = MatchEngine("Anna", "Bernd", 3)
+        elif engine.get_set_winner():
+            engine.reset_set()
+        engine.add_point(rng.choice((1, 2)))
+        states.append(FrameState.from_engine(engine))
+    return states
+
+
+def main() -> None:
+    app = QGuiApplication(sys.argv)
+    states = point_states(POINTS)
+
+    full = []
+    for state in states[:50]:
+        renderer = ScoreboardFrameRenderer(DEFAULT_FRAME_SIZE)
+        start = time.perf_counter()
+        renderer.render(state)
+        full.append(time.perf_counter() - start)
+    print(f"full redraw      {min(full) * 1000:8.3f} ms/frame")
+
+    renderer = ScoreboardFrameRenderer(DEFAULT_FRAME_SIZE)
+    renderer.render(states[0])
+    start = time.perf_counter()
+    for state in states[1:]:
+        renderer.render(state)
+    print(f"point (dirty)    {(time.perf_counter() - start) / (POINTS - 1) * 1000:8.3f} ms/frame")
+
+    state = renderer.state
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        renderer.render(state)
+    print(f"unchanged tick   {(time.perf_counter() - start) / TICKS * 1e6:8.3f} µs/frame")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sinks = (
+            ("png sequence", PngSequenceSink(Path(directory) / "png")),
+            ("raw pipe", RawPipeSink(io.BytesIO())),
+            ("latest file", LatestFrameSink(Path(directory) / "latest.png")),
+        )
+        for name, sink in sinks:
+            for changed in (True, False):
+                start = time.perf_counter()
+                for index in range(SINK_FRAMES):
+                    sink.write(renderer.image, index + (0 if changed else SINK_FRAMES), changed)
+                    if isinstance(sink, RawPipeSink):
+                        sink.stream.seek(0)
+                label = "changed" if changed else "unchanged"
+                print(f"{name:<13} {label:<9} {(time.perf_counter() - start) / SINK_FRAMES * 1000:8.3f} ms/frame")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
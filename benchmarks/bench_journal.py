@@ -0,0 +1,70 @@
+"""
+Point Journal Benchmark
+=======================
+
+Measures what a tap costs with the crash journal: the os.write() on the UI
+thread (PointJournal.append) compared with a synchronous fsync per point,
+and how long recovering a long match from the journal takes.
+
+Run with: python benchmarks/bench_journal.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.constants import PLAYER_1, PLAYER_2
+from core.journal import JournalHeader, PointJournal, read_journal
+
+TAPS = 2000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    taps = [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(TAPS)]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "match.journal"
+        
+        journal = PointJournal(path, JournalHeader("A", "B", sets_to_win=50))
+        latencies = []
+        for player in taps:
+            start = time.perf_counter()
+            journal.append(player)
+            latencies.append(time.perf_counter() - start)
+        journal.close()
+        
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        sync_latencies = []
+        for player in taps[:200]:
+            start = time.perf_counter()
+            os.write(fd, bytes((player,)))
+            os.fsync(fd)
+            sync_latencies.append(time.perf_counter() - start)
+        os.close(fd)
+        
+        start = time.perf_counter()
+        engine = read_journal(path).to_engine()
+        recovery = time.perf_counter() - start
+    
+    latencies.sort()
+    sync_latencies.sort()
+    print(
+        f"append (group commit): median {latencies[len(latencies) // 2] * 1e6:7.1f} us, "
+        f"max {latencies[-1] * 1e6:7.1f} us"
+    )
+    print(
+        f"write + fsync per tap: median {sync_latencies[len(sync_latencies) // 2] * 1e6:7.1f} us, "
+        f"max {sync_latencies[-1] * 1e6:7.1f} us"
+    )
+    print(f"recovery of {engine.timeline.point_count} points: {recovery * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Touch Keyboard Benchmark
+========================
+
+Opening the on-screen keyboard (offscreen Qt platform): the tournament
+name prompt (MainWindow.ask_text) and a player name field
+(show_keyboard_for_field), each time until the keyboard is laid out and
+painted, then closed with the back key. Also counts the live widgets
+after every open, which must not grow: the keyboard is built once with
+its page and only re-targeted.
+
+Run with: python benchmarks/bench_keyboard.py
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["APP_PAGE_WARMUP"] = "false"
+os.environ["APP_SPECTATOR_SCREEN"] = "off"
+os.environ["APP_JOURNAL_PATH"] = str(Path(tempfile.mkdtemp()) / "none.journal")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+RUNS = 50
+
+
+def main() -> None:
+    from PyQt6.QtWidgets import QApplication, QLineEdit
+    from PyQt6.QtCore import QTimer
+    import ttr_gui
+    from src.core.constants import PageIndex
+    from src.ui.widgets.touch_keyboard import CANCEL_KEY
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ttr_gui.load_stylesheet())
+    window = ttr_gui.TTRMainWindow()
+    window.resize(1280, 800)
+    window.show()
+    window.show_page(PageIndex.MATCH_SETUP)
+    app.processEvents()
+    keyboard_page = window.page(PageIndex.KEYBOARD)
+
+    def close_keyboard() -> None:
+        keyboard_page.keyboard.press(CANCEL_KEY)
+        app.processEvents()
+
+    def open_turnier_name() -> float:
+        times = []
+
+        def painted() -> None:
+            app.processEvents()
+            times.append(time.perf_counter() - start)
+            keyboard_page.keyboard.press(CANCEL_KEY)
+
+        QTimer.singleShot(0, painted)
+        start = time.perf_counter()
+        window.ask_text("Turniername", "Turniername eingeben...")
+        app.processEvents()
+        return times[0]
+
+    def open_player_field() -> float:
+        field = QLineEdit("Anna")
+        start = time.perf_counter()
+        window.show_keyboard_for_field(field, PageIndex.MATCH_SETUP, "Spieler 1")
+        app.processEvents()
+        seconds = time.perf_counter() - start
+        close_keyboard()
+        return seconds
+
+    print(f"{'':<22} {'open':>9} {'widgets':>15}  (median of {RUNS})")
+    for name, open_keyboard in (("turnier name", open_turnier_name), ("player field", open_player_field)):
+        open_keyboard()  # first open (keyboard page built lazily)
+        widgets_before = len(QApplication.allWidgets())
+        times = [open_keyboard() for _ in range(RUNS)]
+        growth = len(QApplication.allWidgets()) - widgets_before
+        print(f"{name:<22} {statistics.median(times) * 1000:6.2f} ms {widgets_before:7d} {growth:+6d}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+MatchEngine Throughput Benchmark
+=================================
+
+Measures points/sec of MatchEngine.add_point() and the bulk
+MatchEngine.replay_points() path, each in scalar mode and in table-driven
+mode (use_transition_table=True), on the same random matches.
+
+Run with: python benchmarks/bench_match_engine.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+
+MATCHES = 2000
+POINTS_PER_MATCH = 300
+
+
+def replay(points_per_match, **engine_kwargs) -> int:
+    """Replay all matches and return the number of points applied."""
+    applied = 0
+    for points in points_per_match:
+        engine = MatchEngine(sets_to_win=4, **engine_kwargs)
+        for player in points:
+            result = engine.add_point(player)
+            applied += 1
+            if result.match_won:
+                break
+            if result.set_won:
+                engine.reset_set()
+    return applied
+
+
+def replay_bulk(points_per_match, **engine_kwargs) -> int:
+    """Replay all matches via MatchEngine.replay_points()."""
+    applied = 0
+    for points in points_per_match:
+        engine = MatchEngine(sets_to_win=4, **engine_kwargs)
+        applied += engine.replay_points(points)
+    return applied
+
+
+def bench(label: str, points_per_match, runner=replay, **engine_kwargs) -> float:
+    """Run one configuration and print its throughput."""
+    start = time.perf_counter()
+    applied = runner(points_per_match, **engine_kwargs)
+    elapsed = time.perf_counter() - start
+    rate = applied / elapsed
+    print(f"{label:<20} {applied:>9} points in {elapsed:6.3f}s  -> {rate:>12,.0f} points/s")
+    return rate
+
+
+def main() -> None:
+    rng = random.Random(0)
+    points_per_match = [
+        [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(POINTS_PER_MATCH)]
+        for _ in range(MATCHES)
+    ]
+    
+    # Warm-up (builds the cached transition table)
+    replay(points_per_match[:10], use_transition_table=True)
+    
+    scalar = bench("add_point scalar", points_per_match)
+    bench("add_point table", points_per_match, use_transition_table=True)
+    bench("replay scalar", points_per_match, runner=replay_bulk)
+    table = bench("replay table", points_per_match, runner=replay_bulk, use_transition_table=True)
+    print(f"speedup (replay table vs add_point scalar): {table / scalar:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Match Registry Benchmark
+========================
+
+Simulates a venue: TABLES concurrent matches receive random point events
+in batches while a reader thread polls the published snapshots every
+millisecond (like a fast hall display).
+Prints event throughput, batch latency percentiles and memory per match.
+
+Run with: python benchmarks/bench_registry.py
+"""
+
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.constants import PLAYER_1, PLAYER_2
+from core.registry import MatchRegistry
+
+TABLES = 400
+BATCHES = 2000
+EVENTS_PER_BATCH = 100
+
+
+def main() -> None:
+    rng = random.Random(0)
+    tables = list(range(TABLES))
+    
+    tracemalloc.start()
+    registry = MatchRegistry()
+    for table_id in tables:
+        registry.open_match(table_id, sets_to_win=3)
+    
+    reads = 0
+    done = threading.Event()
+    
+    def reader() -> None:
+        nonlocal reads
+        while not done.is_set():
+            snapshots = registry.snapshots()
+            sum(snapshot.points_played for snapshot in snapshots.values())
+            reads += 1
+            time.sleep(0.001)
+    
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    
+    latencies = []
+    applied = 0
+    start = time.perf_counter()
+    for _ in range(BATCHES):
+        events = [
+            (rng.randrange(TABLES), PLAYER_1 if rng.random() < 0.5 else PLAYER_2)
+            for _ in range(EVENTS_PER_BATCH)
+        ]
+        batch_start = time.perf_counter()
+        applied += registry.apply_events(events)
+        latencies.append(time.perf_counter() - batch_start)
+        # Restart finished tables, as the venue would
+        for table_id, snapshot in registry.snapshots().items():
+            if snapshot.winner is not None:
+                registry.open_match(table_id, sets_to_win=3)
+    elapsed = time.perf_counter() - start
+    done.set()
+    thread.join()
+    
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    latencies.sort()
+    print(f"{TABLES} tables, {applied:,} points in {elapsed:.2f}s -> {applied / elapsed:,.0f} points/s")
+    print(
+        f"batch of {EVENTS_PER_BATCH}: median {statistics.median(latencies) * 1e3:.2f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms"
+    )
+    print(f"snapshot reads during run: {reads:,}")
+    print(
+        f"memory: {current / TABLES / 1024:.1f} KiB per table traced, "
+        f"{registry.memory_usage / TABLES:.0f} B per live match estimated, "
+        f"{len(registry.archive.matches)} matches archived"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Result Overlay Benchmark
+========================
+
+Popup latency of the "set won" message: time from the call until the
+popup is painted, for the old per-call QDialog (show_custom_info_dialog,
+its exec() loop replaced by show + one event-loop pass) versus the
+pre-built ResultOverlay (offscreen Qt platform).
+
+Run with: python benchmarks/bench_result_overlay.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+POPUPS = 200
+PAGE_SIZE = (1280, 800)
+TEXT = "Anna gewinnt den Satz!\nStand: 1 : 0"
+
+
+def main() -> None:
+    from PyQt6.QtWidgets import QApplication, QDialog, QWidget
+    import ttr_gui
+    from src.ui.widgets.result_overlay import ResultOverlay
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ttr_gui.load_stylesheet())
+    page = QWidget()
+    page.resize(*PAGE_SIZE)
+    page.show()
+    app.processEvents()
+
+    def exec_once(dialog: QDialog) -> int:
+        dialog.show()
+        app.processEvents()
+        dialog.done(QDialog.DialogCode.Accepted)
+        dialog.deleteLater()
+        return QDialog.DialogCode.Accepted
+
+    QDialog.exec = exec_once
+    start = time.perf_counter()
+    for _ in range(POPUPS):
+        ttr_gui.show_custom_info_dialog(page, "Satz gewonnen!", TEXT, cancel_text="Zurück")
+    dialog_seconds = (time.perf_counter() - start) / POPUPS
+
+    overlay = ResultOverlay(page)
+    start = time.perf_counter()
+    for _ in range(POPUPS):
+        overlay.show_result("Satz gewonnen!", TEXT, cancel_text="Zurück")
+        app.processEvents()
+        overlay.confirm()
+    overlay_seconds = (time.perf_counter() - start) / POPUPS
+
+    print(f"QDialog per call  {dialog_seconds * 1000:7.2f} ms/popup")
+    print(f"ResultOverlay     {overlay_seconds * 1000:7.2f} ms/popup "
+          f"({dialog_seconds / overlay_seconds:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
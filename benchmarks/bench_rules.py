@@ -0,0 +1,74 @@
+"""
+Rule Set Benchmark
+==================
+
+Per-point cost of MatchEngine.add_point() for each rule set (scalar and
+table-driven), and for a mixed workload where tables with different rules
+are played interleaved in one process. The standard rules are the baseline:
+they are the values the engine used to read from the module constants.
+
+Run with: python benchmarks/bench_rules.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.rules import LEGACY_21_RULES, STANDARD_RULES, handicap_rules
+
+POINTS = 200_000
+REPEAT = 5
+
+VARIANTS = (STANDARD_RULES, LEGACY_21_RULES, handicap_rules(4, 0))
+
+
+def make_points(seed: int = 0) -> list[int]:
+    """Random rally winners (player 1 slightly stronger)."""
+    rng = random.Random(seed)
+    return [PLAYER_1 if rng.random() < 0.52 else PLAYER_2 for _ in range(POINTS)]
+
+
+def play(engines: list[MatchEngine], points: list[int], rules_per_engine, use_table: bool) -> None:
+    """Play ``points`` round-robin over ``engines`` like the scoreboard does."""
+    count = len(engines)
+    for index, player in enumerate(points):
+        slot = index % count
+        engine = engines[slot]
+        result = engine.add_point(player)
+        if result.match_won:
+            engines[slot] = MatchEngine(
+                sets_to_win=3, rules=rules_per_engine[slot], use_transition_table=use_table
+            )
+        elif result.set_won:
+            engine.reset_set()
+
+
+def bench(label: str, rules_per_engine, points: list[int], use_table: bool) -> None:
+    def run() -> None:
+        engines = [
+            MatchEngine(sets_to_win=3, rules=rules, use_transition_table=use_table)
+            for rules in rules_per_engine
+        ]
+        play(engines, points, rules_per_engine, use_table)
+
+    best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    mode = "table" if use_table else "scalar"
+    print(f"{label:<24} {mode:<7} {best / POINTS * 1e9:7.1f} ns/point  {POINTS / best:>12,.0f} points/s")
+
+
+def main() -> None:
+    points = make_points()
+    for use_table in (False, True):
+        for rules in VARIANTS:
+            bench(rules.name, (rules,), points, use_table)
+        bench("mixed (3 tables)", VARIANTS, points, use_table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Score Display Benchmark
+=======================
+
+Repaint time of one score change for a QLabel with the huge scoreboard
+font versus ScoreDisplay (pre-rendered digit pixmaps), on a 4K-sized
+half-screen widget at device pixel ratio 1 and 2 (offscreen Qt platform).
+
+Run with: python benchmarks/bench_score_display.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CHANGES = 200
+# Half of a 3840x2160 hall display, in logical pixels at ratio 1
+WIDGET_SIZE = (1920, 1800)
+STYLE = """
+QWidget { background-color: #1a1a2e; }
+#scoreBig { color: #ffffff; font-size: 1400px; font-weight: bold; }
+"""
+
+
+def measure(widget, app) -> float:
+    """Average seconds for setText() plus the repaint it schedules."""
+    texts = [str(value % 30) for value in range(CHANGES)]
+    widget.setText("88")
+    app.processEvents()
+    start = time.perf_counter()
+    for text in texts:
+        widget.setText(text)
+        app.processEvents()
+    return (time.perf_counter() - start) / CHANGES
+
+
+def run(ratio: str) -> None:
+    os.environ["QT_SCALE_FACTOR"] = ratio
+    from PyQt6.QtWidgets import QApplication, QLabel
+    from PyQt6.QtCore import Qt
+    from src.ui.widgets.score_display import ScoreDisplay, get_glyph_cache
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(STYLE)
+    width, height = (int(size / float(ratio)) for size in WIDGET_SIZE)
+
+    label = QLabel("0")
+    label.setObjectName("scoreBig")
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    display = ScoreDisplay("0")
+    display.setObjectName("scoreBig")
+
+    for name, widget in (("QLabel", label), ("ScoreDisplay", display)):
+        widget.resize(width, height)
+        widget.show()
+        app.processEvents()
+        seconds = measure(widget, app)
+        print(f"ratio {ratio}  {name:<13} {seconds * 1000:7.2f} ms/change")
+        widget.hide()
+
+    display.show()
+    app.processEvents()
+    start = time.perf_counter()
+    display.resize(width // 2, height // 2)
+    display.repaint()
+    print(f"ratio {ratio}  resize + glyph rebuild {(time.perf_counter() - start) * 1000:7.2f} ms "
+          f"({get_glyph_cache().builds} glyph sets built)")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+        return
+    # One process per pixel ratio (QT_SCALE_FACTOR is read at startup)
+    import subprocess
+    for ratio in ("1", "2"):
+        subprocess.run([sys.executable, __file__, ratio], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Scoreboard Render Benchmark
+===========================
+
+Per-point CPU time of the scoreboard display update under the offscreen Qt
+platform: the previous render path (six setText calls and two
+setStyleSheet calls for the serve indicator on every point) against the
+diff-based path (only changed labels, serve indicator switched by
+visibility). Each point includes the engine update and one processed
+event loop pass (layout and paint).
+
+Run with: python benchmarks/bench_scoreboard_render.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("APP_JOURNAL_PATH", str(Path(tempfile.mkdtemp()) / "bench.journal"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtWidgets import QApplication
+
+import ttr_gui
+from src.core.match_engine import MatchEngine
+
+POINTS = 3000
+REPEAT = 3
+
+
+def legacy_update_display(page) -> None:
+    """The render path before diffing (for comparison)."""
+    page.lbl_player1_name.setText(page.player1_name)
+    page.lbl_player2_name.setText(page.player2_name)
+    page.lbl_score1.setText(str(page.engine.score_player1))
+    page.lbl_score2.setText(str(page.engine.score_player2))
+    page.lbl_sets1.setText(str(page.engine.sets_player1))
+    page.lbl_sets2.setText(str(page.engine.sets_player2))
+    if page.engine.server == 1:
+        page.serve_indicator1.setStyleSheet("font-size: 32px; color: white; margin-left: 10px;")
+        page.serve_indicator2.setStyleSheet("font-size: 32px; color: transparent; margin-right: 10px;")
+    else:
+        page.serve_indicator1.setStyleSheet("font-size: 32px; color: transparent; margin-left: 10px;")
+        page.serve_indicator2.setStyleSheet("font-size: 32px; color: white; margin-right: 10px;")
+    page.update_win_probability()
+
+
+def play(app: QApplication, page, points: list[int]) -> float:
+    """Tap every point and process one frame; returns seconds."""
+    page.set_engine(MatchEngine("A", "B", 3, track_statistics=True))
+    start = time.perf_counter()
+    for player in points:
+        page.add_point(player)
+        app.processEvents()
+    return time.perf_counter() - start
+
+
+def start_next_set(page) -> None:
+    """Stand-in for the set-won dialog (confirmed immediately)."""
+    if page.engine.is_match_finished():
+        page.set_engine(MatchEngine("A", "B", 3, track_statistics=True))
+        page.update_display()
+    else:
+        page.engine.reset_set()
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    window = ttr_gui.TTRMainWindow()
+    window.resize(1280, 800)
+    window.show()
+    app.processEvents()
+
+    page = window.page_scoreboard
+    page.player1_name, page.player2_name = "A", "B"
+    page.show_set_won = lambda player: start_next_set(page)
+    window.stack.setCurrentWidget(page)
+    app.processEvents()
+
+    rng = random.Random(0)
+    points = [rng.choice((1, 2)) for _ in range(POINTS)]
+
+    diff_update = page.update_display
+    for label, update in (("previous", lambda: legacy_update_display(page)), ("diff-based", diff_update)):
+        page.update_display = update
+        if label == "diff-based":
+            # Indicators back to their fixed style
+            page.serve_indicator1.setStyleSheet("font-size: 32px; color: white; margin-left: 10px;")
+            page.serve_indicator2.setStyleSheet("font-size: 32px; color: white; margin-right: 10px;")
+            page.rendered.clear()
+        best = min(play(app, page, points) for _ in range(REPEAT))
+        print(f"{label:<12} {best / POINTS * 1e6:8.1f} µs/point")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Simulation Benchmark
+====================
+
+Measures the throughput of the Monte Carlo simulator in
+src/core/simulation.py and compares the simulated win rate with the
+win probability model.
+
+Run with: python benchmarks/bench_simulation.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.constants import PLAYER_1, SETS_TO_WIN_MAP, MatchMode
+from core.models import MatchState
+from core.simulation import simulate_matches, simulate_round_robin
+from core.win_probability import match_win_probability
+
+MATCHES = 1_000_000
+SERVE_WIN_RATES = (0.55, 0.50)
+
+
+def main() -> None:
+    for mode in (MatchMode.QUICK, MatchMode.BEST_OF_3, MatchMode.BEST_OF_5, MatchMode.BEST_OF_7):
+        sets_to_win = SETS_TO_WIN_MAP[mode]
+        
+        start = time.perf_counter()
+        result = simulate_matches(MATCHES, *SERVE_WIN_RATES, sets_to_win=sets_to_win, seed=0)
+        elapsed = time.perf_counter() - start
+        
+        model = match_win_probability(MatchState(0, 0, 0, 0, PLAYER_1), sets_to_win, *SERVE_WIN_RATES)
+        median = result.length_percentiles((50,))[50]
+        print(
+            f"{mode.name:<10} {MATCHES / elapsed * 60:>12,.0f} matches/min  "
+            f"win rate {result.win_rate():.4f} (model {model:.4f})  median {median:.0f} points"
+        )
+    
+    start = time.perf_counter()
+    tournament = simulate_round_robin([0.60, 0.55, 0.50, 0.45, 0.40, 0.35], 100_000, sets_to_win=3, seed=0)
+    elapsed = time.perf_counter() - start
+    print(
+        f"round robin: {len(tournament)} tournaments in {elapsed:.2f}s, "
+        f"champion {tournament.champion_probabilities().round(3).tolist()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
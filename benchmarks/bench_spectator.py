@@ -0,0 +1,123 @@
+"""
+Spectator Mirror Benchmark
+==========================
+
+Per-point CPU time of the scoreboard with a second display under the
+offscreen Qt platform: single screen, a second ScoreboardPage widget tree
+fed by the same engine, and the SpectatorWindow mirror (painted straight
+from the match state, only the changed elements). Each point
+includes the engine update and one processed event loop pass (layout and
+paint). The last line is the mirror's own share: set_state() and its
+frame without the main screen. The window matches the offscreen screen (800x800), like two
+monitors of the same size.
+
+Run with: python benchmarks/bench_spectator.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("APP_JOURNAL_PATH", str(Path(tempfile.mkdtemp()) / "bench.journal"))
+os.environ["APP_SPECTATOR_SCREEN"] = "off"
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtWidgets import QApplication
+
+import ttr_gui
+from src.core.match_engine import MatchEngine
+from src.ui.frame_renderer import FrameState
+
+POINTS = 2000
+REPEAT = 3
+WINDOW_SIZE = (800, 800)
+
+
+def start_next_set(page) -> None:
+    """Stand-in for the set-won overlay (confirmed immediately)."""
+    if page.engine.is_match_finished():
+        page.set_engine(MatchEngine("A", "B", 3, track_statistics=True))
+        page.update_display()
+    else:
+        page.engine.reset_set()
+
+
+def play(app: QApplication, page, points: list[int], second_tree=None) -> float:
+    """Tap every point and process one frame; returns seconds."""
+    page.set_engine(MatchEngine("A", "B", 3, track_statistics=True))
+    if second_tree is not None:
+        second_tree.set_engine(page.engine)
+    start = time.perf_counter()
+    for player in points:
+        page.add_point(player)
+        if second_tree is not None and second_tree.engine is not page.engine:
+            second_tree.set_engine(page.engine)  # new match after a finished one
+        app.processEvents()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ttr_gui.load_stylesheet())
+    window = ttr_gui.TTRMainWindow()
+    window.resize(*WINDOW_SIZE)
+    window.show()
+
+    page = window.page_scoreboard
+    page.player1_name, page.player2_name = "A", "B"
+    page.show_set_won = lambda player: start_next_set(page)
+    window.stack.setCurrentWidget(page)
+    app.processEvents()
+
+    rng = random.Random(0)
+    points = [rng.choice((1, 2)) for _ in range(POINTS)]
+
+    best = min(play(app, page, points) for _ in range(REPEAT))
+    print(f"single screen      {best / POINTS * 1e6:8.1f} µs/point")
+
+    # Second widget tree on the spectator screen
+    tree = ttr_gui.ScoreboardPage(None)
+    tree.player1_name, tree.player2_name = "A", "B"
+    tree.show_set_won = lambda player: None
+    tree.resize(*WINDOW_SIZE)
+    tree.show()
+    app.processEvents()
+    best = min(play(app, page, points, second_tree=tree) for _ in range(REPEAT))
+    print(f"second widget tree {best / POINTS * 1e6:8.1f} µs/point")
+    tree.set_engine(MatchEngine())
+    tree.close()
+
+    # Mirror: painted from the match state
+    window.setup_spectator(app.primaryScreen())
+    app.processEvents()
+    best = min(play(app, page, points) for _ in range(REPEAT))
+    print(f"spectator mirror   {best / POINTS * 1e6:8.1f} µs/point")
+
+    # The mirror's share alone, from the states of the same points
+    engine = MatchEngine("A", "B", 3)
+    states = []
+    for player in points:
+        result = engine.add_point(player)
+        states.append(FrameState.from_engine(engine))
+        if result.match_won:
+            engine = MatchEngine("A", "B", 3)
+        elif result.set_won:
+            engine.reset_set()
+
+    def mirror_only() -> float:
+        start = time.perf_counter()
+        for state in states:
+            window.spectator.set_state(state)
+            app.processEvents()
+        return time.perf_counter() - start
+
+    best = min(mirror_only() for _ in range(REPEAT))
+    print(f"  mirror alone     {best / POINTS * 1e6:8.1f} µs/point")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Startup Benchmark
+=================
+
+Time to the first interactive frame of TTRMainWindow (offscreen Qt
+platform, fresh process per run, from the process start including the
+interpreter, see mark_process_start()):
+all six pages built eagerly before the window is shown, versus only the
+start menu with the other pages built on first navigation. Also reports
+the cost of the first navigation to each lazily built page, and the whole
+cold start of ``python -m src.main`` (process spawn to the first frame,
+including interpreter start, imports and config).
+
+Run with: python benchmarks/bench_startup.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUNS = 5
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def child(mode: str) -> None:
+    """One cold start; prints the measurements as JSON."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["APP_PAGE_WARMUP"] = "false"
+    os.environ["APP_SPECTATOR_SCREEN"] = "off"
+    os.environ["APP_JOURNAL_PATH"] = str(Path(tempfile.mkdtemp()) / "none.journal")
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+    import ttr_gui
+    from PyQt6.QtWidgets import QApplication
+    from src.core.constants import PageIndex
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ttr_gui.load_stylesheet())
+    window = ttr_gui.TTRMainWindow()
+    if mode == "eager":
+        for index in PageIndex:
+            window.page(index)
+    window.resize(1280, 800)
+    window.show()
+    while window.first_frame_seconds is None:
+        app.processEvents()
+
+    result = {"first_frame": window.first_frame_seconds, "pages": {}}
+    if mode == "lazy":
+        for index in PageIndex:
+            if index in window.pages:
+                continue
+            start = time.perf_counter()
+            window.show_page(index)
+            app.processEvents()
+            result["pages"][index.name] = time.perf_counter() - start
+    print(json.dumps(result))
+    # Window before the application, teardown in any order can crash
+    window.close()
+    del window
+
+
+def cold_start() -> float:
+    """Seconds from spawning ``python -m src.main`` to its first frame."""
+    env = dict(
+        os.environ,
+        QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+        APP_PAGE_WARMUP="false",
+        APP_SPECTATOR_SCREEN="off",
+        APP_JOURNAL_PATH=str(Path(tempfile.mkdtemp()) / "none.journal"),
+        PYTHONUNBUFFERED="1",
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.main"], cwd=PROJECT_ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    try:
+        for line in process.stdout:
+            if "Bedienbar nach" in line:  # printed on the first frame
+                return time.perf_counter() - start
+        raise RuntimeError("src.main exited before its first frame")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        child(sys.argv[1])
+        return
+
+    for mode in ("eager", "lazy"):
+        runs = []
+        for _ in range(RUNS):
+            output = subprocess.run(
+                [sys.executable, __file__, mode], check=True, capture_output=True, text=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        first = statistics.median(run["first_frame"] for run in runs)
+        print(f"{mode:<6} first interactive frame {first * 1000:7.1f} ms (median of {RUNS})")
+        if mode == "lazy":
+            for name in runs[0]["pages"]:
+                seconds = statistics.median(run["pages"][name] for run in runs)
+                print(f"       first visit {name:<15} {seconds * 1000:7.1f} ms")
+
+    seconds = statistics.median(cold_start() for _ in range(RUNS))
+    print(f"python -m src.main to first frame {seconds * 1000:7.1f} ms (median of {RUNS})")
+
+
+if __name__ == "__main__":
+    main()
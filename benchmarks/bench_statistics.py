@@ -0,0 +1,87 @@
+"""
+Match Statistics Benchmark
+==========================
+
+Cost of keeping live statistics incrementally (per add_point() and per
+undo), compared with recomputing them from the history on every repaint
+as a multi-table overview would have to.
+
+Run with: python benchmarks/bench_statistics.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET
+from core.statistics import MatchStatistics
+
+POINTS = 100_000
+REPEAT = 5
+
+
+def make_points(seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(POINTS)]
+
+
+def play(points: list[int], track_statistics: bool) -> None:
+    """Play full matches like the scoreboard, undoing every 10th point."""
+    engine = MatchEngine(sets_to_win=3, track_statistics=track_statistics)
+    for index, player in enumerate(points):
+        result = engine.add_point(player)
+        if index % 10 == 9:
+            engine.undo_last_point()
+        elif result.match_won:
+            engine = MatchEngine(sets_to_win=3, track_statistics=track_statistics)
+        elif result.set_won:
+            engine.reset_set()
+
+
+def recompute(engine: MatchEngine) -> MatchStatistics:
+    """Rebuild the statistics from the timeline (the non-incremental way)."""
+    timeline = engine.timeline
+    statistics = MatchStatistics(engine.rules)
+    for index, event in enumerate(timeline.events):
+        if event == EVENT_RESET_SET:
+            statistics.record_reset()
+            continue
+        before = timeline.state_after(index)
+        score1, score2, sets1, sets2 = timeline.state_after(index + 1)[:4]
+        winner = PLAYER_1 if sets1 > before[2] else PLAYER_2 if sets2 > before[3] else None
+        server = before[4]
+        statistics.record_point(event, server, score1, score2, winner)
+    return statistics
+
+
+def main() -> None:
+    points = make_points()
+    for label, track in (("without statistics", False), ("with statistics", True)):
+        best = min(timeit.repeat(lambda: play(points, track), number=1, repeat=REPEAT))
+        print(f"add_point {label:<20} {best / POINTS * 1e9:7.1f} ns/point")
+
+    # One running best-of-5 in its fifth set
+    engine = MatchEngine(sets_to_win=3, track_statistics=True)
+    rng = random.Random(1)
+    while engine.sets_player1 + engine.sets_player2 < 4 or engine.timeline.point_count < 80:
+        result = engine.add_point(rng.choice((PLAYER_1, PLAYER_2)))
+        if result.match_won:
+            engine = MatchEngine(sets_to_win=3, track_statistics=True)
+        elif result.set_won:
+            engine.reset_set()
+
+    reads = 1000
+    incremental = min(timeit.repeat(lambda: engine.statistics.serve_points_won[PLAYER_1], number=reads, repeat=REPEAT))
+    full = min(timeit.repeat(lambda: recompute(engine), number=reads // 10, repeat=REPEAT)) * 10
+    print(f"\nread per repaint ({engine.timeline.point_count} points played)")
+    print(f"  incremental  {incremental / reads * 1e6:9.2f} µs")
+    print(f"  recompute    {full / reads * 1e6:9.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
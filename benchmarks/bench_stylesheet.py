@@ -0,0 +1,100 @@
+"""
+Stylesheet Benchmark
+====================
+
+Cost of styling (offscreen Qt platform): for every page and the tournament
+mode dialog, the time to build the widget tree and the time until it is
+polished, laid out and painted for the first time; plus one shift toggle
+of the full-screen keyboard and one open/close of the scoreboard's action
+bar (style variant switch and repaint). Runs in one process with the
+application stylesheet set once, like the app.
+
+Run with: python benchmarks/bench_stylesheet.py
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["APP_PAGE_WARMUP"] = "false"
+os.environ["APP_SPECTATOR_SCREEN"] = "off"
+os.environ["APP_JOURNAL_PATH"] = str(Path(tempfile.mkdtemp()) / "none.journal")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+RUNS = 15
+TOGGLES = 200
+
+
+def main() -> None:
+    from PyQt6.QtWidgets import QApplication
+    import ttr_gui
+    from src.core.constants import PageIndex
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ttr_gui.load_stylesheet())
+    window = ttr_gui.TTRMainWindow()
+    window.resize(1280, 800)
+    window.show()
+    app.processEvents()
+
+    def show_page(page):
+        window.stack.addWidget(page)
+        window.stack.setCurrentWidget(page)
+
+    def show_dialog(dialog):
+        dialog.show()
+
+    targets = [
+        (f"page {index.name.lower()}", lambda index=index: ttr_gui.TTRMainWindow.PAGE_FACTORIES[index](window), show_page)
+        for index in PageIndex
+    ] + [
+        ("dialog turnier mode", lambda: ttr_gui.TurnierModeDialog(window, "Cup"), show_dialog),
+    ]
+
+    print(f"{'':<22} {'build':>9} {'polish+paint':>13}  (median of {RUNS})")
+    total_build = total_show = 0.0
+    for name, build, show in targets:
+        builds, shows = [], []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            widget = build()
+            built = time.perf_counter()
+            show(widget)
+            app.processEvents()
+            builds.append(built - start)
+            shows.append(time.perf_counter() - built)
+            widget.hide()
+            widget.deleteLater()
+            app.processEvents()
+        build_seconds, show_seconds = statistics.median(builds), statistics.median(shows)
+        total_build += build_seconds
+        total_show += show_seconds
+        print(f"{name:<22} {build_seconds * 1000:6.2f} ms {show_seconds * 1000:10.2f} ms")
+    print(f"{'total':<22} {total_build * 1000:6.2f} ms {total_show * 1000:10.2f} ms")
+
+    keyboard = window.page(PageIndex.KEYBOARD)
+    window.show_page(PageIndex.KEYBOARD)
+    app.processEvents()
+    start = time.perf_counter()
+    for _ in range(TOGGLES):
+        keyboard.keyboard.set_shift(not keyboard.keyboard.shift_active)
+        app.processEvents()
+    print(f"shift toggle           {(time.perf_counter() - start) / TOGGLES * 1000:6.2f} ms")
+
+    scoreboard = window.page(PageIndex.SCOREBOARD)
+    window.show_page(PageIndex.SCOREBOARD)
+    app.processEvents()
+    start = time.perf_counter()
+    for _ in range(TOGGLES):
+        scoreboard.toggle_dropdown()
+        app.processEvents()
+    print(f"action bar toggle      {(time.perf_counter() - start) / TOGGLES * 1000:6.2f} ms")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,29 +5,55 @@ Configuration Management
 Loads configuration from environment variables using python-dotenv.
 All sensitive data (passwords, API keys) should be in .env file,
 NEVER committed to version control.
+
+Nothing is read at import time: the .env file is loaded and the config
+objects are built on the first get_db_config() / get_app_config() call,
+and python-dotenv is only imported if there is a .env file.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
-    print("⚠️ python-dotenv not installed. Using environment variables only.")
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+_env_loaded = False
+
+
+def _load_env(override: bool = False) -> None:
+    """Load the .env file from the project root (once, unless ``override``)."""
+    global _env_loaded
+    if _env_loaded and not override:
+        return
+    _env_loaded = True
+    if not ENV_PATH.exists():
+        print(f"⚠️ No .env file found at {ENV_PATH}. Using defaults/environment.")
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        print("⚠️ python-dotenv not installed. Using environment variables only.")
+        return
+    load_dotenv(ENV_PATH, override=override)
+    print(f"✅ Loaded configuration from {ENV_PATH}")
+
+
+def _env(name: str, default: str):
+    """Field default read from the environment when the config is built."""
+    return field(default_factory=lambda: os.getenv(name, default))
 
 
-# Load .env file from project root
-if DOTENV_AVAILABLE:
-    env_path = Path(__file__).parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"✅ Loaded configuration from {env_path}")
-    else:
-        print(f"⚠️ No .env file found at {env_path}. Using defaults/environment.")
+def _env_flag(name: str, default: str):
+    """Boolean field default ("true", "1" or "yes")."""
+    return field(default_factory=lambda: os.getenv(name, default).lower() in ("true", "1", "yes"))
+
+
+def _env_keys(name: str, default: str):
+    """Field default with a comma-separated list of key names (e.g. "Left,PgUp,1")."""
+    return field(default_factory=lambda: tuple(
+        key.strip() for key in os.getenv(name, default).split(",") if key.strip()
+    ))
 
 
 @dataclass(frozen=True)
@@ -45,12 +71,12 @@ class DatabaseConfig:
         DB_AUTH_PLUGIN: Authentication plugin (default: mysql_native_password)
     """
     
-    host: str = os.getenv("DB_HOST", "localhost")
-    port: int = int(os.getenv("DB_PORT", "3306"))
-    database: str = os.getenv("DB_NAME", "ttr_db")
-    user: str = os.getenv("DB_USER", "root")
-    password: str = os.getenv("DB_PASSWORD", "")
-    auth_plugin: str = os.getenv("DB_AUTH_PLUGIN", "mysql_native_password")
+    host: str = _env("DB_HOST", "localhost")
+    port: int = field(default_factory=lambda: int(os.getenv("DB_PORT", "3306")))
+    database: str = _env("DB_NAME", "ttr_db")
+    user: str = _env("DB_USER", "root")
+    password: str = _env("DB_PASSWORD", "")
+    auth_plugin: str = _env("DB_AUTH_PLUGIN", "mysql_native_password")
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -90,21 +116,47 @@ class AppConfig:
         APP_FULLSCREEN: Start in fullscreen mode (default: true)
         APP_DEBUG: Enable debug mode (default: false)
         APP_KIOSK_MODE: Enable kiosk mode (disable exit) (default: false)
+        APP_JOURNAL_PATH: Point journal for crash recovery
+            (default: <project_root>/data/current_match.journal)
+        APP_KEYS_PLAYER1: Keys scoring a point for player 1, comma-separated
+            Qt key names (default: Left,PgUp,1)
+        APP_KEYS_PLAYER2: Keys scoring a point for player 2 (default: Right,PgDown,2)
+        APP_KEYS_UNDO: Keys undoing the last point (default: Backspace)
+        APP_SPECTATOR_SCREEN: Screen of the spectator mirror: "auto" (second
+            screen if present), "off" or a screen index (default: auto)
+        APP_SPECTATOR_FLIP: Swap the players on the mirror (default: false)
+        APP_PAGE_WARMUP: Build the remaining pages in idle time after the
+            first frame, instead of on first navigation (default: true)
     """
     
-    fullscreen: bool = os.getenv("APP_FULLSCREEN", "true").lower() in ("true", "1", "yes")
-    debug: bool = os.getenv("APP_DEBUG", "false").lower() in ("true", "1", "yes")
-    kiosk_mode: bool = os.getenv("APP_KIOSK_MODE", "false").lower() in ("true", "1", "yes")
+    fullscreen: bool = _env_flag("APP_FULLSCREEN", "true")
+    debug: bool = _env_flag("APP_DEBUG", "false")
+    kiosk_mode: bool = _env_flag("APP_KIOSK_MODE", "false")
+    
+    # Key bindings (USB keyboard, presenter clicker, foot pedal)
+    keys_player1: tuple[str, ...] = _env_keys("APP_KEYS_PLAYER1", "Left,PgUp,1")
+    keys_player2: tuple[str, ...] = _env_keys("APP_KEYS_PLAYER2", "Right,PgDown,2")
+    keys_undo: tuple[str, ...] = _env_keys("APP_KEYS_UNDO", "Backspace")
+    
+    # Spectator mirror on a second monitor
+    spectator_screen: str = _env("APP_SPECTATOR_SCREEN", "auto")
+    spectator_flip: bool = _env_flag("APP_SPECTATOR_FLIP", "false")
+    
+    # Pages are built on first use; warm-up builds them after the first frame
+    page_warmup: bool = _env_flag("APP_PAGE_WARMUP", "true")
     
     # Paths
     project_root: Path = Path(__file__).parent.parent
     assets_dir: Path = project_root / "src" / "ui" / "resources"
     stylesheet_path: Path = assets_dir / "styles.qss"
+    journal_path: Path = field(default_factory=lambda: Path(
+        os.getenv("APP_JOURNAL_PATH", str(AppConfig.project_root / "data" / "current_match.journal"))
+    ))
 
 
-# Singleton instances
-db_config = DatabaseConfig()
-app_config = AppConfig()
+# Singleton instances (built on first use)
+db_config: Optional[DatabaseConfig] = None
+app_config: Optional[AppConfig] = None
 
 
 def get_db_config() -> DatabaseConfig:
@@ -113,6 +165,10 @@ def get_db_config() -> DatabaseConfig:
     Returns:
         DatabaseConfig instance
     """
+    global db_config
+    if db_config is None:
+        _load_env()
+        db_config = DatabaseConfig()
     return db_config
 
 
@@ -122,6 +178,10 @@ def get_app_config() -> AppConfig:
     Returns:
         AppConfig instance
     """
+    global app_config
+    if app_config is None:
+        _load_env()
+        app_config = AppConfig()
     return app_config
 
 
@@ -132,8 +192,7 @@ def reload_config() -> None:
     """
     global db_config, app_config
     
-    if DOTENV_AVAILABLE:
-        load_dotenv(override=True)
+    _load_env(override=True)
     
     db_config = DatabaseConfig()
     app_config = AppConfig()
@@ -144,7 +203,8 @@ def reload_config() -> None:
 if __name__ == "__main__":
     # Test configuration loading
     print("=== Database Configuration ===")
-    print(db_config)
+    print(get_db_config())
+    app_config = get_app_config()
     print("\n=== Application Configuration ===")
     print(f"Fullscreen: {app_config.fullscreen}")
     print(f"Debug: {app_config.debug}")
@@ -7,7 +7,7 @@ All classes here are framework-agnostic and fully testable.
 """
 
 from .constants import MatchMode, PageIndex, SETS_TO_WIN_MAP
-from .models import Player, Match, Tournament, SetResult
+from .models import Player, Match, Tournament, SetResult, MatchChange
 from .match_engine import MatchEngine
 
 __all__ = [
@@ -18,5 +18,6 @@ __all__ = [
     'Match',
     'Tournament',
     'SetResult',
+    'MatchChange',
     'MatchEngine',
 ]
@@ -0,0 +1,253 @@
+"""
+Batch Replay
+============
+
+Vectorized replay of many matches at once with NumPy.
+
+Instead of looping MatchEngine.add_point() per match, all matches advance
+together: point k of every match is applied in one set of array operations.
+The rules are exactly those of MatchEngine (serve rotation, deuce, set and
+match win), and a set is reset after each set win the same way
+MatchEngine.replay_points() does it.
+
+Requires NumPy (optional dependency, see requirements.txt).
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence, Union
+
+import numpy as np
+
+from .constants import PLAYER_1, PLAYER_2, DEFAULT_SETS_TO_WIN
+from .models import MatchState
+from .transition_table import DEFAULT_RULES, RulesKey
+
+
+# Dtype for scores, sets and servers (long deuces stay far below 2**15)
+_STATE_DTYPE = np.int16
+
+PointSequences = Union[np.ndarray, Sequence[Sequence[int]]]
+
+
+@dataclass
+class BatchReplayResult:
+    """Final state of every replayed match.
+
+    All attributes are arrays of length N (one entry per match), matching
+    the attributes of the same name on MatchEngine.
+
+    Attributes:
+        score_player1: Points of player 1 in the last set
+        score_player2: Points of player 2 in the last set
+        sets_player1: Sets won by player 1
+        sets_player2: Sets won by player 2
+        server: Current server (1 or 2)
+        initial_server: Server at the start of the last set
+        winner: Match winner (1 or 2), or 0 if the match is unfinished
+        points_played: Points consumed from each sequence
+    """
+    score_player1: np.ndarray
+    score_player2: np.ndarray
+    sets_player1: np.ndarray
+    sets_player2: np.ndarray
+    server: np.ndarray
+    initial_server: np.ndarray
+    winner: np.ndarray
+    points_played: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.winner)
+
+    def get_state(self, index: int) -> MatchState:
+        """Get the final state of one match.
+
+        Args:
+            index: Match index
+
+        Returns:
+            MatchState equal to MatchEngine.get_current_state() after the replay
+        """
+        return MatchState(
+            score_player1=int(self.score_player1[index]),
+            score_player2=int(self.score_player2[index]),
+            sets_player1=int(self.sets_player1[index]),
+            sets_player2=int(self.sets_player2[index]),
+            server=int(self.server[index]),
+        )
+
+
+def new_batch_state(
+    count: int,
+    sets_to_win: Union[int, np.ndarray] = DEFAULT_SETS_TO_WIN,
+    initial_server: Union[int, np.ndarray] = PLAYER_1,
+) -> BatchReplayResult:
+    """Create the start state for ``count`` matches.
+
+    Args:
+        count: Number of matches
+        sets_to_win: Sets needed to win, scalar or one value per match
+        initial_server: First server, scalar or one value per match
+
+    Returns:
+        BatchReplayResult holding the initial state
+
+    Raises:
+        ValueError: If sets_to_win < 1 or initial_server not in {1, 2}
+    """
+    if np.any(np.asarray(sets_to_win) < 1):
+        raise ValueError("sets_to_win must be at least 1")
+    servers = np.broadcast_to(np.asarray(initial_server, dtype=_STATE_DTYPE), (count,)).copy()
+    if np.any((servers != PLAYER_1) & (servers != PLAYER_2)):
+        raise ValueError(f"initial_server must be {PLAYER_1} or {PLAYER_2}")
+
+    return BatchReplayResult(
+        score_player1=np.zeros(count, dtype=_STATE_DTYPE),
+        score_player2=np.zeros(count, dtype=_STATE_DTYPE),
+        sets_player1=np.zeros(count, dtype=_STATE_DTYPE),
+        sets_player2=np.zeros(count, dtype=_STATE_DTYPE),
+        server=servers.copy(),
+        initial_server=servers,
+        winner=np.zeros(count, dtype=np.int8),
+        points_played=np.zeros(count, dtype=np.int32),
+    )
+
+
+def apply_points(
+    state: BatchReplayResult,
+    points: np.ndarray,
+    sets_to_win: Union[int, np.ndarray] = DEFAULT_SETS_TO_WIN,
+    rules: RulesKey = DEFAULT_RULES,
+) -> None:
+    """Apply one point to every match in place.
+
+    Matches that are already won, or whose entry in ``points`` is 0,
+    are left unchanged.
+
+    Args:
+        state: Batch state to advance
+        points: Point winner per match (1, 2, or 0 for "no point")
+        sets_to_win: Sets needed to win, scalar or one value per match
+        rules: Rules tuple (see transition_table.RulesKey)
+    """
+    points_to_win, advantage, serve_interval, deuce_threshold = rules
+    score1 = state.score_player1
+    score2 = state.score_player2
+
+    active = (points != 0) & (state.winner == 0)
+    score1 += active & (points == PLAYER_1)
+    score2 += active & (points == PLAYER_2)
+
+    # Serve change: every point in deuce, otherwise every serve_interval points
+    deuce = (score1 >= deuce_threshold) & (score2 >= deuce_threshold)
+    flip = active & (deuce | ((score1 + score2) % serve_interval == 0))
+    state.server ^= flip * (PLAYER_1 ^ PLAYER_2)
+
+    # Set win
+    won1 = active & (score1 >= points_to_win) & (score1 - score2 >= advantage)
+    won2 = active & ~won1 & (score2 >= points_to_win) & (score2 - score1 >= advantage)
+    state.sets_player1 += won1
+    state.sets_player2 += won2
+
+    # Match win
+    state.winner[won1 & (state.sets_player1 >= sets_to_win)] = PLAYER_1
+    state.winner[won2 & (state.sets_player2 >= sets_to_win)] = PLAYER_2
+
+    # Next set (MatchEngine.reset_set): scores to zero, first server switches
+    reset = (won1 | won2) & (state.winner == 0)
+    score1[reset] = 0
+    score2[reset] = 0
+    state.initial_server ^= reset * (PLAYER_1 ^ PLAYER_2)
+    state.server[reset] = state.initial_server[reset]
+
+    state.points_played += active
+
+
+def _as_points(values) -> np.ndarray:
+    """Convert points to uint8 without wrapping (257 would become PLAYER_1).
+
+    Raises:
+        ValueError: If a value is not 0, PLAYER_1 or PLAYER_2
+    """
+    array = np.asarray(values)
+    if array.dtype != np.uint8 and not np.isin(array, (0, PLAYER_1, PLAYER_2)).all():
+        raise ValueError(f"player must be {PLAYER_1} or {PLAYER_2}")
+    return array.astype(np.uint8, copy=False)
+
+
+def pad_sequences(sequences: PointSequences) -> tuple[np.ndarray, np.ndarray]:
+    """Pack point sequences into an (N, max_len) uint8 matrix padded with 0.
+
+    The real length of every sequence is returned separately, so padding is
+    never mistaken for data. In a pre-padded 2D array a row ends after its
+    last non-zero entry.
+
+    Args:
+        sequences: 2D array, or a sequence of point sequences (lists,
+            tuples, bytes, bytearray or 1D arrays of PLAYER_1/PLAYER_2)
+
+    Returns:
+        Tuple of (padded point matrix, int32 array of sequence lengths)
+
+    Raises:
+        ValueError: If a point is not PLAYER_1 or PLAYER_2 (0 is only
+            allowed as padding after the end of a sequence)
+    """
+    if isinstance(sequences, np.ndarray):
+        matrix = _as_points(sequences)
+        if matrix.ndim != 2:
+            raise ValueError("point matrix must be 2-dimensional")
+        played = matrix != 0
+        lengths = np.where(
+            played.any(axis=1), matrix.shape[1] - np.argmax(played[:, ::-1], axis=1), 0
+        ).astype(np.int32)
+    else:
+        lengths = np.array([len(points) for points in sequences], dtype=np.int32)
+        matrix = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.uint8)
+        for row, points in enumerate(sequences):
+            if isinstance(points, (bytes, bytearray)):
+                points = np.frombuffer(points, dtype=np.uint8)
+            matrix[row, :len(points)] = _as_points(points)
+
+    inside = np.arange(matrix.shape[1]) < lengths[:, np.newaxis]
+    if np.any(matrix > PLAYER_2) or np.any(matrix[inside] == 0):
+        raise ValueError(f"player must be {PLAYER_1} or {PLAYER_2}")
+    return matrix, lengths
+
+
+def replay_matches(
+    sequences: PointSequences,
+    sets_to_win: Union[int, np.ndarray] = DEFAULT_SETS_TO_WIN,
+    initial_server: Union[int, np.ndarray] = PLAYER_1,
+    rules: RulesKey = DEFAULT_RULES,
+) -> BatchReplayResult:
+    """Replay N point sequences at once.
+
+    Equivalent to running ``MatchEngine(sets_to_win=..., initial_server=...)
+    .replay_points(sequence)`` for every sequence: sets are reset after each
+    set win and points after the match win are ignored.
+
+    Args:
+        sequences: Point sequences (see pad_sequences())
+        sets_to_win: Sets needed to win, scalar or one value per match
+        initial_server: First server, scalar or one value per match
+        rules: Rules tuple (see transition_table.RulesKey)
+
+    Returns:
+        BatchReplayResult with the final state of every match
+
+    Raises:
+        ValueError: If a point is not PLAYER_1 or PLAYER_2
+
+    Example:
+        >>> result = replay_matches([[1] * 11, [2] * 33], sets_to_win=3)
+        >>> result.sets_player1.tolist(), result.winner.tolist()
+        ([1, 0], [0, 2])
+    """
+    matrix, lengths = pad_sequences(sequences)
+    state = new_batch_state(len(matrix), sets_to_win, initial_server)
+
+    for column in range(lengths.max(initial=0)):
+        apply_points(state, matrix[:, column], sets_to_win, rules)
+
+    return state
@@ -0,0 +1,300 @@
+"""
+Match Codec
+===========
+
+Compact binary encoding of a MatchEngine.
+
+Layout (little-endian):
+
+    fixed part (9 bytes)
+        B  format version
+        B  sets_to_win
+        H  score player 1
+        H  score player 2
+        B  sets player 1
+        B  sets player 2
+        B  flags: bit 0 = server, bit 1 = initial_server (current set),
+           bit 2 = first server of the match (0 = PLAYER_1, 1 = PLAYER_2),
+           bit 3 = rules part follows, bit 4 = base part follows
+    rules part (6 bytes, only for rules other than STANDARD_RULES)
+        B  points_to_win_set, points_advantage_required,
+           serve_change_interval, deuce_threshold,
+           start_score_player1, start_score_player2
+    base part (7 bytes, only if the history does not start at the rules'
+    start score with sets 0:0, e.g. after MatchEngine.load_state())
+        H  score player 1
+        H  score player 2
+        B  sets player 1
+        B  sets player 2
+        B  flags: bit 0 = server, bit 1 = initial_server
+    history tail
+        varint  number of timeline events
+        bytes   events packed 2 bits each, 4 per byte (first event in the
+                low bits); PLAYER_1 = 1, PLAYER_2 = 2, EVENT_RESET_SET = 0
+
+A live state is 10 bytes (16 with custom rules); a full best-of-5 match with history is around 30.
+decode_state() reads only the fixed part, e.g. for scoreboards and feeds.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+import struct
+
+from .constants import PLAYER_1, PLAYER_2, EVENT_UNDO
+from .match_engine import MatchEngine
+from .models import MatchState
+from .rules import RuleSet, RULE_SETS, STANDARD_RULES
+
+CODEC_VERSION = 1
+
+_FIXED = struct.Struct("<BBHHBBB")
+_RULES = struct.Struct("<BBBBBB")
+_BASE = struct.Struct("<HHBBB")
+
+_SERVER_BIT = 0b001
+_INITIAL_SERVER_BIT = 0b010
+_FIRST_SERVER_BIT = 0b100
+_RULES_BIT = 0b1000
+_BASE_BIT = 0b10000
+
+# Name for decoded rules that match no predefined rule set
+_CUSTOM_RULES_NAME = "Benutzerdefiniert"
+
+# Packed byte -> its 4 events
+_UNPACK = tuple(
+    bytes(((byte >> shift) & 0b11) for shift in (0, 2, 4, 6)) for byte in range(256)
+)
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint.
+
+    Returns:
+        Tuple of (value, offset after the varint)
+
+    Raises:
+        ValueError: If the data ends inside the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _pack_events(events: bytes) -> bytes:
+    """Pack event bytes (values 0-2) into 2 bits each."""
+    padded = events + bytes(-len(events) % 4)
+    return bytes(
+        first | (second << 2) | (third << 4) | (fourth << 6)
+        for first, second, third, fourth in zip(
+            padded[0::4], padded[1::4], padded[2::4], padded[3::4]
+        )
+    )
+
+
+def _server_flags(server: int, initial_server: int, first_server: int) -> int:
+    """Pack the three servers into the flags byte."""
+    return (
+        (_SERVER_BIT if server == PLAYER_2 else 0)
+        | (_INITIAL_SERVER_BIT if initial_server == PLAYER_2 else 0)
+        | (_FIRST_SERVER_BIT if first_server == PLAYER_2 else 0)
+    )
+
+
+def _decode_rules(data: bytes, offset: int) -> RuleSet:
+    """Read the rules part, reusing the name of a matching predefined rule set."""
+    if len(data) < offset + _RULES.size:
+        raise ValueError("encoded rules are truncated")
+    points_to_win, advantage, serve_interval, deuce_threshold, start1, start2 = (
+        _RULES.unpack_from(data, offset)
+    )
+    name = _CUSTOM_RULES_NAME
+    for known in RULE_SETS.values():
+        if known.key == (points_to_win, advantage, serve_interval, deuce_threshold):
+            name = known.name
+            if start1 or start2:
+                name = f"{name} ({start1}:{start2})"
+            break
+    return RuleSet(
+        name=name,
+        points_to_win_set=points_to_win,
+        points_advantage_required=advantage,
+        serve_change_interval=serve_interval,
+        deuce_threshold=deuce_threshold,
+        start_score_player1=start1,
+        start_score_player2=start2,
+    )
+
+
+def encode_engine(engine: MatchEngine, include_history: bool = True) -> bytes:
+    """Encode a MatchEngine.
+
+    Args:
+        engine: Engine to encode
+        include_history: Also encode the timeline (needed for undo and
+            time travel after decoding)
+
+    Returns:
+        Encoded bytes
+    """
+    rules = engine.rules
+    custom_rules = rules.key != STANDARD_RULES.key or rules.start_scores != (0, 0)
+    base = None
+    if include_history:
+        base = engine.timeline.state_after(0)
+        score1, score2, sets1, sets2, server, initial_server = base
+        first_server = server
+        if (score1, score2) == rules.start_scores and not sets1 and not sets2 and server == initial_server:
+            base = None  # The history starts like a new match
+    else:
+        first_server = engine.initial_server
+    flags = _server_flags(engine.server, engine.initial_server, first_server)
+    if custom_rules:
+        flags |= _RULES_BIT
+    if base is not None:
+        flags |= _BASE_BIT
+    out = bytearray(_FIXED.pack(
+        CODEC_VERSION,
+        engine.sets_to_win,
+        engine.score_player1,
+        engine.score_player2,
+        engine.sets_player1,
+        engine.sets_player2,
+        flags,
+    ))
+    if custom_rules:
+        out += _RULES.pack(*rules.key, *rules.start_scores)
+    if base is not None:
+        out += _BASE.pack(score1, score2, sets1, sets2, _server_flags(server, initial_server, PLAYER_1))
+    if include_history:
+        events = engine.timeline.events
+        _write_varint(len(events), out)
+        out += _pack_events(events)
+    else:
+        out.append(0)
+    return bytes(out)
+
+
+def _unpack_fixed(data: bytes) -> tuple:
+    """Read and validate the fixed part."""
+    if len(data) < _FIXED.size:
+        raise ValueError("encoded match is truncated")
+    fields = _FIXED.unpack_from(data)
+    if fields[0] != CODEC_VERSION:
+        raise ValueError(f"unsupported codec version {fields[0]}")
+    return fields
+
+
+def decode_state(data: bytes) -> MatchState:
+    """Read only the live state (fixed part) of an encoded match.
+
+    Raises:
+        ValueError: If the data is not an encoded match
+    """
+    _, _, score1, score2, sets1, sets2, flags = _unpack_fixed(data)
+    return MatchState(
+        score_player1=score1,
+        score_player2=score2,
+        sets_player1=sets1,
+        sets_player2=sets2,
+        server=PLAYER_2 if flags & _SERVER_BIT else PLAYER_1,
+    )
+
+
+def decode_engine(
+    data: bytes,
+    player1_name: str = "Spieler 1",
+    player2_name: str = "Spieler 2",
+    use_transition_table: bool = False,
+) -> MatchEngine:
+    """Decode a MatchEngine.
+
+    With history the engine is rebuilt by replaying it from its base state
+    (full undo and time travel); without history it continues from the
+    stored state. The rule set is restored as well.
+
+    Args:
+        data: Bytes from encode_engine()
+        player1_name: Name of player 1 (names are not encoded)
+        player2_name: Name of player 2
+        use_transition_table: Passed to MatchEngine
+
+    Returns:
+        Decoded MatchEngine
+
+    Raises:
+        ValueError: If the data is truncated or inconsistent
+    """
+    _, sets_to_win, score1, score2, sets1, sets2, flags = _unpack_fixed(data)
+    offset = _FIXED.size
+    rules = STANDARD_RULES
+    if flags & _RULES_BIT:
+        rules = _decode_rules(data, offset)
+        offset += _RULES.size
+    base = None
+    if flags & _BASE_BIT:
+        if len(data) < offset + _BASE.size:
+            raise ValueError("encoded base state is truncated")
+        base = _BASE.unpack_from(data, offset)
+        offset += _BASE.size
+    count, offset = _read_varint(data, offset)
+    packed = data[offset:offset + (count + 3) // 4]
+    if len(packed) * 4 < count:
+        raise ValueError("encoded history is truncated")
+
+    state = MatchState(
+        score_player1=score1,
+        score_player2=score2,
+        sets_player1=sets1,
+        sets_player2=sets2,
+        server=PLAYER_2 if flags & _SERVER_BIT else PLAYER_1,
+    )
+    initial_server = PLAYER_2 if flags & _INITIAL_SERVER_BIT else PLAYER_1
+    engine = MatchEngine(
+        player1_name=player1_name,
+        player2_name=player2_name,
+        sets_to_win=sets_to_win,
+        initial_server=PLAYER_2 if flags & _FIRST_SERVER_BIT else PLAYER_1,
+        use_transition_table=use_transition_table,
+        rules=rules,
+    )
+
+    if not count:
+        engine.load_state(state, initial_server)
+        return engine
+    if base is not None:
+        base_score1, base_score2, base_sets1, base_sets2, base_flags = base
+        engine.load_state(
+            MatchState(
+                score_player1=base_score1,
+                score_player2=base_score2,
+                sets_player1=base_sets1,
+                sets_player2=base_sets2,
+                server=PLAYER_2 if base_flags & _SERVER_BIT else PLAYER_1,
+            ),
+            PLAYER_2 if base_flags & _INITIAL_SERVER_BIT else PLAYER_1,
+        )
+
+    events = b"".join(_UNPACK[byte] for byte in packed)[:count]
+    if EVENT_UNDO in events:
+        raise ValueError("invalid history event")  # Timelines log no undos
+    engine.replay_events(events)
+
+    if engine.get_current_state() != state or engine.initial_server != initial_server:
+        raise ValueError("encoded history does not match the encoded state")
+    return engine
@@ -47,6 +47,27 @@ DEUCE_THRESHOLD: Final[int] = 10        # When both players >= 10, serve changes
 PLAYER_1: Final[int] = 1
 PLAYER_2: Final[int] = 2
 
+# Match history (compact point log)
+EVENT_RESET_SET: Final[int] = 0              # Log entry for reset_set(); points are logged as PLAYER_1/PLAYER_2
+HISTORY_CHECKPOINT_INTERVAL: Final[int] = 32  # Full state checkpoint every N logged events
+
+# Point journal (crash recovery)
+EVENT_UNDO: Final[int] = 3                 # Journal entry for undo_last_point()
+JOURNAL_SYNC_INTERVAL: Final[float] = 0.05  # Seconds to collect writes before one fsync
+
+# Multi-table registry
+REGISTRY_MEMORY_BUDGET: Final[int] = 16 * 1024 * 1024  # Bytes for live matches before finished ones are archived
+
+# Match statistics
+COMEBACK_MIN_DEFICIT: Final[int] = 5  # A set won after trailing by N points counts as a comeback
+
+# Point input
+INPUT_DEBOUNCE_INTERVAL: Final[float] = 0.15  # Seconds in which a repeated input for the same side is dropped
+INPUT_LATENCY_SAMPLES: Final[int] = 256       # Input-to-paint latencies kept for statistics
+
+# Performance HUD (APP_DEBUG)
+PERF_WINDOW: Final[int] = 120  # Samples kept per metric (about 2 s of frames at 60 Hz)
+
 # Default values
 DEFAULT_SETS_TO_WIN: Final[int] = 3  # Best of 5
 DEFAULT_TOURNAMENT_NAME: Final[str] = "Neues Turnier"
@@ -0,0 +1,185 @@
+"""
+Point Input Queue
+=================
+
+Press-time capture of point inputs (touch, USB keyboard, foot pedal).
+
+Every input is stamped with a monotonic clock the moment it is pressed and
+appended to a FIFO queue; the UI drains the queue on its next event-loop
+pass and applies the inputs to the engine in order. Bounces and accidental
+double taps are dropped per side: a repeated input for the same side within
+INPUT_DEBOUNCE_INTERVAL seconds is ignored, inputs for the other side are
+not affected.
+
+LatencyRecorder keeps the time from press to the repaint that showed the
+result, so input latency can be monitored on the real hardware.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .constants import INPUT_DEBOUNCE_INTERVAL, INPUT_LATENCY_SAMPLES
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True, slots=True)
+class PointInput:
+    """One captured input.
+
+    Attributes:
+        event: PLAYER_1 / PLAYER_2 for a point, EVENT_UNDO for an undo
+        pressed_at: Clock time of the press in seconds
+    """
+    event: int
+    pressed_at: float
+
+
+class PointInputQueue:
+    """FIFO queue of point inputs with per-side debouncing.
+
+    Example:
+        >>> queue = PointInputQueue()
+        >>> queue.push(PLAYER_1)
+        True
+        >>> queue.push(PLAYER_1)  # bounce
+        False
+        >>> [item.event for item in queue.drain()]
+        [1]
+    """
+
+    __slots__ = ('debounce', 'dropped', '_clock', '_items', '_last_press')
+
+    def __init__(
+        self,
+        debounce: float = INPUT_DEBOUNCE_INTERVAL,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            debounce: Seconds in which a repeated input for the same side
+                is dropped (0 disables debouncing)
+            clock: Monotonic clock in seconds
+        """
+        self.debounce = debounce
+        self.dropped = 0
+        self._clock = clock
+        self._items: deque[PointInput] = deque()
+        self._last_press: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def push(self, event: int, pressed_at: Optional[float] = None) -> bool:
+        """Capture an input.
+
+        Args:
+            event: PLAYER_1, PLAYER_2 or EVENT_UNDO
+            pressed_at: Press time (default: now)
+
+        Returns:
+            True if queued, False if dropped by the debounce
+        """
+        if pressed_at is None:
+            pressed_at = self._clock()
+        last = self._last_press.get(event)
+        if last is not None and pressed_at - last < self.debounce:
+            self.dropped += 1
+            return False
+        self._last_press[event] = pressed_at
+        self._items.append(PointInput(event, pressed_at))
+        return True
+
+    def pop(self) -> Optional[PointInput]:
+        """Take the oldest input (None if the queue is empty)."""
+        return self._items.popleft() if self._items else None
+
+    def drain(self) -> list[PointInput]:
+        """Take all queued inputs, oldest first."""
+        items = list(self._items)
+        self._items.clear()
+        return items
+
+    def clear(self) -> None:
+        """Drop all queued inputs."""
+        self.dropped += len(self._items)
+        self._items.clear()
+
+
+class LatencyRecorder:
+    """Input-to-paint latencies of the most recent inputs.
+
+    mark_applied() is called when an input reached the engine and
+    record_paint() when the result was painted; every input applied since
+    the last paint gets one latency sample.
+
+    Example:
+        >>> latency = LatencyRecorder()
+        >>> latency.mark_applied(item.pressed_at)
+        >>> latency.record_paint()
+        >>> latency.percentile(95) * 1000  # ms
+    """
+
+    __slots__ = ('samples', 'count', '_clock', '_pending')
+
+    def __init__(
+        self,
+        size: int = INPUT_LATENCY_SAMPLES,
+        clock: Clock = time.perf_counter,
+    ) -> None:
+        """Create an empty recorder.
+
+        Args:
+            size: Number of latencies kept (oldest are dropped)
+            clock: The clock used for PointInput.pressed_at
+        """
+        self.samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+        self._clock = clock
+        self._pending: list[float] = []
+
+    def mark_applied(self, pressed_at: float) -> None:
+        """An input pressed at ``pressed_at`` was applied; wait for its paint."""
+        self._pending.append(pressed_at)
+
+    def record_paint(self, painted_at: Optional[float] = None) -> None:
+        """The display was painted: record the latency of all applied inputs.
+
+        Args:
+            painted_at: Paint time (default: now)
+        """
+        if not self._pending:
+            return
+        if painted_at is None:
+            painted_at = self._clock()
+        for pressed_at in self._pending:
+            self.samples.append(painted_at - pressed_at)
+        self.count += len(self._pending)
+        self._pending.clear()
+
+    @property
+    def last(self) -> Optional[float]:
+        """Most recent latency in seconds."""
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Latency percentile of the kept samples in seconds (nearest rank).
+
+        Args:
+            percent: Percentile between 0 and 100
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def mean(self) -> Optional[float]:
+        """Mean latency of the kept samples in seconds."""
+        return sum(self.samples) / len(self.samples) if self.samples else None
@@ -0,0 +1,338 @@
+"""
+Point Journal
+=============
+
+Crash-safe, append-only journal of the running match.
+
+The file starts with a small header (match setup) followed by one byte per
+event: PLAYER_1 / PLAYER_2 for a point, EVENT_RESET_SET for the start of a
+new set and EVENT_UNDO for an undo. A tap costs a single os.write() of one
+byte; a background thread collects writes for JOURNAL_SYNC_INTERVAL seconds
+and makes them durable with one fsync (group commit, the header included),
+so the UI thread never waits for the disk. Discarding a finished match
+only signals that thread and unlinks the file.
+
+After a crash, read_journal() returns the header and events, and
+JournalContents.to_engine() rebuilds the MatchEngine in milliseconds.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+import os
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from .constants import (
+    PLAYER_1,
+    PLAYER_2,
+    DEFAULT_SETS_TO_WIN,
+    EVENT_RESET_SET,
+    EVENT_UNDO,
+    JOURNAL_SYNC_INTERVAL,
+)
+from .match_engine import MatchEngine
+
+_MAGIC = b"TTRJ"
+_VERSION = 2
+
+# magic, version, sets_to_win, initial_server, player1_id, player2_id,
+# turnier_id (-1 = None), name lengths (players, then tournament); the names
+# follow. Version 1 had no tournament name and is still read.
+_HEADER = struct.Struct("<4sBBBiiiHHH")
+_HEADER_V1 = struct.Struct("<4sBBBiiiHH")
+
+_NO_ID = -1
+
+# Pre-built one-byte writes, indexed by event
+_EVENT_BYTES = tuple(bytes((event,)) for event in range(EVENT_UNDO + 1))
+
+# fdatasync skips metadata updates where available (not on Windows/macOS)
+_sync_file = getattr(os, "fdatasync", os.fsync)
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class JournalHeader:
+    """Match setup stored at the start of the journal.
+
+    Attributes:
+        player1_name: Name of player 1
+        player2_name: Name of player 2
+        sets_to_win: Number of sets needed to win the match
+        initial_server: Who served first in the match
+        player1_id: Database ID of player 1 (None if unknown)
+        player2_id: Database ID of player 2 (None if unknown)
+        turnier_id: Tournament ID (None for a free match)
+        turnier_name: Tournament name (None for a free match)
+    """
+    player1_name: str
+    player2_name: str
+    sets_to_win: int = DEFAULT_SETS_TO_WIN
+    initial_server: int = PLAYER_1
+    player1_id: Optional[int] = None
+    player2_id: Optional[int] = None
+    turnier_id: Optional[int] = None
+    turnier_name: Optional[str] = None
+
+    def pack(self) -> bytes:
+        """Serialize the header."""
+        name1 = self.player1_name.encode("utf-8")
+        name2 = self.player2_name.encode("utf-8")
+        turnier_name = (self.turnier_name or "").encode("utf-8")
+        return _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            self.sets_to_win,
+            self.initial_server,
+            _NO_ID if self.player1_id is None else self.player1_id,
+            _NO_ID if self.player2_id is None else self.player2_id,
+            _NO_ID if self.turnier_id is None else self.turnier_id,
+            len(name1),
+            len(name2),
+            len(turnier_name),
+        ) + name1 + name2 + turnier_name
+
+    @classmethod
+    def unpack(cls, data: bytes) -> tuple["JournalHeader", int]:
+        """Parse a header from the start of ``data``.
+
+        Returns:
+            Tuple of (header, number of header bytes)
+
+        Raises:
+            ValueError: If the data is not a complete journal header
+        """
+        if len(data) < _HEADER_V1.size:
+            raise ValueError("journal header is truncated")
+        magic, version = data[:4], data[4]
+        if magic != _MAGIC or version not in (1, _VERSION):
+            raise ValueError("not a point journal")
+        layout = _HEADER if version == _VERSION else _HEADER_V1
+        if len(data) < layout.size:
+            raise ValueError("journal header is truncated")
+        (
+            _, _, sets_to_win, initial_server,
+            player1_id, player2_id, turnier_id, length1, length2, *rest,
+        ) = layout.unpack_from(data)
+        start = layout.size
+        end = start + length1 + length2 + (rest[0] if rest else 0)
+        if len(data) < end:
+            raise ValueError("journal header is truncated")
+
+        turnier_name = data[start + length1 + length2:end].decode("utf-8")
+        header = cls(
+            player1_name=data[start:start + length1].decode("utf-8"),
+            player2_name=data[start + length1:start + length1 + length2].decode("utf-8"),
+            sets_to_win=sets_to_win,
+            initial_server=initial_server,
+            player1_id=None if player1_id == _NO_ID else player1_id,
+            player2_id=None if player2_id == _NO_ID else player2_id,
+            turnier_id=None if turnier_id == _NO_ID else turnier_id,
+            turnier_name=turnier_name or None,
+        )
+        return header, end
+
+
+@dataclass(frozen=True)
+class JournalContents:
+    """A journal read back from disk.
+
+    Attributes:
+        header: Match setup
+        events: Event bytes (points, EVENT_RESET_SET, EVENT_UNDO)
+        header_size: Bytes of the header on disk (older versions are shorter)
+    """
+    header: JournalHeader
+    events: bytes
+    header_size: int
+
+    def to_engine(self, track_statistics: bool = False) -> MatchEngine:
+        """Replay the events into a new MatchEngine.
+
+        Args:
+            track_statistics: Rebuild the live statistics as well
+                (MatchEngine.track_statistics)
+        """
+        header = self.header
+        engine = MatchEngine(
+            player1_name=header.player1_name,
+            player2_name=header.player2_name,
+            sets_to_win=header.sets_to_win,
+            initial_server=header.initial_server,
+            track_statistics=track_statistics,
+        )
+        engine.replay_events(self.events)
+        return engine
+
+
+def read_journal(path: PathLike) -> Optional[JournalContents]:
+    """Read a journal left behind by a previous run.
+
+    Events after the first unknown byte (e.g. a torn write) are ignored.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        JournalContents, or None if there is no valid journal
+    """
+    try:
+        data = Path(path).read_bytes()
+        header, offset = JournalHeader.unpack(data)
+    except (OSError, ValueError):
+        return None
+
+    events = data[offset:]
+    valid = (PLAYER_1, PLAYER_2, EVENT_RESET_SET, EVENT_UNDO)
+    for index, event in enumerate(events):
+        if event not in valid:
+            events = events[:index]
+            break
+    return JournalContents(header=header, events=events, header_size=offset)
+
+
+class PointJournal:
+    """Append-only journal of the running match with group-commit fsync.
+
+    Example:
+        >>> journal = PointJournal(path, JournalHeader("Alice", "Bob"))
+        >>> journal.append(PLAYER_1)
+        >>> journal.discard()  # match saved or cancelled
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        header: JournalHeader,
+        sync_interval: float = JOURNAL_SYNC_INTERVAL,
+    ) -> None:
+        """Create (or replace) the journal and write the header.
+
+        The header becomes durable with the sync thread's first commit.
+
+        Args:
+            path: Journal file (parent directories are created)
+            header: Match setup
+            sync_interval: Seconds to collect writes before one fsync
+
+        Raises:
+            OSError: If the file cannot be created
+        """
+        self._open(path, sync_interval, length=0)
+        os.write(self._fd, header.pack())
+        self._dirty.set()
+
+    @classmethod
+    def resume(
+        cls,
+        path: PathLike,
+        contents: JournalContents,
+        sync_interval: float = JOURNAL_SYNC_INTERVAL,
+    ) -> "PointJournal":
+        """Continue appending to a recovered journal.
+
+        The file is only cut back to its valid part (dropping a torn tail),
+        never rewritten, so a crash during recovery loses nothing.
+
+        Args:
+            path: Journal file read with read_journal()
+            contents: The recovered contents
+            sync_interval: Seconds to collect writes before one fsync
+        """
+        journal = cls.__new__(cls)
+        journal._open(path, sync_interval, length=contents.header_size + len(contents.events))
+        return journal
+
+    def _open(self, path: PathLike, sync_interval: float, length: int) -> None:
+        """Open the file for appending, cut it to ``length`` bytes, start syncing."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._sync_interval = sync_interval
+
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.ftruncate(self._fd, length)
+
+        # The sync thread owns the descriptor once _stop is set: it does the
+        # final fsync (unless discarded) and closes it
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._discarded = False
+        self._sync_thread = threading.Thread(
+            target=self._sync_loop, name="PointJournalSync", daemon=True
+        )
+        self._sync_thread.start()
+
+    def append(self, event: int) -> None:
+        """Append one event (point winner, EVENT_RESET_SET or EVENT_UNDO).
+
+        Only a single non-blocking os.write(); durability follows within
+        sync_interval seconds.
+
+        Raises:
+            ValueError: If the journal was closed or discarded
+        """
+        if self._stop.is_set():
+            raise ValueError("append to a closed journal")
+        os.write(self._fd, _EVENT_BYTES[event])
+        self._dirty.set()
+
+    def flush(self) -> None:
+        """Make all appended events durable now.
+
+        Raises:
+            ValueError: If the journal was closed or discarded
+        """
+        if self._stop.is_set():
+            raise ValueError("flush of a closed journal")
+        os.fsync(self._fd)
+
+    def close(self) -> None:
+        """Make everything durable and close the file (keeps it on disk).
+
+        Waits for the sync thread's final fsync (used at shutdown).
+        """
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._dirty.set()
+        self._sync_thread.join()
+
+    def discard(self) -> None:
+        """Delete the journal (match finished or cancelled) without waiting.
+
+        Nothing is synced any more; the sync thread closes the file.
+        """
+        if self._stop.is_set():
+            return
+        self._discarded = True
+        self._stop.set()
+        self._dirty.set()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _sync_loop(self) -> None:
+        """Background group commit: one fsync per burst of appends."""
+        while True:
+            self._dirty.wait()
+            # Let further taps of the same rally join this commit (close()
+            # and discard() cut the wait short)
+            if self._stop.wait(self._sync_interval):
+                break
+            self._dirty.clear()
+            self._sync()
+        if not self._discarded:
+            self._sync()
+        os.close(self._fd)
+
+    def _sync(self) -> None:
+        try:
+            _sync_file(self._fd)
+        except OSError as e:
+            print(f"⚠️ Journal fsync failed: {e}", file=sys.stderr)
@@ -10,20 +10,46 @@ The MatchEngine handles:
 - Set tracking
 - Serve rotation according to official rules
 - Win conditions
-- Undo functionality
+- Rule variants (RuleSet: 11 points, legacy 21 points, handicap starts)
+- Undo and time travel (event-sourced MatchTimeline with snapshots)
+- Optional live statistics (MatchStatistics, rolled back on undo)
+- Coalesced change notifications for views (subscribe())
 """
 
-from typing import Optional
-from .models import Player, SetResult, MatchState
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+from .models import Player, SetResult, MatchState, MatchChange
 from .constants import (
-    POINTS_TO_WIN_SET,
-    POINTS_ADVANTAGE_REQUIRED,
-    SERVE_CHANGE_INTERVAL,
-    DEUCE_THRESHOLD,
     PLAYER_1,
     PLAYER_2,
     DEFAULT_SETS_TO_WIN,
+    EVENT_RESET_SET,
+    EVENT_UNDO,
 )
+from .rules import RuleSet, STANDARD_RULES
+from .statistics import MatchStatistics
+from .timeline import MatchTimeline, Snapshot
+
+# Shared add_point() results, indexed by the winning player. SetResult is
+# immutable, so handing out the same instances saves an allocation per point.
+_NO_RESULT = SetResult()
+_SET_WON = (
+    None,
+    SetResult(set_won=True, winner=PLAYER_1),
+    SetResult(set_won=True, winner=PLAYER_2),
+)
+_MATCH_WON = (
+    None,
+    SetResult(set_won=True, match_won=True, winner=PLAYER_1),
+    SetResult(set_won=True, match_won=True, winner=PLAYER_2),
+)
+
+# MatchState field names, in Snapshot order
+_STATE_FIELDS = ('score_player1', 'score_player2', 'sets_player1', 'sets_player2', 'server')
+
+# Observer callback and scheduler types (see MatchEngine.subscribe())
+ChangeCallback = Callable[[MatchChange], None]
+Scheduler = Callable[[Callable[[], None]], None]
 
 
 class MatchEngine:
@@ -39,12 +65,43 @@ class MatchEngine:
         ...     print(f"Set won by player {result.winner}!")
     """
     
+    __slots__ = (
+        'player1_name',
+        'player2_name',
+        'sets_to_win',
+        'score_player1',
+        'score_player2',
+        'sets_player1',
+        'sets_player2',
+        'server',
+        'initial_server',
+        'rules',
+        'timeline',
+        'statistics',
+        '_observers',
+        '_scheduler',
+        '_pending_change',
+        '_pending_events',
+        '_flush_scheduled',
+        '_change_depth',
+        '_transitions',
+        '_points_to_win',
+        '_advantage',
+        '_serve_interval',
+        '_deuce_threshold',
+        '_start_points',
+        '__weakref__',  # Bound methods are handed to UI schedulers
+    )
+    
     def __init__(
         self,
         player1_name: str = "Spieler 1",
         player2_name: str = "Spieler 2",
         sets_to_win: int = DEFAULT_SETS_TO_WIN,
         initial_server: int = PLAYER_1,
+        use_transition_table: bool = False,
+        rules: RuleSet = STANDARD_RULES,
+        track_statistics: bool = False,
     ) -> None:
         """Initialize a new match.
         
@@ -53,6 +110,11 @@ class MatchEngine:
             player2_name: Name of player 2
             sets_to_win: Number of sets needed to win the match
             initial_server: Who serves first (PLAYER_1 or PLAYER_2)
+            use_transition_table: Resolve points via the precomputed
+                transition table (faster for replays and bulk imports)
+            rules: Scoring rules (default: 11-point sets)
+            track_statistics: Maintain live statistics in ``statistics``
+                (otherwise it is None)
         
         Raises:
             ValueError: If sets_to_win < 1 or initial_server not in {1, 2}
@@ -65,10 +127,18 @@ class MatchEngine:
         self.player1_name = player1_name
         self.player2_name = player2_name
         self.sets_to_win = sets_to_win
+        self.rules = rules
         
-        # Current set scores
-        self.score_player1 = 0
-        self.score_player2 = 0
+        # Rule values as plain ints, so the scalar path costs the same for
+        # every rule set
+        self._points_to_win = rules.points_to_win_set
+        self._advantage = rules.points_advantage_required
+        self._serve_interval = rules.serve_change_interval
+        self._deuce_threshold = rules.deuce_threshold
+        self._start_points = rules.start_points
+        
+        # Current set scores (handicap rules start above 0)
+        self.score_player1, self.score_player2 = rules.start_scores
         
         # Sets won
         self.sets_player1 = 0
@@ -78,88 +148,245 @@ class MatchEngine:
         self.server = initial_server
         self.initial_server = initial_server
         
-        # History for undo (stack of MatchState)
-        self._history: list[MatchState] = []
+        # Optional table-driven scoring (shared per rule set)
+        self._transitions = rules.compile() if use_transition_table else None
+        
+        # Event log of points and set resets (undo, time travel, replays)
+        self.timeline = MatchTimeline(self._snapshot(), rules)
+        self.statistics = MatchStatistics(rules) if track_statistics else None
+        
+        # Change notifications (see subscribe())
+        self._observers: tuple[ChangeCallback, ...] = ()
+        self._scheduler: Optional[Scheduler] = None
+        self._pending_change: Optional[Snapshot] = None
+        self._pending_events = 0
+        self._flush_scheduled = False
+        self._change_depth = 0
     
     def add_point(self, player: int) -> SetResult:
         """Add a point for the specified player.
         
         This method:
-        1. Saves current state to history (for undo)
-        2. Increments the score
-        3. Checks for serve change
-        4. Checks for set/match win
+        1. Increments the score
+        2. Checks for serve change
+        3. Checks for set/match win
+        4. Appends the point to the history (for undo)
         
         Args:
             player: PLAYER_1 or PLAYER_2
         
         Returns:
-            SetResult indicating if a set or match was won
+            SetResult indicating if a set or match was won (a shared,
+            immutable instance)
         
         Raises:
             ValueError: If player is not PLAYER_1 or PLAYER_2
         """
-        if player not in {PLAYER_1, PLAYER_2}:
+        if player != PLAYER_1 and player != PLAYER_2:
             raise ValueError(f"player must be {PLAYER_1} or {PLAYER_2}")
         
-        # Save state for undo
-        self._save_state()
+        observed = self._observers
+        if observed:
+            self._begin_change()
+        
+        server = self.server
+        result = self._apply_point(player)
+        if self.timeline.append_point(player):
+            self.timeline.save_snapshot(self._snapshot())
+        
+        if self.statistics is not None:
+            self.statistics.record_point(
+                player, server, self.score_player1, self.score_player2, result.winner
+            )
+        if observed:
+            self._end_change()
+        return result
+    
+    def replay_points(self, points: Iterable[int]) -> int:
+        """Apply a sequence of points the way the scoreboard does.
         
-        # Add point
-        if player == PLAYER_1:
-            self.score_player1 += 1
-        else:
-            self.score_player2 += 1
+        After each set win the next set is started with reset_set(), and
+        the replay stops at the match win. This is the bulk path for
+        replays, simulations and imports: in table mode each point is a
+        single lookup on local variables.
         
-        # Check serve change
-        self._update_server()
+        Args:
+            points: Iterable of PLAYER_1 / PLAYER_2 point winners
+        
+        Returns:
+            Number of points consumed from ``points``
         
-        # Check for set win
-        set_winner = self._check_set_win()
-        match_winner = None
+        Raises:
+            ValueError: If a point is not PLAYER_1 or PLAYER_2
+        """
+        with self.batch_changes():
+            return self._replay_points(points)
+    
+    def replay_events(self, events: Iterable[int]) -> None:
+        """Apply a logged event sequence (timeline, journal or archive).
         
-        if set_winner is not None:
-            # Set won!
-            if set_winner == PLAYER_1:
-                self.sets_player1 += 1
+        Unlike replay_points(), nothing is inferred: every set reset and
+        undo must be in the log. Observers get one notification.
+        
+        Args:
+            events: PLAYER_1 / PLAYER_2 points, EVENT_RESET_SET and
+                EVENT_UNDO entries
+        
+        Raises:
+            ValueError: If an event is unknown
+        """
+        with self.batch_changes():
+            for event in events:
+                if event == PLAYER_1 or event == PLAYER_2:
+                    self.add_point(event)
+                elif event == EVENT_RESET_SET:
+                    self.reset_set()
+                elif event == EVENT_UNDO:
+                    self.undo_last_point()
+                else:
+                    raise ValueError(f"invalid event {event}")
+    
+    def _replay_points(self, points: Iterable[int]) -> int:
+        """Body of replay_points() (notifications are handled by the caller)."""
+        table = self._transitions
+        timeline = self.timeline
+        statistics = self.statistics
+        consumed = 0
+        
+        for player in points:
+            if player != PLAYER_1 and player != PLAYER_2:
+                raise ValueError(f"player must be {PLAYER_1} or {PLAYER_2}")
+            consumed += 1
+            
+            server = self.server
+            score1 = self.score_player1
+            score2 = self.score_player2
+            if table is not None and score1 < table.size and score2 < table.size:
+                size = table.size
+                score1, score2, self.server, set_winner = table.entries[
+                    (((score1 * size + score2) << 2) | ((self.server - 1) << 1)) | (player - 1)
+                ]
+                self.score_player1 = score1
+                self.score_player2 = score2
+                result = self._win_set(set_winner) if set_winner else _NO_RESULT
             else:
-                self.sets_player2 += 1
+                result = self._apply_point(player)
+            
+            if timeline.append_point(player):
+                timeline.save_snapshot(self._snapshot())
+            if statistics is not None:
+                statistics.record_point(
+                    player, server, self.score_player1, self.score_player2, result.winner
+                )
             
-            # Check for match win
-            match_winner = self._check_match_win()
+            if result.match_won:
+                break
+            if result.set_won:
+                self.reset_set()
         
-        return SetResult(
-            set_won=(set_winner is not None),
-            match_won=(match_winner is not None),
-            winner=set_winner if set_winner is not None else match_winner,
-        )
+        return consumed
     
     def undo_last_point(self) -> bool:
         """Undo the last point.
         
+        Set resets logged after that point are undone with it, so undoing
+        the winning point of a set also restores the set's server.
+        
         Returns:
             True if undo was successful, False if no history available
         """
-        if not self._history:
+        position = self.timeline.last_point_position()
+        if position is None:
             return False
         
-        state = self._history.pop()
-        self.score_player1 = state.score_player1
-        self.score_player2 = state.score_player2
-        self.sets_player1 = state.sets_player1
-        self.sets_player2 = state.sets_player2
-        self.server = state.server
-        
+        self._restore(position)
         return True
     
+    def rewind_to_point(self, points: int) -> None:
+        """Go back to the state after the first ``points`` points.
+        
+        All later events are dropped, as if undo_last_point() had been
+        called repeatedly. To look at an earlier state without dropping
+        anything, use timeline.state_at_point() instead.
+        
+        Args:
+            points: Number of points to keep (0 .. timeline.point_count)
+        
+        Raises:
+            IndexError: If points is outside the timeline
+        """
+        self._restore(self.timeline.point_position(points))
+    
     def reset_set(self) -> None:
         """Reset the current set (after a set win).
         
         This is called after showing the set won dialog.
         The serve switches to the other player.
         """
-        self.score_player1 = 0
-        self.score_player2 = 0
+        with self.batch_changes():
+            self._apply_reset()
+            if self.timeline.append_reset(self.sets_player1, self.sets_player2):
+                self.timeline.save_snapshot(self._snapshot())
+            if self.statistics is not None:
+                self.statistics.record_reset()
+    
+    def _apply_point(self, player: int) -> SetResult:
+        """Apply a point without touching the history.
+        
+        Returns:
+            Shared SetResult for the point
+        """
+        entry = None
+        table = self._transitions
+        if table is not None:
+            score1 = self.score_player1
+            score2 = self.score_player2
+            size = table.size
+            if score1 < size and score2 < size:
+                entry = table.entries[
+                    (((score1 * size + score2) << 2) | ((self.server - 1) << 1)) | (player - 1)
+                ]
+            else:
+                entry = table.step(score1, score2, self.server, player)
+        
+        if entry is not None:
+            # Table-driven: score, serve change and set win in one lookup
+            self.score_player1, self.score_player2, self.server, set_winner = entry
+        else:
+            if player == PLAYER_1:
+                self.score_player1 += 1
+            else:
+                self.score_player2 += 1
+            
+            # Check serve change
+            self._update_server()
+            
+            # Check for set win
+            set_winner = self._check_set_win()
+        
+        if not set_winner:
+            return _NO_RESULT
+        return self._win_set(set_winner)
+    
+    def _win_set(self, set_winner: int) -> SetResult:
+        """Count a won set and check for the match win.
+        
+        Returns:
+            Shared SetResult for the set (or match) win
+        """
+        if set_winner == PLAYER_1:
+            self.sets_player1 += 1
+            if self.sets_player1 >= self.sets_to_win:
+                return _MATCH_WON[PLAYER_1]
+        else:
+            self.sets_player2 += 1
+            if self.sets_player2 >= self.sets_to_win:
+                return _MATCH_WON[PLAYER_2]
+        return _SET_WON[set_winner]
+    
+    def _apply_reset(self) -> None:
+        """Start the next set without touching the history."""
+        self.score_player1, self.score_player2 = self.rules.start_scores
         
         # Switch initial server for next set
         self.initial_server = PLAYER_2 if self.initial_server == PLAYER_1 else PLAYER_1
@@ -179,45 +406,190 @@ class MatchEngine:
             server=self.server,
         )
     
-    def _save_state(self) -> None:
-        """Save current state to history."""
-        self._history.append(self.get_current_state())
+    def load_state(self, state: MatchState, initial_server: int) -> None:
+        """Continue from a persisted state that comes without history.
+        
+        The timeline (and statistics, if tracked) restart at this state, so
+        undo stops here.
+        
+        Args:
+            state: Scores, sets and server to continue from
+            initial_server: Server at the start of the current set
+        """
+        with self.batch_changes():
+            self.score_player1 = state.score_player1
+            self.score_player2 = state.score_player2
+            self.sets_player1 = state.sets_player1
+            self.sets_player2 = state.sets_player2
+            self.server = state.server
+            self.initial_server = initial_server
+            self.timeline = MatchTimeline(self._snapshot(), self.rules)
+            if self.statistics is not None:
+                self.statistics = MatchStatistics(self.rules)
+    
+    def subscribe(self, callback: ChangeCallback) -> Callable[[], None]:
+        """Register a view for coalesced change notifications.
+        
+        Every operation that changes the engine (points, undo, set resets,
+        replays) is collected; observers then receive one MatchChange with
+        the fields that differ since the previous notification. Without a
+        scheduler the notification is sent when the operation returns; with
+        set_scheduler() it is deferred, e.g. to the next UI frame, so a
+        burst of operations arrives as one notification.
+        
+        Args:
+            callback: Called with a MatchChange
+        
+        Returns:
+            Function that removes the subscription
+        """
+        self._observers += (callback,)
+        
+        def unsubscribe() -> None:
+            self._observers = tuple(
+                observer for observer in self._observers if observer is not callback
+            )
+        
+        return unsubscribe
+    
+    def set_scheduler(self, scheduler: Optional[Scheduler]) -> None:
+        """Defer notifications through ``scheduler``.
+        
+        Args:
+            scheduler: Called with flush_changes() once per batch of
+                changes (e.g. ``lambda flush: QTimer.singleShot(0, flush)``),
+                or None to notify synchronously
+        """
+        self._scheduler = scheduler
+    
+    @contextmanager
+    def batch_changes(self) -> Iterator[None]:
+        """Coalesce all changes inside the block into one notification."""
+        if not self._observers:
+            yield
+            return
+        self._begin_change()
+        try:
+            yield
+        finally:
+            self._end_change()
+    
+    def flush_changes(self) -> Optional[MatchChange]:
+        """Send the pending notification now.
+        
+        Returns:
+            The MatchChange sent, or None if nothing changed
+        """
+        self._flush_scheduled = False
+        before = self._pending_change
+        if before is None or self._change_depth:
+            return None
+        self._pending_change = None
+        events = self._pending_events
+        self._pending_events = 0
+        
+        after = self._snapshot()
+        changed = frozenset(
+            name for name, old, new in zip(_STATE_FIELDS, before, after) if old != new
+        )
+        if not changed:
+            return None
+        
+        change = MatchChange(
+            before=MatchState(*before[:5]),
+            after=MatchState(*after[:5]),
+            changed=changed,
+            events=events,
+            set_winner=self._check_set_win(),
+            match_winner=self._check_match_win(),
+        )
+        for observer in self._observers:
+            observer(change)
+        return change
+    
+    def _begin_change(self) -> None:
+        """Remember the state before the first of a batch of changes."""
+        if self._pending_change is None:
+            self._pending_change = self._snapshot()
+        if not self._change_depth:
+            self._pending_events += 1
+        self._change_depth += 1
+    
+    def _end_change(self) -> None:
+        """Notify (or schedule the notification) once the outermost change ends."""
+        self._change_depth -= 1
+        if self._change_depth:
+            return
+        if self._scheduler is None:
+            self.flush_changes()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._scheduler(self.flush_changes)
+    
+    def _snapshot(self) -> Snapshot:
+        """Full current state for the timeline."""
+        return (
+            self.score_player1,
+            self.score_player2,
+            self.sets_player1,
+            self.sets_player2,
+            self.server,
+            self.initial_server,
+        )
+    
+    def _restore(self, length: int) -> None:
+        """Truncate the timeline to ``length`` events and load that state."""
+        with self.batch_changes():
+            if self.statistics is not None:
+                self.statistics.rollback(len(self.timeline) - length)
+            self.timeline.truncate(length)
+            (
+                self.score_player1,
+                self.score_player2,
+                self.sets_player1,
+                self.sets_player2,
+                self.server,
+                self.initial_server,
+            ) = self.timeline.state_after(length)
     
     def _update_server(self) -> None:
         """Update the server based on official table tennis rules.
         
-        Rules:
+        Rules (values for the standard rule set):
         - During normal play (< 10:10): serve changes every 2 points
         - During deuce (>= 10:10): serve changes every point
+        
+        Handicap start points are not rallies and do not count.
         """
-        total_points = self.score_player1 + self.score_player2
+        rallies = self.score_player1 + self.score_player2 - self._start_points
+        deuce_threshold = self._deuce_threshold
         
         # Deuce: both players have at least 10 points
-        if self.score_player1 >= DEUCE_THRESHOLD and self.score_player2 >= DEUCE_THRESHOLD:
+        if self.score_player1 >= deuce_threshold and self.score_player2 >= deuce_threshold:
             # Change serve every point
             self.server = PLAYER_2 if self.server == PLAYER_1 else PLAYER_1
         else:
             # Normal play: change every 2 points
-            # We check if we just hit a multiple of SERVE_CHANGE_INTERVAL
-            if total_points > 0 and total_points % SERVE_CHANGE_INTERVAL == 0:
+            # We check if we just hit a multiple of the serve interval
+            if rallies > 0 and rallies % self._serve_interval == 0:
                 self.server = PLAYER_2 if self.server == PLAYER_1 else PLAYER_1
     
     def _check_set_win(self) -> Optional[int]:
         """Check if a player has won the current set.
         
         Win conditions:
-        - Score >= POINTS_TO_WIN_SET (11)
-        - Lead by at least POINTS_ADVANTAGE_REQUIRED (2)
+        - Score >= points_to_win_set (11)
+        - Lead by at least points_advantage_required (2)
         
         Returns:
             PLAYER_1, PLAYER_2, or None if no winner yet
         """
-        if self.score_player1 >= POINTS_TO_WIN_SET:
-            if self.score_player1 - self.score_player2 >= POINTS_ADVANTAGE_REQUIRED:
+        if self.score_player1 >= self._points_to_win:
+            if self.score_player1 - self.score_player2 >= self._advantage:
                 return PLAYER_1
         
-        if self.score_player2 >= POINTS_TO_WIN_SET:
-            if self.score_player2 - self.score_player1 >= POINTS_ADVANTAGE_REQUIRED:
+        if self.score_player2 >= self._points_to_win:
+            if self.score_player2 - self.score_player1 >= self._advantage:
                 return PLAYER_2
         
         return None
@@ -244,6 +616,14 @@ class MatchEngine:
         """
         return self._check_match_win() is not None
     
+    def get_set_winner(self) -> Optional[int]:
+        """Get the winner of the current set, if it is decided but not reset yet.
+        
+        Returns:
+            PLAYER_1, PLAYER_2, or None if the set is still running
+        """
+        return self._check_set_win()
+    
     def get_winner(self) -> Optional[int]:
         """Get the match winner.
         
@@ -80,12 +80,13 @@ class Match:
         return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SetResult:
     """Result of adding a point to the match.
     
     This is returned by MatchEngine.add_point() to inform the UI
-    about what happened (set won, match won, etc.).
+    about what happened (set won, match won, etc.). Immutable, so the
+    engine can hand out shared instances instead of allocating per point.
     
     Attributes:
         set_won: True if a set was just won
@@ -97,7 +98,7 @@ class SetResult:
     winner: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchState:
     """Represents the complete state of an ongoing match.
     
@@ -115,3 +116,26 @@ class MatchState:
     sets_player1: int
     sets_player2: int
     server: int
+
+
+@dataclass(frozen=True, slots=True)
+class MatchChange:
+    """Coalesced change notification from MatchEngine observers.
+    
+    One instance describes everything that happened since the previous
+    notification, e.g. a point with serve change and set win.
+    
+    Attributes:
+        before: State at the previous notification
+        after: Current state
+        changed: Names of the MatchState fields that differ
+        events: Number of engine operations coalesced into this change
+        set_winner: Winner of the current set if it is decided but not reset yet
+        match_winner: Match winner, or None while the match is running
+    """
+    before: MatchState
+    after: MatchState
+    changed: frozenset[str]
+    events: int
+    set_winner: Optional[int] = None
+    match_winner: Optional[int] = None
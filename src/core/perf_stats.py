@@ -0,0 +1,160 @@
+"""
+Performance Statistics
+======================
+
+Rolling timing samples for the on-screen performance HUD (APP_DEBUG).
+
+Hot paths report through the module-level hook:
+
+    perf = get_perf_stats()
+    if perf is not None:
+        perf.record("db", seconds)
+
+Without an enabled collector get_perf_stats() returns None, so a hook
+costs one function call. While enabled, PerfStats also counts garbage
+collector runs and their pause times via gc.callbacks.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+import gc
+import sys
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from .constants import PERF_WINDOW
+
+Clock = Callable[[], float]
+
+
+class RollingStat:
+    """The most recent samples of one metric (seconds).
+
+    Attributes:
+        samples: Kept samples, oldest first
+        count: Samples recorded in total
+    """
+
+    __slots__ = ('samples', 'count')
+
+    def __init__(self, window: int = PERF_WINDOW) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        """Record one sample."""
+        self.samples.append(seconds)
+        self.count += 1
+
+    @property
+    def last(self) -> Optional[float]:
+        """Most recent sample."""
+        return self.samples[-1] if self.samples else None
+
+    def mean(self) -> Optional[float]:
+        """Mean of the kept samples."""
+        return sum(self.samples) / len(self.samples) if self.samples else None
+
+    def max(self) -> Optional[float]:
+        """Largest kept sample."""
+        return max(self.samples) if self.samples else None
+
+
+class PerfStats:
+    """Named rolling metrics plus garbage collector statistics.
+
+    Attributes:
+        metrics: RollingStat per metric name, in order of first use
+        gc_pauses: Pause time of each collection
+        gc_collections: Collections per generation since tracking started
+
+    Example:
+        >>> perf = enable_perf_stats()
+        >>> perf.record("paint score1", 0.0012)
+        >>> perf.metric("paint score1").last
+        0.0012
+    """
+
+    def __init__(self, window: int = PERF_WINDOW, clock: Clock = time.perf_counter) -> None:
+        """Create an empty collector.
+
+        Args:
+            window: Samples kept per metric
+            clock: Clock for GC pause times
+        """
+        self.window = window
+        self.metrics: dict[str, RollingStat] = {}
+        self.gc_pauses = RollingStat(window)
+        self.gc_collections = [0, 0, 0]
+        self._clock = clock
+        self._gc_started: Optional[float] = None
+        self._gc_tracking = False
+
+    def metric(self, name: str) -> RollingStat:
+        """Get (or create) the metric ``name``."""
+        stat = self.metrics.get(name)
+        if stat is None:
+            stat = self.metrics[name] = RollingStat(self.window)
+        return stat
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record one sample of the metric ``name``."""
+        self.metric(name).add(seconds)
+
+    @staticmethod
+    def heap_blocks() -> int:
+        """Memory blocks currently allocated by the Python allocator."""
+        return sys.getallocatedblocks()
+
+    # ---------- Garbage collector ----------
+
+    def start_gc_tracking(self) -> None:
+        """Count collections and their pauses (gc.callbacks)."""
+        if not self._gc_tracking:
+            gc.callbacks.append(self._on_gc)
+            self._gc_tracking = True
+
+    def stop_gc_tracking(self) -> None:
+        """Stop counting collections."""
+        if self._gc_tracking:
+            gc.callbacks.remove(self._on_gc)
+            self._gc_tracking = False
+            self._gc_started = None
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_started = self._clock()
+        elif self._gc_started is not None:
+            self.gc_pauses.add(self._clock() - self._gc_started)
+            self.gc_collections[info["generation"]] += 1
+            self._gc_started = None
+
+
+_active: Optional[PerfStats] = None
+
+
+def get_perf_stats() -> Optional[PerfStats]:
+    """Get the enabled collector (None while the HUD is off)."""
+    return _active
+
+
+def enable_perf_stats(window: int = PERF_WINDOW) -> PerfStats:
+    """Enable collecting (keeps an already enabled collector).
+
+    Returns:
+        The enabled PerfStats, with GC tracking started
+    """
+    global _active
+    if _active is None:
+        _active = PerfStats(window)
+    _active.start_gc_tracking()
+    return _active
+
+
+def disable_perf_stats() -> None:
+    """Disable collecting; hooks become no-ops again."""
+    global _active
+    if _active is not None:
+        _active.stop_gc_tracking()
+        _active = None
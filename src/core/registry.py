@@ -0,0 +1,362 @@
+"""
+Match Registry
+==============
+
+Headless host for many concurrent matches, one MatchEngine per table.
+
+Writers (point events from scoreboards, tablets, imports) are serialized
+by one lock and applied in bulk per table. After each write a new
+read-only snapshot mapping is built and swapped in with a single
+assignment, so readers (displays, web views, statistics) never take a
+lock and never see a half-applied batch.
+
+Finished matches are kept until the estimated memory of all live matches
+exceeds the budget; then the oldest finished matches are moved to a
+MatchArchive as compact event logs.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Hashable, Iterable, List, Mapping, Optional, Protocol
+
+from .constants import (
+    PLAYER_1,
+    PLAYER_2,
+    DEFAULT_SETS_TO_WIN,
+    REGISTRY_MEMORY_BUDGET,
+)
+from .match_engine import MatchEngine
+from .models import MatchState
+from .rules import RuleSet, STANDARD_RULES
+
+# Estimated bytes of an engine and its timeline objects, without the log arrays
+_MATCH_OVERHEAD_BYTES = 800
+
+TableId = Hashable
+
+
+@dataclass(frozen=True, slots=True)
+class TableSnapshot:
+    """Read-only view of one table, as published after a write.
+
+    Attributes:
+        table_id: Table the match is played on
+        player1_name: Name of player 1
+        player2_name: Name of player 2
+        state: Current match state
+        winner: Match winner (PLAYER_1 / PLAYER_2), or None while running
+        points_played: Points played so far
+        version: Incremented with every write to this table
+    """
+    table_id: TableId
+    player1_name: str
+    player2_name: str
+    state: MatchState
+    winner: Optional[int]
+    points_played: int
+    version: int
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedMatch:
+    """A finished match in compact form.
+
+    Attributes:
+        table_id: Table the match was played on
+        player1_name: Name of player 1
+        player2_name: Name of player 2
+        sets_to_win: Number of sets needed to win the match
+        initial_server: Who served first in the match
+        events: Timeline event log (one byte per point or set reset)
+        winner: Match winner (PLAYER_1 / PLAYER_2)
+        rules: Scoring rules of the match
+    """
+    table_id: TableId
+    player1_name: str
+    player2_name: str
+    sets_to_win: int
+    initial_server: int
+    events: bytes
+    winner: Optional[int]
+    rules: RuleSet = STANDARD_RULES
+
+    def to_engine(self) -> MatchEngine:
+        """Rebuild the full MatchEngine (including undo history) from the log."""
+        engine = MatchEngine(
+            player1_name=self.player1_name,
+            player2_name=self.player2_name,
+            sets_to_win=self.sets_to_win,
+            initial_server=self.initial_server,
+            rules=self.rules,
+        )
+        engine.replay_events(self.events)
+        return engine
+
+
+class MatchArchive(Protocol):
+    """Interface for storage of finished matches."""
+
+    def store(self, match: ArchivedMatch) -> None:
+        """Persist a finished match."""
+        ...
+
+    def get_by_table(self, table_id: TableId) -> List[ArchivedMatch]:
+        """Get all archived matches of a table, oldest first."""
+        ...
+
+
+class InMemoryMatchArchive:
+    """Archive that keeps matches in a list (offline mode / testing)."""
+
+    def __init__(self) -> None:
+        self.matches: List[ArchivedMatch] = []
+
+    def store(self, match: ArchivedMatch) -> None:
+        self.matches.append(match)
+
+    def get_by_table(self, table_id: TableId) -> List[ArchivedMatch]:
+        return [match for match in self.matches if match.table_id == table_id]
+
+
+class MatchRegistry:
+    """Owns one MatchEngine per table and publishes lock-free snapshots.
+
+    Every table can use its own RuleSet (e.g. 11-point and legacy
+    21-point matches side by side); each rule set is compiled once.
+
+    Sets are started automatically after a set win (like
+    MatchEngine.replay_points()), and points for a finished match or a
+    table without a live match are ignored.
+
+    Example:
+        >>> registry = MatchRegistry()
+        >>> registry.open_match("T1", "Alice", "Bob", sets_to_win=3)
+        >>> registry.apply_events([("T1", PLAYER_1), ("T1", PLAYER_2)])
+        >>> registry.snapshot("T1").state.score_player1
+        1
+    """
+
+    def __init__(
+        self,
+        archive: Optional[MatchArchive] = None,
+        memory_budget: Optional[int] = REGISTRY_MEMORY_BUDGET,
+        use_transition_table: bool = True,
+    ) -> None:
+        """Create an empty registry.
+
+        Args:
+            archive: Storage for evicted finished matches
+                (default: InMemoryMatchArchive)
+            memory_budget: Estimated bytes for live matches before finished
+                matches are archived, or None for no limit
+            use_transition_table: Passed to every MatchEngine
+        """
+        self.archive = archive if archive is not None else InMemoryMatchArchive()
+        self.memory_budget = memory_budget
+        self._use_transition_table = use_transition_table
+
+        self._write_lock = threading.Lock()
+        self._engines: dict[TableId, MatchEngine] = {}
+        # Estimated bytes per live match (see _estimate_bytes())
+        self._sizes: dict[TableId, int] = {}
+        # Finished but not yet archived matches, oldest first
+        self._finished: OrderedDict[TableId, None] = OrderedDict()
+        self._memory = 0
+        # Published mapping and the dict behind it (only ever replaced)
+        self._snapshot_dict: dict[TableId, TableSnapshot] = {}
+        self._snapshots: Mapping[TableId, TableSnapshot] = MappingProxyType(self._snapshot_dict)
+
+    # ------------------------------------------------------------------
+    # Reads (never block)
+    # ------------------------------------------------------------------
+
+    def snapshot(self, table_id: TableId) -> Optional[TableSnapshot]:
+        """Latest published snapshot of a table, or None if unknown."""
+        return self._snapshots.get(table_id)
+
+    def snapshots(self) -> Mapping[TableId, TableSnapshot]:
+        """Latest published snapshots of all tables (read-only, consistent)."""
+        return self._snapshots
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated bytes held by live matches."""
+        return self._memory
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def open_match(
+        self,
+        table_id: TableId,
+        player1_name: str = "Spieler 1",
+        player2_name: str = "Spieler 2",
+        sets_to_win: int = DEFAULT_SETS_TO_WIN,
+        initial_server: int = PLAYER_1,
+        rules: RuleSet = STANDARD_RULES,
+    ) -> None:
+        """Start a new match on a table.
+
+        A finished match still on the table is archived first.
+
+        Raises:
+            ValueError: If a match is still running on the table
+        """
+        engine = MatchEngine(
+            player1_name=player1_name,
+            player2_name=player2_name,
+            sets_to_win=sets_to_win,
+            initial_server=initial_server,
+            use_transition_table=self._use_transition_table,
+            rules=rules,
+        )
+        with self._write_lock:
+            current = self._engines.get(table_id)
+            if current is not None:
+                if not current.is_match_finished():
+                    raise ValueError(f"match on table {table_id!r} is still running")
+                self._evict(table_id)
+            self._engines[table_id] = engine
+            self._update_size(table_id, engine)
+            self._publish({table_id: engine})
+
+    def apply_events(self, events: Iterable[tuple[TableId, int]]) -> int:
+        """Apply a batch of (table_id, player) point events.
+
+        Events are grouped per table (keeping their order) and applied with
+        MatchEngine.replay_points(); one snapshot mapping is published for
+        the whole batch (none if nothing changed).
+
+        Points for a finished match or for a table without a live match
+        (never opened, or already archived; e.g. late events) are ignored.
+
+        Args:
+            events: Point events; player is PLAYER_1 or PLAYER_2
+
+        Returns:
+            Number of points applied
+
+        Raises:
+            ValueError: If a player is not PLAYER_1 or PLAYER_2
+        """
+        per_table: dict[TableId, List[int]] = {}
+        for table_id, player in events:
+            if player != PLAYER_1 and player != PLAYER_2:
+                raise ValueError(f"player must be {PLAYER_1} or {PLAYER_2}")
+            per_table.setdefault(table_id, []).append(player)
+
+        with self._write_lock:
+            engines = self._engines
+            applied = 0
+            changed = {}
+            for table_id, points in per_table.items():
+                engine = engines.get(table_id)
+                if engine is None or engine.is_match_finished():
+                    continue
+                applied += engine.replay_points(points)
+                self._update_size(table_id, engine)
+                if engine.is_match_finished():
+                    self._finished[table_id] = None
+                changed[table_id] = engine
+
+            if changed:
+                self._publish(changed)
+                self._enforce_budget()
+        return applied
+
+    def add_point(self, table_id: TableId, player: int) -> int:
+        """Apply a single point event (see apply_events())."""
+        return self.apply_events(((table_id, player),))
+
+    def undo_last_point(self, table_id: TableId) -> bool:
+        """Undo the last point on a table.
+
+        Returns:
+            True if a point was undone
+
+        Raises:
+            KeyError: If no match is live on the table
+        """
+        with self._write_lock:
+            engine = self._engines[table_id]
+            # A point that was only followed by an automatic set start is
+            # undone together with it (see MatchEngine.undo_last_point())
+            undone = engine.undo_last_point()
+            self._update_size(table_id, engine)
+            self._finished.pop(table_id, None)
+            self._publish({table_id: engine})
+        return undone
+
+    def close_match(self, table_id: TableId) -> None:
+        """Archive the match on a table now, finished or not."""
+        with self._write_lock:
+            if table_id in self._engines:
+                self._evict(table_id)
+
+    # ------------------------------------------------------------------
+    # Internal (call with the write lock held)
+    # ------------------------------------------------------------------
+
+    def _publish(self, changed: Mapping[TableId, MatchEngine]) -> None:
+        """Swap in a new snapshot mapping with the changed tables updated.
+
+        Copies the mapping once per write (a whole apply_events() batch).
+        """
+        snapshots = self._snapshot_dict.copy()
+        for table_id, engine in changed.items():
+            previous = snapshots.get(table_id)
+            snapshots[table_id] = TableSnapshot(
+                table_id=table_id,
+                player1_name=engine.player1_name,
+                player2_name=engine.player2_name,
+                state=engine.get_current_state(),
+                winner=engine.get_winner(),
+                points_played=engine.timeline.point_count,
+                version=previous.version + 1 if previous is not None else 0,
+            )
+        # Single reference assignment: readers see the old or the new mapping
+        self._snapshot_dict = snapshots
+        self._snapshots = MappingProxyType(snapshots)
+
+    def _update_size(self, table_id: TableId, engine: MatchEngine) -> None:
+        """Refresh the memory estimate of one match."""
+        size = _estimate_bytes(engine)
+        self._memory += size - self._sizes.get(table_id, 0)
+        self._sizes[table_id] = size
+
+    def _enforce_budget(self) -> None:
+        """Archive the oldest finished matches while over the memory budget."""
+        if self.memory_budget is None:
+            return
+        while self._memory > self.memory_budget and self._finished:
+            table_id = next(iter(self._finished))
+            self._evict(table_id)
+
+    def _evict(self, table_id: TableId) -> None:
+        """Move a match from memory to the archive.
+
+        The table keeps its last snapshot until a new match is opened.
+        """
+        engine = self._engines.pop(table_id)
+        self._finished.pop(table_id, None)
+        self._memory -= self._sizes.pop(table_id)
+        self.archive.store(ArchivedMatch(
+            table_id=table_id,
+            player1_name=engine.player1_name,
+            player2_name=engine.player2_name,
+            sets_to_win=engine.sets_to_win,
+            initial_server=engine.timeline.state_after(0)[5],
+            events=engine.timeline.events,
+            winner=engine.get_winner(),
+            rules=engine.rules,
+        ))
+
+
+def _estimate_bytes(engine: MatchEngine) -> int:
+    """Estimated memory of one live match."""
+    return _MATCH_OVERHEAD_BYTES + engine.timeline.nbytes
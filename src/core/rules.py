@@ -0,0 +1,139 @@
+"""
+Rule Sets
+=========
+
+Scoring rule variants for MatchEngine.
+
+A RuleSet bundles the values that used to be read directly from the
+module constants (points to win a set, required lead, serve interval,
+deuce threshold) plus optional handicap start scores. Rule sets are
+immutable and hashable, so each one is compiled only once into its
+TransitionTable (see compile()) and matches with different rules can run
+side by side in one process.
+
+Serve rotation counts the rallies played in the set, not the handicap
+start points: whoever serves first serves two rallies, as in a set
+started at 0:0.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Final
+
+from .constants import (
+    POINTS_TO_WIN_SET,
+    POINTS_ADVANTAGE_REQUIRED,
+    SERVE_CHANGE_INTERVAL,
+    DEUCE_THRESHOLD,
+)
+from .transition_table import RulesKey, TransitionTable, get_transition_table
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSet:
+    """Scoring rules of a match.
+
+    Attributes:
+        name: Display name of the variant
+        points_to_win_set: Points needed to win a set
+        points_advantage_required: Lead needed to win a set
+        serve_change_interval: Points per serve turn in normal play
+        deuce_threshold: From this score on (both players) the serve
+            changes every point
+        start_score_player1: Handicap points of player 1 at the start of every set
+        start_score_player2: Handicap points of player 2 at the start of every set
+
+    Handicap start points do not count for the serve rotation: at 3:0 the
+    first server still serves the first two rallies.
+    """
+    name: str = "Standard"
+    points_to_win_set: int = POINTS_TO_WIN_SET
+    points_advantage_required: int = POINTS_ADVANTAGE_REQUIRED
+    serve_change_interval: int = SERVE_CHANGE_INTERVAL
+    deuce_threshold: int = DEUCE_THRESHOLD
+    start_score_player1: int = 0
+    start_score_player2: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the rule values.
+
+        Raises:
+            ValueError: If a rule value is not positive or a start score
+                would already win the set
+        """
+        if min(self.key) < 1:
+            raise ValueError("all rule values must be at least 1")
+        for start in (self.start_score_player1, self.start_score_player2):
+            if not 0 <= start < self.points_to_win_set:
+                raise ValueError(
+                    f"start scores must be between 0 and {self.points_to_win_set - 1}"
+                )
+
+    @property
+    def key(self) -> RulesKey:
+        """Rules tuple for the transition table, batch replay and simulation."""
+        return (
+            self.points_to_win_set,
+            self.points_advantage_required,
+            self.serve_change_interval,
+            self.deuce_threshold,
+        )
+
+    @property
+    def start_scores(self) -> tuple[int, int]:
+        """Scores of (player 1, player 2) at the start of every set."""
+        return self.start_score_player1, self.start_score_player2
+
+    @property
+    def start_points(self) -> int:
+        """Handicap points on the scoreboard before the first rally of a set."""
+        return self.start_score_player1 + self.start_score_player2
+
+    def compile(self) -> TransitionTable:
+        """Get the transition table of these rules (built once, then shared)."""
+        return get_transition_table(self.key, self.start_points)
+
+
+STANDARD_RULES: Final[RuleSet] = RuleSet()
+
+# Pre-2001 rules: sets to 21, serve changes every 5 points, deuce at 20:20
+LEGACY_21_RULES: Final[RuleSet] = RuleSet(
+    name="21 Punkte",
+    points_to_win_set=21,
+    points_advantage_required=2,
+    serve_change_interval=5,
+    deuce_threshold=20,
+)
+
+RULE_SETS: Final[dict[str, RuleSet]] = {
+    rules.name: rules for rules in (STANDARD_RULES, LEGACY_21_RULES)
+}
+
+
+def handicap_rules(
+    start_score_player1: int,
+    start_score_player2: int,
+    base: RuleSet = STANDARD_RULES,
+) -> RuleSet:
+    """Create a handicap variant of a rule set.
+
+    Args:
+        start_score_player1: Points player 1 starts every set with
+        start_score_player2: Points player 2 starts every set with
+        base: Rule set to derive from
+
+    Returns:
+        RuleSet with the given start scores
+
+    Example:
+        >>> rules = handicap_rules(3, 0)
+        >>> MatchEngine(rules=rules).score_player1
+        3
+    """
+    return replace(
+        base,
+        name=f"{base.name} ({start_score_player1}:{start_score_player2})",
+        start_score_player1=start_score_player1,
+        start_score_player2=start_score_player2,
+    )
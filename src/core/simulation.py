@@ -0,0 +1,253 @@
+"""
+Simulation
+==========
+
+Monte Carlo simulation of matches and round-robin tournaments with NumPy.
+
+Every simulated point is drawn from the serve win rate of the current
+server and then applied with batch_replay.apply_points(), so the simulated
+matches follow exactly the MatchEngine rules (serve rotation, deuce, set
+and match win). Useful for planning session lengths and table allocation,
+and for checking the win probability model against sampled outcomes.
+
+Requires NumPy (optional dependency, see requirements.txt).
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from dataclasses import dataclass, fields
+from itertools import combinations
+from typing import Final, Sequence, Union
+
+import numpy as np
+
+from .batch_replay import BatchReplayResult, apply_points, new_batch_state
+from .constants import PLAYER_1, PLAYER_2, DEFAULT_SETS_TO_WIN
+from .transition_table import DEFAULT_RULES, RulesKey
+
+# Matches simulated together (bounds the memory of one batch)
+SIMULATION_CHUNK_SIZE: Final[int] = 65536
+
+# Safety cap on points per match (e.g. both serve win rates at 1.0 never end a deuce)
+MAX_SIMULATED_POINTS: Final[int] = 2000
+
+# Finished matches are dropped from the batch every N points
+_COMPACT_INTERVAL = 8
+
+Seed = Union[int, np.random.Generator, None]
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of every simulated match.
+
+    Attributes:
+        winner: Match winner (1 or 2), or 0 if MAX_SIMULATED_POINTS was hit
+        sets_player1: Sets won by player 1
+        sets_player2: Sets won by player 2
+        points_played: Points played in the match
+    """
+    winner: np.ndarray
+    sets_player1: np.ndarray
+    sets_player2: np.ndarray
+    points_played: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.winner)
+
+    def win_rate(self, player: int = PLAYER_1) -> float:
+        """Share of matches won by ``player``."""
+        return float(np.mean(self.winner == player)) if len(self) else 0.0
+
+    def set_score_distribution(self) -> dict[tuple[int, int], float]:
+        """Share of matches per final set score, e.g. {(3, 1): 0.31, ...}."""
+        scores, counts = np.unique(
+            np.stack([self.sets_player1, self.sets_player2], axis=1),
+            axis=0,
+            return_counts=True,
+        )
+        return {
+            (int(sets1), int(sets2)): float(count / len(self))
+            for (sets1, sets2), count in zip(scores, counts)
+        }
+
+    def length_percentiles(self, percentiles: Sequence[float] = (10, 50, 90, 99)) -> dict[float, float]:
+        """Match length in points at the given percentiles."""
+        values = np.percentile(self.points_played, percentiles)
+        return dict(zip(percentiles, values.tolist()))
+
+
+@dataclass
+class RoundRobinResult:
+    """Outcome of every simulated round-robin tournament.
+
+    Attributes:
+        wins: Match wins per tournament and player, shape (T, N)
+        set_difference: Sets won minus sets lost, shape (T, N)
+        points_played: Points played in the whole tournament, shape (T,)
+        matches_per_tournament: Number of matches in one tournament
+    """
+    wins: np.ndarray
+    set_difference: np.ndarray
+    points_played: np.ndarray
+    matches_per_tournament: int
+
+    def __len__(self) -> int:
+        return len(self.points_played)
+
+    def champion_probabilities(self) -> np.ndarray:
+        """Probability of finishing first per player.
+
+        Ranking is by match wins, then set difference. Remaining ties are
+        shared equally between the tied players.
+        """
+        key = self.wins.astype(np.int64) * 10_000 + self.set_difference
+        best = key == key.max(axis=1, keepdims=True)
+        share = best / best.sum(axis=1, keepdims=True)
+        return share.mean(axis=0)
+
+
+def _take(state: BatchReplayResult, rows: np.ndarray) -> BatchReplayResult:
+    """Subset every array of a batch state."""
+    return BatchReplayResult(
+        **{field.name: getattr(state, field.name)[rows] for field in fields(state)}
+    )
+
+
+def simulate_matches(
+    count: int,
+    serve_win_rate1: float,
+    serve_win_rate2: float,
+    sets_to_win: int = DEFAULT_SETS_TO_WIN,
+    initial_server: Union[int, np.ndarray] = PLAYER_1,
+    rules: RulesKey = DEFAULT_RULES,
+    seed: Seed = None,
+    max_points: int = MAX_SIMULATED_POINTS,
+) -> SimulationResult:
+    """Simulate ``count`` independent matches.
+
+    Args:
+        count: Number of matches
+        serve_win_rate1: Probability that player 1 wins a point on own serve
+        serve_win_rate2: Probability that player 2 wins a point on own serve
+        sets_to_win: Sets needed to win (see SETS_TO_WIN_MAP)
+        initial_server: First server, scalar or one value per match
+        rules: Rules tuple (see transition_table.RulesKey)
+        seed: Seed or Generator for reproducible results
+        max_points: Stop matches that are still running after this many points
+
+    Returns:
+        SimulationResult with one entry per match
+
+    Raises:
+        ValueError: If a rate is outside [0, 1] or count is negative
+
+    Example:
+        >>> result = simulate_matches(100_000, 0.55, 0.5, sets_to_win=3, seed=1)
+        >>> result.win_rate(PLAYER_1) > 0.5
+        True
+    """
+    if not (0.0 <= serve_win_rate1 <= 1.0 and 0.0 <= serve_win_rate2 <= 1.0):
+        raise ValueError("serve win rates must be between 0 and 1")
+    if count < 0:
+        raise ValueError("count must not be negative")
+
+    rng = np.random.default_rng(seed)
+    servers = np.broadcast_to(np.asarray(initial_server), (count,))
+
+    result = SimulationResult(
+        winner=np.zeros(count, dtype=np.int8),
+        sets_player1=np.zeros(count, dtype=np.int16),
+        sets_player2=np.zeros(count, dtype=np.int16),
+        points_played=np.zeros(count, dtype=np.int32),
+    )
+
+    def store(rows: np.ndarray, state: BatchReplayResult) -> None:
+        result.winner[rows] = state.winner
+        result.sets_player1[rows] = state.sets_player1
+        result.sets_player2[rows] = state.sets_player2
+        result.points_played[rows] = state.points_played
+
+    # P(player 1 wins the point), indexed by the current server
+    point_win = np.array([0.0, serve_win_rate1, 1.0 - serve_win_rate2])
+
+    for start in range(0, count, SIMULATION_CHUNK_SIZE):
+        rows = np.arange(start, min(start + SIMULATION_CHUNK_SIZE, count))
+        state = new_batch_state(len(rows), sets_to_win, servers[rows])
+
+        for point in range(1, max_points + 1):
+            draws = rng.random(len(rows)) < point_win[state.server]
+            points = np.where(draws, PLAYER_1, PLAYER_2).astype(np.uint8)
+            apply_points(state, points, sets_to_win, rules)
+
+            if point % _COMPACT_INTERVAL == 0:
+                finished = state.winner != 0
+                if finished.any():
+                    store(rows[finished], _take(state, finished))
+                    running = ~finished
+                    rows = rows[running]
+                    state = _take(state, running)
+                if not len(rows):
+                    break
+
+        store(rows, state)
+
+    return result
+
+
+def simulate_round_robin(
+    serve_win_rates: Sequence[float],
+    tournaments: int,
+    sets_to_win: int = DEFAULT_SETS_TO_WIN,
+    rules: RulesKey = DEFAULT_RULES,
+    seed: Seed = None,
+) -> RoundRobinResult:
+    """Simulate ``tournaments`` round robins where everyone plays everyone once.
+
+    The first server of every match is drawn by lot.
+
+    Args:
+        serve_win_rates: Serve win rate per player
+        tournaments: Number of tournaments
+        sets_to_win: Sets needed to win a match
+        rules: Rules tuple (see transition_table.RulesKey)
+        seed: Seed or Generator for reproducible results
+
+    Returns:
+        RoundRobinResult with standings and lengths per tournament
+
+    Raises:
+        ValueError: If fewer than two players are given
+    """
+    players = len(serve_win_rates)
+    if players < 2:
+        raise ValueError("a round robin needs at least two players")
+
+    rng = np.random.default_rng(seed)
+    wins = np.zeros((tournaments, players), dtype=np.int32)
+    set_difference = np.zeros((tournaments, players), dtype=np.int32)
+    points_played = np.zeros(tournaments, dtype=np.int64)
+
+    pairings = list(combinations(range(players), 2))
+    for first, second in pairings:
+        result = simulate_matches(
+            tournaments,
+            serve_win_rates[first],
+            serve_win_rates[second],
+            sets_to_win=sets_to_win,
+            initial_server=rng.integers(PLAYER_1, PLAYER_2 + 1, size=tournaments),
+            rules=rules,
+            seed=rng,
+        )
+        wins[:, first] += result.winner == PLAYER_1
+        wins[:, second] += result.winner == PLAYER_2
+        difference = result.sets_player1.astype(np.int32) - result.sets_player2
+        set_difference[:, first] += difference
+        set_difference[:, second] -= difference
+        points_played += result.points_played
+
+    return RoundRobinResult(
+        wins=wins,
+        set_difference=set_difference,
+        points_played=points_played,
+        matches_per_tournament=len(pairings),
+    )
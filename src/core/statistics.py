@@ -0,0 +1,188 @@
+"""
+Match Statistics
+================
+
+Live per-match statistics, maintained incrementally by MatchEngine.
+
+Every point and set reset updates the counters in O(1) and pushes a small
+undo record, so undo_last_point() and rewind_to_point() roll the
+statistics back exactly instead of recomputing them from the history.
+Counters indexed by player use index PLAYER_1 / PLAYER_2 (index 0 unused).
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from typing import Optional
+
+from .constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET, COMEBACK_MIN_DEFICIT
+from .rules import RuleSet, STANDARD_RULES
+
+
+class MatchStatistics:
+    """Incremental statistics of one match.
+
+    Usually created by MatchEngine(track_statistics=True) and read from
+    engine.statistics; the engine reports every event.
+
+    Attributes:
+        serve_points_played: Points played on own serve, per player
+        serve_points_won: Points won on own serve, per player
+        receive_points_won: Points won on the opponent's serve, per player
+        longest_run: Longest run of consecutive points, per player
+        run_player: Winner of the current run (0 before the first point)
+        run_length: Length of the current run
+        comebacks: Sets won after trailing by COMEBACK_MIN_DEFICIT points
+        deuces: How often the score was level at or above the deuce threshold
+        set_points: Points played per set (current set last)
+
+    Example:
+        >>> engine = MatchEngine(track_statistics=True)
+        >>> engine.add_point(PLAYER_1)
+        >>> engine.statistics.serve_points_won[PLAYER_1]
+        1
+    """
+
+    __slots__ = (
+        'serve_points_played',
+        'serve_points_won',
+        'receive_points_won',
+        'longest_run',
+        'run_player',
+        'run_length',
+        'comebacks',
+        'deuces',
+        'set_points',
+        '_deficits',
+        '_start_deficits',
+        '_deuce_threshold',
+        '_undo',
+    )
+
+    def __init__(self, rules: RuleSet = STANDARD_RULES) -> None:
+        """Start with empty statistics.
+
+        Args:
+            rules: Rules of the match (deuce threshold, handicap start scores)
+        """
+        self.serve_points_played = [0, 0, 0]
+        self.serve_points_won = [0, 0, 0]
+        self.receive_points_won = [0, 0, 0]
+        self.longest_run = [0, 0, 0]
+        self.run_player = 0
+        self.run_length = 0
+        self.comebacks = [0, 0, 0]
+        self.deuces = 0
+        self.set_points = [0]
+
+        # Largest deficit per player in the current set (handicap starts count)
+        start1, start2 = rules.start_scores
+        self._start_deficits = (0, max(start2 - start1, 0), max(start1 - start2, 0))
+        self._deficits = list(self._start_deficits)
+        self._deuce_threshold = rules.deuce_threshold
+
+        # One record per event: what record_point()/record_reset() overwrote
+        self._undo: list[tuple] = []
+
+    def __len__(self) -> int:
+        """Number of recorded events (points and set resets)."""
+        return len(self._undo)
+
+    @property
+    def points_played(self) -> int:
+        """Total points played in the match."""
+        return sum(self.set_points)
+
+    def points_won(self, player: int) -> int:
+        """Total points won by ``player``."""
+        return self.serve_points_won[player] + self.receive_points_won[player]
+
+    def record_point(
+        self,
+        player: int,
+        server: int,
+        score_player1: int,
+        score_player2: int,
+        set_winner: Optional[int],
+    ) -> None:
+        """Count a point.
+
+        Args:
+            player: Point winner
+            server: Server before the point
+            score_player1: Score of player 1 after the point
+            score_player2: Score of player 2 after the point
+            set_winner: Winner of the set if the point decided it
+        """
+        run_player = self.run_player
+        run_length = self.run_length
+        longest = self.longest_run[player]
+        deficit1, deficit2 = self._deficits[PLAYER_1], self._deficits[PLAYER_2]
+
+        self.serve_points_played[server] += 1
+        if player == server:
+            self.serve_points_won[player] += 1
+        else:
+            self.receive_points_won[player] += 1
+
+        length = run_length + 1 if player == run_player else 1
+        self.run_player = player
+        self.run_length = length
+        if length > longest:
+            self.longest_run[player] = length
+
+        if score_player2 - score_player1 > deficit1:
+            self._deficits[PLAYER_1] = score_player2 - score_player1
+        elif score_player1 - score_player2 > deficit2:
+            self._deficits[PLAYER_2] = score_player1 - score_player2
+
+        deuce = score_player1 == score_player2 and score_player1 >= self._deuce_threshold
+        if deuce:
+            self.deuces += 1
+
+        comeback = bool(set_winner) and self._deficits[set_winner] >= COMEBACK_MIN_DEFICIT
+        if comeback:
+            self.comebacks[set_winner] += 1
+
+        self.set_points[-1] += 1
+        self._undo.append((
+            player, server, run_player, run_length, longest,
+            deficit1, deficit2, deuce, set_winner if comeback else 0,
+        ))
+
+    def record_reset(self) -> None:
+        """Start counting a new set."""
+        self._undo.append((EVENT_RESET_SET, self._deficits[PLAYER_1], self._deficits[PLAYER_2]))
+        self._deficits = list(self._start_deficits)
+        self.set_points.append(0)
+
+    def rollback(self, events: int) -> None:
+        """Undo the last ``events`` recorded events (points and set resets).
+
+        Args:
+            events: Number of events to undo (at most len(self))
+        """
+        undo = self._undo
+        for _ in range(events):
+            record = undo.pop()
+            if record[0] == EVENT_RESET_SET:
+                self.set_points.pop()
+                self._deficits[PLAYER_1], self._deficits[PLAYER_2] = record[1], record[2]
+                continue
+
+            (
+                player, server, self.run_player, self.run_length, longest,
+                deficit1, deficit2, deuce, comeback_winner,
+            ) = record
+            self.serve_points_played[server] -= 1
+            if player == server:
+                self.serve_points_won[player] -= 1
+            else:
+                self.receive_points_won[player] -= 1
+            self.longest_run[player] = longest
+            self._deficits[PLAYER_1], self._deficits[PLAYER_2] = deficit1, deficit2
+            if deuce:
+                self.deuces -= 1
+            if comeback_winner:
+                self.comebacks[comeback_winner] -= 1
+            self.set_points[-1] -= 1
+
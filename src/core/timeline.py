@@ -0,0 +1,344 @@
+"""
+Match Timeline
+==============
+
+Append-only event log of a match with a snapshot index for time travel.
+
+Every point (PLAYER_1 / PLAYER_2) and every set reset (EVENT_RESET_SET) is
+stored as one byte. A full state snapshot is kept every
+``snapshot_interval`` events, so the state after any prefix of the log is
+rebuilt from the nearest snapshot with at most ``snapshot_interval``
+replayed events. The set resets are indexed separately, which lets point
+numbers and "sets 2:1, score 7:9" positions be resolved by bisection.
+
+Undo is just a truncation of the log followed by a lookup.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from .constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET, HISTORY_CHECKPOINT_INTERVAL
+from .models import MatchState
+from .rules import RuleSet, STANDARD_RULES
+from .transition_table import compute_transition
+
+# (score1, score2, sets1, sets2, server, initial_server)
+Snapshot = tuple[int, int, int, int, int, int]
+
+_SNAPSHOT_FIELDS = 6
+
+
+class MatchTimeline:
+    """Event log of one match with periodic full-state snapshots.
+
+    The owner (usually MatchEngine) applies the rules and reports each
+    event; the timeline only needs the rules to replay between snapshots.
+
+    Example:
+        >>> timeline = engine.timeline
+        >>> timeline.state_at_point(20)           # after the 20th point
+        >>> timeline.state_at_score(2, 1, 7, 9)   # sets 2:1, score 7:9
+    """
+
+    def __init__(
+        self,
+        initial_state: Snapshot,
+        rules: RuleSet = STANDARD_RULES,
+        snapshot_interval: int = HISTORY_CHECKPOINT_INTERVAL,
+    ) -> None:
+        """Start an empty timeline.
+
+        Args:
+            initial_state: State before the first event
+            rules: Rule set used to replay events
+            snapshot_interval: Events between two full snapshots
+
+        Raises:
+            ValueError: If snapshot_interval < 1
+        """
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+
+        self.rules = rules
+        self.snapshot_interval = snapshot_interval
+        self._key = rules.key
+        self._start_points = rules.start_points
+        self._table = rules.compile()
+
+        # One byte per event (point winner or EVENT_RESET_SET)
+        self._events = array('B')
+        # Snapshot i holds the state after i * snapshot_interval events
+        self._snapshots = array('H')
+        # Per set reset: its event index, the points played before it and the
+        # sets (total, then player 1 / player 2) at that time. None of these
+        # decrease along the log, so they can be bisected.
+        self._reset_positions = array('I')
+        self._reset_points = array('I')
+        self._reset_set_totals = array('H')
+        self._reset_sets = array('H')
+
+        self.save_snapshot(initial_state)
+
+    def __len__(self) -> int:
+        """Number of logged events (points and set resets)."""
+        return len(self._events)
+
+    @property
+    def point_count(self) -> int:
+        """Number of logged points."""
+        return len(self._events) - len(self._reset_points)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the log, snapshot and reset arrays."""
+        return (
+            len(self._events)
+            + len(self._snapshots) * self._snapshots.itemsize
+            + len(self._reset_positions) * self._reset_positions.itemsize
+            + len(self._reset_points) * self._reset_points.itemsize
+            + len(self._reset_set_totals) * self._reset_set_totals.itemsize
+            + len(self._reset_sets) * self._reset_sets.itemsize
+        )
+
+    @property
+    def events(self) -> bytes:
+        """Copy of the raw event log."""
+        return self._events.tobytes()
+
+    def append_point(self, player: int) -> bool:
+        """Log a point.
+
+        Args:
+            player: Point winner (PLAYER_1 or PLAYER_2)
+
+        Returns:
+            True if a snapshot of the state after this event is due
+            (pass it to save_snapshot())
+        """
+        events = self._events
+        events.append(player)
+        return len(events) % self.snapshot_interval == 0
+
+    def append_reset(self, sets_player1: int, sets_player2: int) -> bool:
+        """Log the start of a new set.
+
+        Args:
+            sets_player1: Sets won by player 1 before the new set
+            sets_player2: Sets won by player 2 before the new set
+
+        Returns:
+            True if a snapshot is due (see append_point())
+        """
+        self._reset_positions.append(len(self._events))
+        self._reset_points.append(self.point_count)
+        self._reset_set_totals.append(sets_player1 + sets_player2)
+        self._reset_sets.extend((sets_player1, sets_player2))
+        self._events.append(EVENT_RESET_SET)
+        return len(self._events) % self.snapshot_interval == 0
+
+    def save_snapshot(self, state: Snapshot) -> None:
+        """Store the state after the current last event.
+
+        Args:
+            state: Full state (see Snapshot)
+        """
+        self._snapshots.extend(state)
+
+    def last_point_position(self) -> Optional[int]:
+        """Event index of the last point, or None if no point was logged.
+
+        Set resets after that point are skipped.
+        """
+        events = self._events
+        index = len(events) - 1
+        while index >= 0 and events[index] == EVENT_RESET_SET:
+            index -= 1
+        return index if index >= 0 else None
+
+    def truncate(self, length: int) -> None:
+        """Drop every event after the first ``length`` events.
+
+        Args:
+            length: Number of events to keep
+        """
+        if length >= len(self._events):
+            return
+        del self._events[length:]
+        snapshots = length // self.snapshot_interval + 1
+        del self._snapshots[snapshots * _SNAPSHOT_FIELDS:]
+
+        # Resets at event index >= length are gone
+        resets = bisect_left(self._reset_positions, length)
+        del self._reset_positions[resets:]
+        del self._reset_points[resets:]
+        del self._reset_set_totals[resets:]
+        del self._reset_sets[2 * resets:]
+
+    def state_after(self, length: int) -> Snapshot:
+        """Full state after the first ``length`` events.
+
+        Loads the nearest snapshot and replays at most snapshot_interval events.
+
+        Args:
+            length: Number of events (0 .. len(timeline))
+
+        Returns:
+            Snapshot tuple
+
+        Raises:
+            IndexError: If length is outside the log
+        """
+        if not 0 <= length <= len(self._events):
+            raise IndexError(f"timeline position {length} out of range")
+
+        snapshot = length // self.snapshot_interval
+        start = snapshot * _SNAPSHOT_FIELDS
+        score1, score2, sets1, sets2, server, initial_server = self._snapshots[
+            start:start + _SNAPSHOT_FIELDS
+        ]
+
+        table = self._table
+        for event in self._events[snapshot * self.snapshot_interval:length]:
+            if event == EVENT_RESET_SET:
+                score1, score2 = self.rules.start_scores
+                initial_server = PLAYER_2 if initial_server == PLAYER_1 else PLAYER_1
+                server = initial_server
+                continue
+            entry = table.step(score1, score2, server, event)
+            if entry is None:
+                entry = compute_transition(
+                    score1, score2, server, event, self._key, self._start_points
+                )
+            score1, score2, server, set_winner = entry
+            if set_winner == PLAYER_1:
+                sets1 += 1
+            elif set_winner == PLAYER_2:
+                sets2 += 1
+
+        return score1, score2, sets1, sets2, server, initial_server
+
+    def point_position(self, points: int) -> int:
+        """Event length right before point number ``points`` (0-based).
+
+        Set resets logged before that point are included, so this is the
+        position a referee sees after ``points`` points.
+
+        Args:
+            points: Number of points (0 .. point_count)
+
+        Returns:
+            Number of events
+
+        Raises:
+            IndexError: If points is outside the log
+        """
+        if not 0 <= points <= self.point_count:
+            raise IndexError(f"point {points} out of range")
+        return points + bisect_right(self._reset_points, points)
+
+    def state_at_point(self, points: int) -> MatchState:
+        """Match state after the first ``points`` points.
+
+        Args:
+            points: Number of points (0 .. point_count)
+
+        Returns:
+            MatchState at that point
+        """
+        return _to_match_state(self.state_after(self.point_position(points)))
+
+    def find_score(
+        self,
+        sets_player1: int,
+        sets_player2: int,
+        score_player1: int,
+        score_player2: int,
+    ) -> Optional[int]:
+        """Find the event position where a set score and point score occurred.
+
+        Args:
+            sets_player1: Sets won by player 1 before the set in question
+            sets_player2: Sets won by player 2 before the set in question
+            score_player1: Points of player 1 in that set
+            score_player2: Points of player 2 in that set
+
+        Returns:
+            Number of events up to that moment, or None if it never occurred
+        """
+        start1, start2 = self.rules.start_scores
+        points_in_set = score_player1 + score_player2 - start1 - start2
+        if score_player1 < start1 or score_player2 < start2:
+            return None
+        total = sets_player1 + sets_player2
+        reset_totals = self._reset_set_totals
+
+        # Sets 0..n: set k starts after reset k - 1 (set 0 at the beginning)
+        candidates = range(
+            bisect_left(reset_totals, total) + 1,
+            bisect_right(reset_totals, total) + 1,
+        )
+        if total == 0:
+            candidates = range(0, candidates.stop)
+
+        for set_index in candidates:
+            if set_index > 0:
+                reset = set_index - 1
+                if (self._reset_sets[2 * reset], self._reset_sets[2 * reset + 1]) != (
+                    sets_player1, sets_player2
+                ):
+                    continue
+                first_point = self._reset_points[reset]
+            elif (sets_player1, sets_player2) != (0, 0):
+                continue
+            else:
+                first_point = 0
+
+            # Points of a set are contiguous in the log
+            target = first_point + points_in_set
+            if set_index < len(self._reset_points):
+                last_point = self._reset_points[set_index]
+            else:
+                last_point = self.point_count
+            if target > last_point:
+                continue
+
+            length = target + set_index
+            score1, score2 = self.state_after(length)[:2]
+            if (score1, score2) == (score_player1, score_player2):
+                return length
+
+        return None
+
+    def state_at_score(
+        self,
+        sets_player1: int,
+        sets_player2: int,
+        score_player1: int,
+        score_player2: int,
+    ) -> Optional[MatchState]:
+        """Match state when a set score and point score occurred.
+
+        See find_score() for the arguments.
+
+        Returns:
+            MatchState at that moment, or None if it never occurred
+        """
+        length = self.find_score(sets_player1, sets_player2, score_player1, score_player2)
+        if length is None:
+            return None
+        return _to_match_state(self.state_after(length))
+
+
+def _to_match_state(state: Snapshot) -> MatchState:
+    """Convert a snapshot tuple to a MatchState."""
+    score1, score2, sets1, sets2, server, _ = state
+    return MatchState(
+        score_player1=score1,
+        score_player2=score2,
+        sets_player1=sets1,
+        sets_player2=sets2,
+        server=server,
+    )
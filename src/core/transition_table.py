@@ -0,0 +1,185 @@
+"""
+Transition Table
+================
+
+Precomputed point transitions for a scoring rule set.
+
+The (score1, score2, server) space of a set is enumerated once per rule set.
+Each entry stores the state after a point for either player, so the
+MatchEngine can resolve a point with a single list lookup instead of
+re-evaluating the serve and set-win rules.
+
+Deuce states beyond the table are folded back onto the table: once both
+players are above the deuce threshold only the lead matters, so subtracting
+the same offset from both scores yields an equivalent state.
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from functools import lru_cache
+from typing import Final, Optional
+
+from .constants import (
+    POINTS_TO_WIN_SET,
+    POINTS_ADVANTAGE_REQUIRED,
+    SERVE_CHANGE_INTERVAL,
+    DEUCE_THRESHOLD,
+    PLAYER_1,
+    PLAYER_2,
+)
+
+# (points_to_win_set, points_advantage_required, serve_change_interval, deuce_threshold)
+RulesKey = tuple[int, int, int, int]
+
+DEFAULT_RULES: Final[RulesKey] = (
+    POINTS_TO_WIN_SET,
+    POINTS_ADVANTAGE_REQUIRED,
+    SERVE_CHANGE_INTERVAL,
+    DEUCE_THRESHOLD,
+)
+
+# Entry layout: (score1, score2, server, set_winner) with set_winner 0 = none
+Transition = tuple[int, int, int, int]
+
+
+def compute_transition(
+    score1: int,
+    score2: int,
+    server: int,
+    player: int,
+    rules: RulesKey = DEFAULT_RULES,
+    start_points: int = 0,
+) -> Transition:
+    """Apply one point using the scalar rules.
+
+    Mirrors MatchEngine._update_server() and MatchEngine._check_set_win().
+
+    Args:
+        score1: Score of player 1 before the point
+        score2: Score of player 2 before the point
+        server: Server before the point (PLAYER_1 or PLAYER_2)
+        player: Player who won the point
+        rules: Rules tuple (see RulesKey)
+        start_points: Handicap points both players start a set with;
+            the serve rotates with the rallies played, not with them
+
+    Returns:
+        Tuple of (score1, score2, server, set_winner) after the point
+    """
+    points_to_win, advantage, serve_interval, deuce_threshold = rules
+
+    if player == PLAYER_1:
+        score1 += 1
+    else:
+        score2 += 1
+
+    if score1 >= deuce_threshold and score2 >= deuce_threshold:
+        server = PLAYER_2 if server == PLAYER_1 else PLAYER_1
+    elif (score1 + score2 - start_points) % serve_interval == 0:
+        server = PLAYER_2 if server == PLAYER_1 else PLAYER_1
+
+    set_winner = 0
+    if score1 >= points_to_win and score1 - score2 >= advantage:
+        set_winner = PLAYER_1
+    elif score2 >= points_to_win and score2 - score1 >= advantage:
+        set_winner = PLAYER_2
+
+    return score1, score2, server, set_winner
+
+
+class TransitionTable:
+    """Lookup table of point transitions for one rule set.
+
+    Use get_transition_table() instead of constructing this directly,
+    so the table is built only once per rule set.
+
+    Example:
+        >>> table = get_transition_table()
+        >>> table.step(10, 10, PLAYER_1, PLAYER_1)
+        (11, 10, 2, 0)
+    """
+
+    def __init__(self, rules: RulesKey = DEFAULT_RULES, start_points: int = 0) -> None:
+        """Enumerate all transitions for the given rules.
+
+        Args:
+            rules: Rules tuple (see RulesKey)
+            start_points: Sum of the handicap start scores
+
+        Raises:
+            ValueError: If a rule value is not positive
+        """
+        points_to_win, advantage, serve_interval, deuce_threshold = rules
+        if min(rules) < 1:
+            raise ValueError("all rule values must be at least 1")
+
+        self.rules = rules
+        self.start_points = start_points
+        self.deuce_threshold = deuce_threshold
+        self.size = max(points_to_win, deuce_threshold) + advantage + 1
+
+        # Folding deuce scores is only valid if a lead of `advantage` above
+        # the deuce threshold always reaches points_to_win.
+        self.can_fold = deuce_threshold + advantage >= points_to_win
+
+        entries: list[Transition] = []
+        for score1 in range(self.size):
+            for score2 in range(self.size):
+                for server in (PLAYER_1, PLAYER_2):
+                    for player in (PLAYER_1, PLAYER_2):
+                        entries.append(
+                            compute_transition(score1, score2, server, player, rules, start_points)
+                        )
+        self.entries = entries
+
+    def step(self, score1: int, score2: int, server: int, player: int) -> Optional[Transition]:
+        """Look up the state after a point.
+
+        Args:
+            score1: Score of player 1 before the point
+            score2: Score of player 2 before the point
+            server: Server before the point
+            player: Player who won the point
+
+        Returns:
+            Tuple of (score1, score2, server, set_winner), or None if the
+            state is outside the table and must be evaluated with the rules
+        """
+        size = self.size
+        if score1 < size and score2 < size:
+            return self.entries[
+                (((score1 * size + score2) << 2) | ((server - 1) << 1)) | (player - 1)
+            ]
+
+        # Deuce: shift both scores down so the lower one sits on the threshold
+        offset = min(score1, score2) - self.deuce_threshold
+        if offset <= 0 or not self.can_fold:
+            return None
+        score1 -= offset
+        score2 -= offset
+        if score1 >= size or score2 >= size:
+            return None
+
+        new1, new2, new_server, set_winner = self.entries[
+            (((score1 * size + score2) << 2) | ((server - 1) << 1)) | (player - 1)
+        ]
+        return new1 + offset, new2 + offset, new_server, set_winner
+
+
+def get_transition_table(rules: RulesKey = DEFAULT_RULES, start_points: int = 0) -> TransitionTable:
+    """Get the (cached) transition table for a rule set.
+
+    Args:
+        rules: Rules tuple (see RulesKey)
+        start_points: Sum of the handicap start scores
+
+    Returns:
+        Shared TransitionTable instance for these rules
+    """
+    return _build_transition_table(tuple(rules), start_points)
+
+
+@lru_cache(maxsize=None)
+def _build_transition_table(rules: RulesKey, start_points: int) -> TransitionTable:
+    """Build a transition table once per rules tuple and start points."""
+    return TransitionTable(rules, start_points)
@@ -0,0 +1,322 @@
+"""
+Win Probability
+===============
+
+Live match win probability from the current MatchState.
+
+Points are modelled as a Markov chain with two parameters: the rate at which
+each player wins a point on their own serve (the receive rates are the
+complements). The set chain is solved by dynamic programming over the
+(score1, score2) grid for both possible first servers, with the deuce tail
+in closed form. The match chain is then solved over the set score.
+
+All tables for one rate pair are built once and kept in an LRU cache, so
+every lookup after the first is O(1).
+
+NO PyQt6 dependencies - fully testable and framework-agnostic.
+"""
+
+from functools import lru_cache
+from typing import Final
+
+from .constants import PLAYER_1, PLAYER_2
+from .models import MatchState
+from .transition_table import DEFAULT_RULES, RulesKey
+
+# Number of (rates, sets_to_win, rules) models kept in the LRU cache
+MODEL_CACHE_SIZE: Final[int] = 64
+
+# Pseudo-points for smoothing serve win rates early in a match
+_PRIOR_RATE = 0.5
+_PRIOR_POINTS = 10
+
+# Rates are rounded to this many decimals so nearby estimates share a model
+_RATE_DECIMALS = 2
+
+
+def serve_changes(score1: int, score2: int, rules: RulesKey = DEFAULT_RULES) -> int:
+    """Count the serve changes since the start of the set.
+
+    Mirrors MatchEngine._update_server() for every score reachable within
+    a set (deuce is always entered through deuce_threshold:deuce_threshold).
+
+    Args:
+        score1: Score of player 1
+        score2: Score of player 2
+        rules: Rules tuple (see transition_table.RulesKey)
+
+    Returns:
+        Number of serve changes; even means the set's first server serves
+    """
+    _, _, serve_interval, deuce_threshold = rules
+    total = score1 + score2
+    if score1 >= deuce_threshold and score2 >= deuce_threshold:
+        deuce_start = 2 * deuce_threshold
+        return (deuce_start - 1) // serve_interval + (total - deuce_start + 1)
+    return total // serve_interval
+
+
+def estimate_serve_win_rate(points_won: int, points_served: int) -> float:
+    """Estimate a serve win rate from the points played so far.
+
+    The estimate is smoothed towards 0.5 at the start of a match and rounded,
+    so consecutive estimates mostly hit the same cached model.
+
+    Args:
+        points_won: Points won on own serve
+        points_served: Points played on own serve
+
+    Returns:
+        Smoothed serve win rate in [0, 1]
+    """
+    rate = (points_won + _PRIOR_RATE * _PRIOR_POINTS) / (points_served + _PRIOR_POINTS)
+    return round(rate, _RATE_DECIMALS)
+
+
+class WinProbabilityModel:
+    """Precomputed set and match win probabilities for one rate pair.
+
+    Use get_win_probability_model() instead of constructing this directly,
+    so the tables are built only once per rate pair.
+
+    Example:
+        >>> model = get_win_probability_model(0.55, 0.55, sets_to_win=3)
+        >>> model.probability(engine.get_current_state())
+        0.5
+    """
+
+    def __init__(
+        self,
+        serve_win_rate1: float,
+        serve_win_rate2: float,
+        sets_to_win: int,
+        rules: RulesKey = DEFAULT_RULES,
+    ) -> None:
+        """Build the set and match tables.
+
+        Args:
+            serve_win_rate1: Probability that player 1 wins a point on own serve
+            serve_win_rate2: Probability that player 2 wins a point on own serve
+            sets_to_win: Number of sets needed to win the match
+            rules: Rules tuple (see transition_table.RulesKey)
+
+        Raises:
+            ValueError: If a rate is outside [0, 1], sets_to_win < 1, or the
+                rules need a lead other than 2 points
+        """
+        if not (0.0 <= serve_win_rate1 <= 1.0 and 0.0 <= serve_win_rate2 <= 1.0):
+            raise ValueError("serve win rates must be between 0 and 1")
+        if sets_to_win < 1:
+            raise ValueError("sets_to_win must be at least 1")
+        points_to_win, advantage, _, deuce_threshold = rules
+        if advantage != 2:
+            raise ValueError("win probability model requires a 2-point lead rule")
+
+        self.sets_to_win = sets_to_win
+        self.rules = rules
+        self.deuce_threshold = deuce_threshold
+        self.size = max(points_to_win, deuce_threshold) + advantage + 1
+
+        # P(player 1 wins the point) by server
+        self._point_win = {
+            PLAYER_1: serve_win_rate1,
+            PLAYER_2: 1.0 - serve_win_rate2,
+        }
+
+        # Set tables: P(player 1 wins the set | score, first server)
+        self._set_win = {
+            PLAYER_1: self._build_set_table(PLAYER_1),
+            PLAYER_2: self._build_set_table(PLAYER_2),
+        }
+
+        # Match table: P(player 1 wins the match | set score, next set's first server)
+        self._match_win = self._build_match_table()
+
+    def _server(self, score1: int, score2: int, first_server: int) -> int:
+        """Server at a score, given the set's first server."""
+        if serve_changes(score1, score2, self.rules) % 2 == 0:
+            return first_server
+        return PLAYER_2 if first_server == PLAYER_1 else PLAYER_1
+
+    def _set_winner(self, score1: int, score2: int) -> int:
+        """Set winner at a score (0 if the set is still running)."""
+        points_to_win, advantage, _, _ = self.rules
+        if score1 >= points_to_win and score1 - score2 >= advantage:
+            return PLAYER_1
+        if score2 >= points_to_win and score2 - score1 >= advantage:
+            return PLAYER_2
+        return 0
+
+    def _build_set_table(self, first_server: int) -> list[float]:
+        """Solve the set chain for one first server."""
+        size = self.size
+        deuce_threshold = self.deuce_threshold
+        point_win = self._point_win
+
+        # Deuce from a tie: each player serves one of the next two points,
+        # so the order does not matter and the tie probability is closed-form.
+        win_both = point_win[PLAYER_1] * point_win[PLAYER_2]
+        lose_both = (1.0 - point_win[PLAYER_1]) * (1.0 - point_win[PLAYER_2])
+        tie = win_both / (win_both + lose_both) if win_both + lose_both > 0 else 0.5
+
+        table = [0.0] * (size * size)
+        for score1 in range(size - 1, -1, -1):
+            for score2 in range(size - 1, -1, -1):
+                winner = self._set_winner(score1, score2)
+                if winner:
+                    value = 1.0 if winner == PLAYER_1 else 0.0
+                elif score1 >= deuce_threshold and score2 >= deuce_threshold:
+                    p = point_win[self._server(score1, score2, first_server)]
+                    lead = score1 - score2
+                    if lead == 0:
+                        value = tie
+                    elif lead > 0:
+                        value = p + (1.0 - p) * tie
+                    else:
+                        value = p * tie
+                else:
+                    p = point_win[self._server(score1, score2, first_server)]
+                    value = (
+                        p * table[(score1 + 1) * size + score2]
+                        + (1.0 - p) * table[score1 * size + score2 + 1]
+                    )
+                table[score1 * size + score2] = value
+        return table
+
+    def _build_match_table(self) -> dict[tuple[int, int, int], float]:
+        """Solve the match chain over the set score."""
+        sets_to_win = self.sets_to_win
+        table: dict[tuple[int, int, int], float] = {}
+        for sets1 in range(sets_to_win, -1, -1):
+            for sets2 in range(sets_to_win, -1, -1):
+                for first_server in (PLAYER_1, PLAYER_2):
+                    if sets1 >= sets_to_win:
+                        value = 1.0
+                    elif sets2 >= sets_to_win:
+                        value = 0.0
+                    else:
+                        set_win = self._set_win[first_server][0]
+                        next_server = PLAYER_2 if first_server == PLAYER_1 else PLAYER_1
+                        value = (
+                            set_win * table[(sets1 + 1, sets2, next_server)]
+                            + (1.0 - set_win) * table[(sets1, sets2 + 1, next_server)]
+                        )
+                    table[(sets1, sets2, first_server)] = value
+        return table
+
+    def set_probability(self, score1: int, score2: int, first_server: int) -> float:
+        """Probability that player 1 wins the current set.
+
+        Args:
+            score1: Score of player 1
+            score2: Score of player 2
+            first_server: Who served first in this set
+
+        Returns:
+            Set win probability for player 1
+        """
+        # Long deuce: only the lead matters
+        offset = min(score1, score2) - self.deuce_threshold
+        if offset > 0:
+            score1 -= offset
+            score2 -= offset
+        size = self.size
+        if score1 >= size or score2 >= size:
+            return 1.0 if score1 > score2 else 0.0
+        return self._set_win[first_server][score1 * size + score2]
+
+    def probability(self, state: MatchState) -> float:
+        """Probability that player 1 wins the match from ``state``.
+
+        Args:
+            state: Current match state (e.g. MatchEngine.get_current_state())
+
+        Returns:
+            Match win probability for player 1 (player 2: 1 - result)
+        """
+        sets_to_win = self.sets_to_win
+        sets1 = state.sets_player1
+        sets2 = state.sets_player2
+        if sets1 >= sets_to_win:
+            return 1.0
+        if sets2 >= sets_to_win:
+            return 0.0
+
+        score1 = state.score_player1
+        score2 = state.score_player2
+        if serve_changes(score1, score2, self.rules) % 2 == 0:
+            first_server = state.server
+        else:
+            first_server = PLAYER_2 if state.server == PLAYER_1 else PLAYER_1
+        next_server = PLAYER_2 if first_server == PLAYER_1 else PLAYER_1
+
+        # Set already won (and counted) but not reset yet
+        if self._set_winner(score1, score2):
+            return self._match_win[(sets1, sets2, next_server)]
+
+        set_win = self.set_probability(score1, score2, first_server)
+        return (
+            set_win * self._match_win[(sets1 + 1, sets2, next_server)]
+            + (1.0 - set_win) * self._match_win[(sets1, sets2 + 1, next_server)]
+        )
+
+
+def get_win_probability_model(
+    serve_win_rate1: float,
+    serve_win_rate2: float,
+    sets_to_win: int,
+    rules: RulesKey = DEFAULT_RULES,
+) -> WinProbabilityModel:
+    """Get the (LRU-cached) model for a rate pair.
+
+    Args:
+        serve_win_rate1: Probability that player 1 wins a point on own serve
+        serve_win_rate2: Probability that player 2 wins a point on own serve
+        sets_to_win: Number of sets needed to win the match
+        rules: Rules tuple (see transition_table.RulesKey)
+
+    Returns:
+        Shared WinProbabilityModel instance
+    """
+    return _build_model(
+        float(serve_win_rate1), float(serve_win_rate2), sets_to_win, tuple(rules)
+    )
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def _build_model(
+    serve_win_rate1: float,
+    serve_win_rate2: float,
+    sets_to_win: int,
+    rules: RulesKey,
+) -> WinProbabilityModel:
+    """Build a model once per (rates, sets_to_win, rules)."""
+    return WinProbabilityModel(serve_win_rate1, serve_win_rate2, sets_to_win, rules)
+
+
+def match_win_probability(
+    state: MatchState,
+    sets_to_win: int,
+    serve_win_rate1: float,
+    serve_win_rate2: float,
+    rules: RulesKey = DEFAULT_RULES,
+) -> float:
+    """Probability that player 1 wins the match from ``state``.
+
+    Args:
+        state: Current match state
+        sets_to_win: Number of sets needed to win the match
+        serve_win_rate1: Probability that player 1 wins a point on own serve
+        serve_win_rate2: Probability that player 2 wins a point on own serve
+        rules: Rules tuple (see transition_table.RulesKey)
+
+    Returns:
+        Match win probability for player 1
+
+    Example:
+        >>> engine = MatchEngine(sets_to_win=3)
+        >>> match_win_probability(engine.get_current_state(), 3, 0.6, 0.5) > 0.5
+        True
+    """
+    model = get_win_probability_model(serve_win_rate1, serve_win_rate2, sets_to_win, rules)
+    return model.probability(state)
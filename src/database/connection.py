@@ -3,23 +3,43 @@ Database Connection Management
 ===============================
 
 Handles MySQL connection with retry logic and graceful degradation.
+
+mysql.connector is imported on the first connect(), not with this module,
+so starting without a database never pays for loading the driver.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import time
 
-try:
-    import mysql.connector
-    from mysql.connector import Error, MySQLConnection
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
-    MySQLConnection = None
-    Error = Exception
-    print("⚠️ mysql-connector-python not installed. Database features disabled.")
-
 from ..config import get_db_config
 
+if TYPE_CHECKING:
+    from mysql.connector import MySQLConnection
+
+# Set by load_mysql(): the driver module, its exception base class and
+# whether it is installed (None = not tried yet)
+mysql_connector = None
+Error = Exception
+MYSQL_AVAILABLE: Optional[bool] = None
+
+
+def load_mysql() -> bool:
+    """Import mysql.connector on first use.
+    
+    Returns:
+        True if the driver is installed
+    """
+    global mysql_connector, Error, MYSQL_AVAILABLE
+    if MYSQL_AVAILABLE is None:
+        try:
+            import mysql.connector as mysql_connector
+            from mysql.connector import Error
+            MYSQL_AVAILABLE = True
+        except ImportError:
+            MYSQL_AVAILABLE = False
+            print("⚠️ mysql-connector-python not installed. Database features disabled.")
+    return MYSQL_AVAILABLE
+
 
 class DatabaseConnection:
     """Manages database connection lifecycle.
@@ -45,7 +65,7 @@ class DatabaseConnection:
             max_retries: Maximum number of connection attempts
             retry_delay: Initial delay between retries (exponential backoff)
         """
-        self.connection: Optional[MySQLConnection] = None
+        self.connection: Optional["MySQLConnection"] = None
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self._is_connected = False
@@ -56,7 +76,7 @@ class DatabaseConnection:
         Returns:
             True if connected successfully, False otherwise
         """
-        if not MYSQL_AVAILABLE:
+        if not load_mysql():
             print("❌ MySQL connector not available")
             return False
         
@@ -64,7 +84,7 @@ class DatabaseConnection:
         
         for attempt in range(1, self.max_retries + 1):
             try:
-                self.connection = mysql.connector.connect(**config.to_dict())
+                self.connection = mysql_connector.connect(**config.to_dict())
                 
                 if self.connection.is_connected():
                     self._is_connected = True
@@ -13,14 +13,8 @@ Implementations:
 from typing import Protocol, List, Optional, Tuple
 from datetime import datetime
 
-try:
-    from mysql.connector import Error
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
-    Error = Exception
-
 from ..core.models import Player, Match, Tournament
+from . import connection
 from .connection import DatabaseConnection
 
 
@@ -118,7 +112,7 @@ class MySQLPlayerRepository:
             result = cursor.fetchall()
             cursor.close()
             return result
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error loading players: {e}")
             return []
     
@@ -150,7 +144,7 @@ class MySQLPlayerRepository:
             print(f"✅ New player created: {full_name}")
             return player_id
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error with player '{full_name}': {e}")
             return None
 
@@ -187,7 +181,7 @@ class MySQLMatchRepository:
             print(f"✅ Match saved: {sets_player1}-{sets_player2}")
             return True
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error saving match: {e}")
             self.db.rollback()
             return False
@@ -212,7 +206,7 @@ class MySQLMatchRepository:
             cursor.close()
             return result
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error loading matches: {e}")
             return []
 
@@ -235,7 +229,7 @@ class MySQLTournamentRepository:
             cursor.close()
             return result
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error loading tournaments: {e}")
             return []
     
@@ -254,7 +248,7 @@ class MySQLTournamentRepository:
             print(f"✅ Tournament created: {name}")
             return tournament_id
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error creating tournament: {e}")
             self.db.rollback()
             return None
@@ -287,7 +281,7 @@ class MySQLTournamentRepository:
             cursor.close()
             return result
             
-        except Error as e:
+        except connection.Error as e:
             print(f"❌ Error loading rankings: {e}")
             return []
 
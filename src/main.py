@@ -11,6 +11,15 @@ Usage:
     python -m src.main
     # or
     python src/main.py
+
+Options:
+    --profile-startup  Print the import and initialisation timeline once
+                       the database is connected (after the first frame)
+    --check-db         Test the database connection before the GUI starts
+
+Only the config is imported up front; the database layer and the GUI
+module are imported when they are needed, and mysql.connector only when
+a connection is opened.
 """
 
 import sys
@@ -20,20 +29,45 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Start of the --profile-startup timeline (and of the time to the first frame)
+from src.core.startup_profile import enable_startup_profile, mark_process_start, mark_startup
+mark_process_start()
+
 # Import configuration
 from src.config import get_app_config, get_db_config
 
-# Import database
-from src.database.connection import get_database_connection
-from src.database.repository import create_repositories
 
-# Import core (just to demonstrate it works)
-from src.core.match_engine import MatchEngine
-from src.core.constants import MatchMode, SETS_TO_WIN_MAP
+def check_database() -> None:
+    """Connect to the database and load the players (--check-db)."""
+    from src.database.connection import get_database_connection
+    from src.database.repository import create_repositories
+    
+    db = get_database_connection()
+    if db.connect():
+        print("✅ Database connected successfully!")
+        
+        # Create repositories
+        player_repo, match_repo, tournament_repo = create_repositories(db)
+        
+        # Test: Load players
+        players = player_repo.get_all()
+        print(f"📊 Found {len(players)} players in database")
+        
+    else:
+        print("⚠️  Running in offline mode (no database)")
+    print()
 
 
 def main() -> None:
     """Main application entry point."""
+    # Our options must not reach QApplication
+    profile_startup = "--profile-startup" in sys.argv
+    check_db = "--check-db" in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg not in ("--profile-startup", "--check-db")]
+    if profile_startup:
+        enable_startup_profile()
+        mark_startup("core and config imported")
+    
     print("=" * 60)
     print("TTR - Table Tennis Referee")
     print("=" * 60)
@@ -47,24 +81,12 @@ def main() -> None:
     print(f"🎨 Stylesheet: {app_config.stylesheet_path}")
     print(f"🗄️  Database: {db_config.database}@{db_config.host}")
     print()
+    mark_startup("config loaded")
     
-    # Test database connection
-    db = get_database_connection()
-    if db.connect():
-        print("✅ Database connected successfully!")
-        
-        # Create repositories
-        player_repo, match_repo, tournament_repo = create_repositories(db)
-        
-        # Test: Load players
-        players = player_repo.get_all()
-        print(f"📊 Found {len(players)} players in database")
-        
-    else:
-        print("⚠️  Running in offline mode (no database)")
-        player_repo, match_repo, tournament_repo = create_repositories(use_dummy=True)
-    
-    print()
+    # The GUI connects on its own after its first frame; testing the
+    # connection here would delay the start (up to the retry backoff)
+    if check_db:
+        check_database()
     print("=" * 60)
     print("🚧 NOTE: Full UI refactoring in progress!")
     print("   Currently using legacy ttr_gui.py")
@@ -83,6 +105,7 @@ def main() -> None:
     
     # Import and run legacy GUI
     from ttr_gui import main as legacy_main
+    mark_startup("ttr_gui imported")
     legacy_main()
 
 
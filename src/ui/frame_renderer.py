@@ -0,0 +1,538 @@
+"""
+Frame Renderer
+==============
+
+Headless scoreboard frames for livestream overlays and broadcast output.
+
+ScoreboardPainter lays out the scoreboard (names, sets, serve indicator,
+big score per player) and paints any part of it with QPainter; between
+two FrameStates only the elements whose value changed are repainted.
+ScoreboardFrameRenderer uses it to keep one QImage up to date (an
+unchanged state costs a tuple comparison and no painting), the spectator
+window to paint straight onto its screen. Digits come from the same
+glyph cache as the ScoreDisplay widget.
+
+FrameClock renders at a fixed rate from a state source and hands every
+frame to sinks:
+
+- PngSequenceSink: numbered PNG files (unchanged frames are hard links)
+- RawPipeSink: raw BGRA frames for a pipe, e.g. into ffmpeg
+- LatestFrameSink: one PNG replaced atomically on change (OBS image source)
+
+No window is needed; run it under QT_QPA_PLATFORM=offscreen:
+
+    python -m src.ui.frame_renderer --latest overlay.png
+    python -m src.ui.frame_renderer --pipe --size 1920x1080 --fps 25 | \\
+        ffmpeg -f rawvideo -pix_fmt bgra -s 1920x1080 -r 25 -i - ...
+
+The match state is read from the point journal of the scoreboard
+(APP_JOURNAL_PATH, e.g. on a network share); the file is only read again
+when its size or modification time changes.
+"""
+
+import argparse
+import contextlib
+import os
+import shutil
+import signal
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional, Union
+
+from PyQt6.QtCore import Qt, QObject, QPoint, QPointF, QRect, QRectF, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QRegion
+
+from ..core.constants import PLAYER_1, PLAYER_2
+from ..core.journal import read_journal
+from ..core.match_engine import MatchEngine
+from .widgets.score_display import DigitGlyphs, GlyphCache, get_glyph_cache
+
+PathLike = Union[str, Path]
+
+# Default frame size (Full HD) and rate
+DEFAULT_FRAME_SIZE = QSize(1920, 1080)
+DEFAULT_FPS = 25
+
+# Scoreboard colours (see styles.qss)
+BACKGROUND_COLOR = QColor("#1a1a2e")
+DIVIDER_COLOR = QColor("#0f3460")
+NAME_COLOR = QColor("#00d9ff")
+DIGIT_COLOR = QColor("#ffffff")
+
+# Layout, as shares of the frame height (top row) and half width (sets box)
+_MARGIN = 0.03
+_TOP_ROW = 0.16
+_NAME_SIZE = 0.07
+_SETS_SIZE = 0.14
+_SCORE_FILL = 0.95
+_SETS_WIDTH = 0.2
+_DIVIDER_WIDTH = 3
+
+
+@dataclass(frozen=True, slots=True)
+class FrameState:
+    """Everything a scoreboard frame shows.
+
+    Attributes:
+        player1_name: Name of player 1 (left)
+        player2_name: Name of player 2 (right)
+        score_player1: Points of player 1 in the current set
+        score_player2: Points of player 2 in the current set
+        sets_player1: Sets won by player 1
+        sets_player2: Sets won by player 2
+        server: Current server (1 or 2)
+    """
+    player1_name: str
+    player2_name: str
+    score_player1: int
+    score_player2: int
+    sets_player1: int
+    sets_player2: int
+    server: int
+
+    @classmethod
+    def from_engine(cls, engine: MatchEngine) -> "FrameState":
+        """Snapshot of a MatchEngine."""
+        return cls(
+            engine.player1_name, engine.player2_name,
+            engine.score_player1, engine.score_player2,
+            engine.sets_player1, engine.sets_player2,
+            engine.server,
+        )
+
+    def side(self, player: int) -> tuple[str, int, int, bool]:
+        """(name, score, sets, serving) of ``player``."""
+        if player == PLAYER_1:
+            return self.player1_name, self.score_player1, self.sets_player1, self.server == PLAYER_1
+        return self.player2_name, self.score_player2, self.sets_player2, self.server == PLAYER_2
+
+    def swapped(self) -> "FrameState":
+        """The same state with the players on the other sides."""
+        return FrameState(
+            self.player2_name, self.player1_name,
+            self.score_player2, self.score_player1,
+            self.sets_player2, self.sets_player1,
+            PLAYER_1 if self.server == PLAYER_2 else PLAYER_2,
+        )
+
+
+class _HalfLayout:
+    """Element rects of one player half."""
+
+    __slots__ = ('name', 'serve', 'sets', 'score')
+
+    def __init__(self, half: QRect, top: int, sets_left: bool) -> None:
+        sets_width = round(half.width() * _SETS_WIDTH)
+        row = QRect(half.x(), half.y(), half.width(), top)
+        if sets_left:
+            self.sets = QRect(row.x(), row.y(), sets_width, top)
+            rest = row.adjusted(sets_width, 0, 0, 0)
+        else:
+            self.sets = QRect(row.right() - sets_width + 1, row.y(), sets_width, top)
+            rest = row.adjusted(0, 0, -sets_width, 0)
+        self.serve = QRect(rest.right() - top // 2 + 1, rest.y(), top // 2, top) if sets_left \
+            else QRect(rest.x(), rest.y(), top // 2, top)
+        self.name = rest.adjusted(0, 0, -top // 2, 0) if sets_left else rest.adjusted(top // 2, 0, 0, 0)
+        self.score = QRect(half.x(), half.y() + top, half.width(), half.height() - top)
+
+
+class ScoreboardPainter:
+    """Scoreboard layout for one size, painted onto any QPainter.
+
+    Used by ScoreboardFrameRenderer (into a QImage) and by the spectator
+    window (straight onto the screen, without an intermediate image).
+
+    Example:
+        >>> board = ScoreboardPainter(QSize(1280, 720))
+        >>> dirty = board.changed(last_state, state)
+        >>> board.paint(painter, dirty, state)
+    """
+
+    def __init__(self, size: QSize, cache: Optional[GlyphCache] = None,
+                 device_pixel_ratio: float = 1.0) -> None:
+        """Lay out the elements and fetch the digit glyphs.
+
+        Args:
+            size: Painted area in logical pixels
+            cache: Glyph cache (default: the one shared with ScoreDisplay)
+            device_pixel_ratio: Pixel ratio of the target (sharp glyphs on HiDPI)
+        """
+        self.rect = QRect(QPoint(0, 0), size)
+        self._cache = cache if cache is not None else get_glyph_cache()
+        self._ratio = device_pixel_ratio
+
+        width, height = size.width(), size.height()
+        margin = round(height * _MARGIN)
+        inner = self.rect.adjusted(margin, margin, -margin, -margin)
+        half_width = (inner.width() - _DIVIDER_WIDTH) // 2
+        top = round(height * _TOP_ROW)
+        left = QRect(inner.x(), inner.y(), half_width, inner.height())
+        right = QRect(inner.right() - half_width + 1, inner.y(), half_width, inner.height())
+        self.divider = QRect(left.right() + 1, inner.y(), right.x() - left.right() - 1, inner.height())
+        self._halves = {PLAYER_1: _HalfLayout(left, top, True), PLAYER_2: _HalfLayout(right, top, False)}
+
+        self._name_font = QFont()
+        self._name_font.setPixelSize(max(1, round(height * _NAME_SIZE)))
+        self._name_font.setBold(True)
+        self._sets_glyphs = self._glyphs(round(height * _SETS_SIZE), self._halves[PLAYER_1].sets.size())
+        score_box = self._halves[PLAYER_1].score.size()
+        self._score_glyphs = self._glyphs(round(score_box.height() * _SCORE_FILL), score_box)
+
+    def _glyphs(self, pixel_size: int, box: QSize) -> DigitGlyphs:
+        """Bold digit glyphs of about ``pixel_size``, shrunk until "00" fits ``box``."""
+        font = QFont()
+        font.setBold(True)
+        font.setPixelSize(max(1, pixel_size))
+        glyphs = self._cache.get(font, DIGIT_COLOR, self._ratio)
+        scale = min(box.height() / glyphs.height, box.width() / (2 * glyphs.advances["0"]))
+        if scale < 1.0:
+            font.setPixelSize(max(1, int(pixel_size * scale)))
+            glyphs = self._cache.get(font, DIGIT_COLOR, self._ratio)
+        return glyphs
+
+    def changed(self, last: Optional[FrameState], state: FrameState) -> QRegion:
+        """Area to repaint to go from ``last`` (None = nothing painted yet) to ``state``."""
+        if last is None:
+            return QRegion(self.rect)
+        dirty = QRegion()
+        for player in (PLAYER_1, PLAYER_2):
+            dirty += self._changed(player, last.side(player), state.side(player))
+        return dirty
+
+    def _changed(self, player: int, old: tuple, new: tuple) -> QRegion:
+        """Area of the elements that differ between two (name, score, sets, serving)."""
+        layout = self._halves[player]
+        region = QRegion()
+        if old[0] != new[0]:
+            region += layout.name
+        if old[1] != new[1]:
+            region += self._digits_rect(self._score_glyphs, str(old[1]), layout.score)
+            region += self._digits_rect(self._score_glyphs, str(new[1]), layout.score)
+        if old[2] != new[2]:
+            region += layout.sets
+        if old[3] != new[3]:
+            region += layout.serve
+        return region
+
+    def paint(self, painter: QPainter, region: QRegion, state: FrameState,
+              background: QColor = BACKGROUND_COLOR) -> None:
+        """Paint ``region`` of the scoreboard showing ``state``.
+
+        The background is written as is (CompositionMode_Source), so a
+        transparent colour clears the area.
+        """
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setClipRegion(region)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(region.boundingRect(), background)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        if region.intersects(self.divider):
+            painter.fillRect(self.divider, DIVIDER_COLOR)
+        for player in (PLAYER_1, PLAYER_2):
+            self._paint_half(painter, region, self._halves[player], state.side(player))
+
+    @staticmethod
+    def _digits_rect(glyphs: DigitGlyphs, text: str, box: QRect) -> QRect:
+        """Area covered by ``text`` centred in ``box``."""
+        width = sum(glyphs.advances.get(char, 0.0) for char in text)
+        return QRectF(
+            box.x() + (box.width() - width) / 2, box.y() + (box.height() - glyphs.height) / 2,
+            width, glyphs.height,
+        ).toAlignedRect()
+
+    def _paint_half(self, painter: QPainter, dirty: QRegion, layout: _HalfLayout,
+                    side: tuple[str, int, int, bool]) -> None:
+        name, score, sets, serving = side
+        if dirty.intersects(layout.name):
+            painter.setFont(self._name_font)
+            painter.setPen(NAME_COLOR)
+            text = painter.fontMetrics().elidedText(name, Qt.TextElideMode.ElideRight, layout.name.width())
+            painter.drawText(layout.name, Qt.AlignmentFlag.AlignCenter, text)
+        if serving and dirty.intersects(layout.serve):
+            radius = layout.serve.width() * 0.2
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(DIGIT_COLOR)
+            painter.drawEllipse(QPointF(layout.serve.center()), radius, radius)
+        if dirty.intersects(layout.sets):
+            self._paint_digits(painter, self._sets_glyphs, str(sets), layout.sets)
+        if dirty.intersects(layout.score):
+            self._paint_digits(painter, self._score_glyphs, str(score), layout.score)
+
+    def _paint_digits(self, painter: QPainter, glyphs: DigitGlyphs, text: str, box: QRect) -> None:
+        rect = self._digits_rect(glyphs, text, box)
+        x = float(rect.x())
+        for char in text:
+            painter.drawPixmap(QPointF(x, rect.y()), glyphs.pixmaps[char])
+            x += glyphs.advances[char]
+
+
+class ScoreboardFrameRenderer:
+    """Paints scoreboard frames into a QImage, only where the state changed.
+
+    Attributes:
+        image: The frame (Format_ARGB32_Premultiplied)
+        state: State of the current frame (None before the first render)
+        frames_painted: Renders that painted something
+        board: Layout and painting of the frame
+
+    Example:
+        >>> renderer = ScoreboardFrameRenderer(QSize(1280, 720))
+        >>> dirty = renderer.render(FrameState.from_engine(engine))
+        >>> renderer.image.save("frame.png")
+    """
+
+    def __init__(self, size: QSize = DEFAULT_FRAME_SIZE,
+                 background: QColor = BACKGROUND_COLOR,
+                 cache: Optional[GlyphCache] = None) -> None:
+        """Create the renderer (needs a QGuiApplication).
+
+        Args:
+            size: Frame size in pixels
+            background: Background; a transparent colour gives an overlay
+                with alpha channel
+            cache: Glyph cache (default: the one shared with ScoreDisplay)
+        """
+        self.image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        self.background = background
+        self.state: Optional[FrameState] = None
+        self.frames_painted = 0
+        self.board = ScoreboardPainter(size, cache)
+
+    def render(self, state: FrameState) -> QRegion:
+        """Bring the frame up to ``state``.
+
+        Returns:
+            The repainted region (empty if nothing changed)
+        """
+        last = self.state
+        if last == state:
+            return QRegion()
+
+        dirty = self.board.changed(last, state)
+        painter = QPainter(self.image)
+        self.board.paint(painter, dirty, state, self.background)
+        painter.end()
+
+        self.state = state
+        self.frames_painted += 1
+        return dirty
+
+
+# ==================== Sinks ====================
+
+class PngSequenceSink:
+    """Numbered PNG files ``<prefix>000000.png``, one per frame.
+
+    Unchanged frames are hard links to the previous file (a copy where
+    the file system has no hard links), so they cost no encoding.
+    """
+
+    def __init__(self, directory: PathLike, prefix: str = "frame_") -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self._last: Optional[Path] = None
+
+    def write(self, image: QImage, index: int, changed: bool) -> None:
+        path = self.directory / f"{self.prefix}{index:06d}.png"
+        if changed or self._last is None:
+            image.save(str(path), "PNG")
+        else:
+            try:
+                os.link(self._last, path)
+            except OSError:
+                shutil.copyfile(self._last, path)
+        self._last = path
+
+    def close(self) -> None:
+        pass
+
+
+class RawPipeSink:
+    """Raw frames (BGRA, straight alpha, no padding) written to a stream.
+
+    Every frame is written, so a reader like ffmpeg
+    (``-f rawvideo -pix_fmt bgra -s WxH -r FPS -i -``) gets a constant
+    frame rate; the bytes are only converted again after a change.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self._frame: Optional[bytes] = None
+
+    def write(self, image: QImage, index: int, changed: bool) -> None:
+        if changed or self._frame is None:
+            frame = image.convertToFormat(QImage.Format.Format_ARGB32)
+            self._frame = frame.constBits().asstring(frame.sizeInBytes())
+        self.stream.write(self._frame)
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class LatestFrameSink:
+    """Single PNG holding the latest frame, replaced atomically on change."""
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, image: QImage, index: int, changed: bool) -> None:
+        if not changed and self.path.exists():
+            return
+        # Readers (OBS) never see a half-written file
+        temp = self.path.with_name(f".{self.path.name}.tmp")
+        image.save(str(temp), "PNG")
+        os.replace(temp, self.path)
+
+    def close(self) -> None:
+        pass
+
+
+# ==================== Fixed-rate output ====================
+
+class FrameClock(QObject):
+    """Renders ``source()`` at a fixed rate and passes each frame to the sinks.
+
+    Signals:
+        failed: A sink could not write (message); the clock has stopped
+
+    Example:
+        >>> clock = FrameClock(renderer, lambda: FrameState.from_engine(engine),
+        ...                    [LatestFrameSink("overlay.png")], fps=10)
+        >>> clock.start()
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, renderer: ScoreboardFrameRenderer,
+                 source: Callable[[], Optional[FrameState]],
+                 sinks: Iterable, fps: float = DEFAULT_FPS,
+                 parent: Optional[QObject] = None) -> None:
+        """Create the (stopped) clock.
+
+        Args:
+            renderer: Frame renderer
+            source: Current state; None keeps the previous frame
+            sinks: Objects with write(image, index, changed) and close()
+            fps: Frames per second
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.renderer = renderer
+        self.source = source
+        self.sinks = list(sinks)
+        self.index = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(max(1, round(1000 / fps)))
+        self._timer.timeout.connect(self.tick)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop the clock and close the sinks."""
+        self._timer.stop()
+        for sink in self.sinks:
+            sink.close()
+
+    def tick(self) -> None:
+        """Render and write one frame."""
+        state = self.source()
+        changed = state is not None and not self.renderer.render(state).isEmpty()
+        if self.renderer.state is None:
+            return  # nothing to show yet
+        try:
+            for sink in self.sinks:
+                sink.write(self.renderer.image, self.index, changed)
+        except OSError as e:  # disk full, reader of the pipe gone, ...
+            self._timer.stop()
+            self.failed.emit(str(e))
+            return
+        self.index += 1
+
+
+class JournalSource:
+    """State source reading the scoreboard's point journal.
+
+    The journal is parsed again only when its size or modification time
+    changed; while it is missing (between matches) None keeps the last frame.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        self._stamp: Optional[tuple[int, int]] = None
+        self._state: Optional[FrameState] = None
+
+    def __call__(self) -> Optional[FrameState]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return self._state
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if stamp != self._stamp:
+            self._stamp = stamp
+            contents = read_journal(self.path)
+            if contents is not None:
+                self._state = FrameState.from_engine(contents.to_engine())
+        return self._state
+
+
+def _parse_size(text: str) -> QSize:
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text} (expected WIDTHxHEIGHT)")
+    return QSize(width, height)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point (python -m src.ui.frame_renderer)."""
+    # Config messages must not end up in the --pipe output
+    with contextlib.redirect_stdout(sys.stderr):
+        from ..config import get_app_config
+        journal_path = get_app_config().journal_path
+
+    parser = argparse.ArgumentParser(description="Headless scoreboard frames for streaming")
+    parser.add_argument("--journal", type=Path, default=journal_path,
+                        help="point journal of the scoreboard (default: APP_JOURNAL_PATH)")
+    parser.add_argument("--size", type=_parse_size, default=DEFAULT_FRAME_SIZE, help="WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS)
+    parser.add_argument("--transparent", action="store_true", help="transparent background")
+    parser.add_argument("--png-dir", type=Path, help="write a numbered PNG sequence")
+    parser.add_argument("--pipe", action="store_true", help="write raw BGRA frames to stdout")
+    parser.add_argument("--latest", type=Path, help="keep the latest frame in this PNG file")
+    args = parser.parse_args(argv)
+
+    sinks = []
+    if args.png_dir:
+        sinks.append(PngSequenceSink(args.png_dir))
+    if args.pipe:
+        sinks.append(RawPipeSink(sys.stdout.buffer))
+    if args.latest:
+        sinks.append(LatestFrameSink(args.latest))
+    if not sinks:
+        parser.error("no output: use --png-dir, --pipe and/or --latest")
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication(sys.argv[:1])
+    background = QColor(Qt.GlobalColor.transparent) if args.transparent else BACKGROUND_COLOR
+    renderer = ScoreboardFrameRenderer(args.size, background)
+    clock = FrameClock(renderer, JournalSource(args.journal), sinks, args.fps)
+    clock.failed.connect(lambda message: (print(f"❌ Output failed: {message}", file=sys.stderr), app.exit(1)))
+    # Handlers run between ticks (the clock wakes the interpreter)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    clock.start()
+    print(f"🎥 {args.size.width()}x{args.size.height()} @ {args.fps:g} fps from {args.journal}", file=sys.stderr)
+    try:
+        return app.exec()
+    finally:
+        clock.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
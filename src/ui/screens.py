@@ -0,0 +1,36 @@
+"""
+Screens
+=======
+
+Choice of the monitor for the spectator window (APP_SPECTATOR_SCREEN).
+
+Kept apart from the window itself, so that the main window can decide at
+startup without importing the window and its renderer.
+"""
+
+from typing import Optional
+
+from PyQt6.QtGui import QGuiApplication, QScreen
+
+
+def spectator_screen(setting: str) -> Optional[QScreen]:
+    """Pick the screen for the spectator window.
+
+    Args:
+        setting: "auto" (second screen if there is one), "off", or a screen index
+
+    Returns:
+        The screen, or None if no spectator window should open
+    """
+    screens = QGuiApplication.screens()
+    setting = setting.strip().lower()
+    if setting == "off":
+        return None
+    if setting == "auto":
+        return screens[1] if len(screens) > 1 else None
+    try:
+        index = int(setting)
+    except ValueError:
+        print(f"⚠️ Invalid APP_SPECTATOR_SCREEN value: {setting}")
+        return None
+    return screens[index] if 0 <= index < len(screens) else None
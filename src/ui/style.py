@@ -0,0 +1,41 @@
+"""
+Application Style
+=================
+
+The app has exactly one stylesheet, src/ui/resources/styles.qss. It is
+set once on the QApplication (and parsed once); widgets pick their look
+with object names and switch variants with dynamic properties instead of
+calling setStyleSheet() on themselves.
+"""
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt
+
+from ..config import get_app_config
+
+
+def load_stylesheet() -> str:
+    """Read the application stylesheet (AppConfig.stylesheet_path).
+
+    Example:
+        >>> app.setStyleSheet(load_stylesheet())
+    """
+    return get_app_config().stylesheet_path.read_text(encoding="utf-8")
+
+
+def set_style_state(widget: QWidget, name: str, value: bool) -> None:
+    """Switch a style variant through a dynamic property (e.g. [active="true"]).
+
+    Only this widget is polished again - no new stylesheet that Qt would
+    have to parse. Before the widget's first polish the property is enough.
+
+    Args:
+        widget: Widget whose variant changes
+        name: Property used in styles.qss
+        value: New value
+    """
+    widget.setProperty(name, value)
+    if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        widget.update()
@@ -110,7 +110,6 @@ class ConfettiOverlay(QWidget):
         # Transparent background
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self.setStyleSheet("background: transparent;")
     
     def start_confetti(self) -> None:
         """Start the confetti explosion animation."""
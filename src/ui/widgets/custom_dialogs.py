@@ -3,6 +3,9 @@ Custom Dialog Functions
 ========================
 
 Frameless, styled dialog boxes for TTR application.
+
+The look comes from the application stylesheet (src/ui/resources/styles.qss,
+QDialog#popupDialog and friends); the dialogs only set object names.
 """
 
 from typing import Optional
@@ -41,24 +44,12 @@ def show_custom_confirm_dialog(
     layout.setSpacing(20)
     layout.setContentsMargins(30, 30, 30, 40)
     
-    # Dialog style
-    dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a2e;
-            border: 3px solid #00d9ff;
-            border-radius: 15px;
-        }
-    """)
+    # Dialog style (QDialog#popupDialog in styles.qss)
+    dialog.setObjectName("popupDialog")
     
     # Text label
     lbl_text = QLabel(text)
-    lbl_text.setStyleSheet("""
-        color: white;
-        font-size: 22px;
-        font-weight: bold;
-        background: transparent;
-        border: none;
-    """)
+    lbl_text.setObjectName("popupText")
     lbl_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
     lbl_text.setWordWrap(True)
     layout.addWidget(lbl_text)
@@ -71,52 +62,20 @@ def show_custom_confirm_dialog(
     # Yes button (blue)
     btn_yes = QPushButton("Ja")
     btn_yes.setCursor(Qt.CursorShape.PointingHandCursor)
-    btn_yes.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #00d9ff;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-        }
-    """)
     btn_yes.clicked.connect(dialog.accept)
     btn_layout.addWidget(btn_yes)
     
     # No button (red)
     btn_no = QPushButton("Nein")
     btn_no.setCursor(Qt.CursorShape.PointingHandCursor)
-    btn_no.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #e94560;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #e94560;
-        }
-    """)
+    btn_no.setObjectName("popupCancel")
     btn_no.clicked.connect(dialog.reject)
     btn_layout.addWidget(btn_no)
     
     # Center buttons
     wrapper = QWidget()
     wrapper.setLayout(btn_layout)
-    wrapper.setStyleSheet("background: transparent; border: none;")
+    wrapper.setObjectName("popupButtons")
     layout.addWidget(wrapper, 0, Qt.AlignmentFlag.AlignCenter)
     
     return dialog.exec() == QDialog.DialogCode.Accepted
@@ -154,40 +113,12 @@ def show_custom_info_dialog(
     layout.setSpacing(20)
     layout.setContentsMargins(30, 30, 30, 40)
     
-    # Dialog style
-    dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a2e;
-            border: 3px solid #00d9ff;
-            border-radius: 15px;
-        }
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 2px solid #0f3460;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-            border-color: #00d9ff;
-        }
-    """)
+    # Dialog style (QDialog#popupDialog in styles.qss)
+    dialog.setObjectName("popupDialog")
     
     # Text label
     lbl_text = QLabel(text)
-    lbl_text.setStyleSheet("""
-        color: white;
-        font-size: 22px;
-        font-weight: bold;
-        background: transparent;
-        border: none;
-    """)
+    lbl_text.setObjectName("popupText")
     lbl_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
     lbl_text.setWordWrap(True)
     layout.addWidget(lbl_text)
@@ -200,23 +131,6 @@ def show_custom_info_dialog(
     # OK button
     btn_ok = QPushButton("OK")
     btn_ok.setCursor(Qt.CursorShape.PointingHandCursor)
-    btn_ok.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #00d9ff;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-        }
-    """)
     btn_ok.clicked.connect(dialog.accept)
     btn_layout.addWidget(btn_ok)
     
@@ -224,29 +138,14 @@ def show_custom_info_dialog(
     if cancel_text:
         btn_cancel = QPushButton(cancel_text)
         btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #16213e;
-                color: white;
-                border: 3px solid #e94560;
-                border-radius: 10px;
-                font-size: 22px;
-                font-weight: bold;
-                min-width: 140px;
-                min-height: 60px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e94560;
-            }
-        """)
+        btn_cancel.setObjectName("popupCancel")
         btn_cancel.clicked.connect(dialog.reject)
         btn_layout.addWidget(btn_cancel)
     
     # Center buttons
     wrapper = QWidget()
     wrapper.setLayout(btn_layout)
-    wrapper.setStyleSheet("background: transparent; border: none;")
+    wrapper.setObjectName("popupButtons")
     layout.addWidget(wrapper, 0, Qt.AlignmentFlag.AlignCenter)
     
     return dialog.exec() == QDialog.DialogCode.Accepted
@@ -0,0 +1,150 @@
+"""
+Performance HUD Widget
+======================
+
+On-screen diagnostics for kiosk PCs (APP_DEBUG): frame times, QTimer
+jitter, paint time per watched widget, last database latency, Python heap
+size and garbage collector pauses.
+
+Nothing is hooked while the app runs without APP_DEBUG. With the HUD
+hidden (F12 in the main window) the collector is disabled again: timers
+stop, the GC callback is removed and the paint hooks only check
+get_perf_stats() before returning.
+"""
+
+import time
+from typing import Optional
+
+from PyQt6.QtWidgets import QLabel, QWidget
+from PyQt6.QtCore import Qt, QEvent, QObject, QTimer
+
+from ...core.perf_stats import PerfStats, enable_perf_stats, disable_perf_stats, get_perf_stats
+
+# Text refresh interval of the HUD
+HUD_REFRESH_MS = 250
+# Interval of the probe timer used to measure event-loop jitter (one 60 Hz frame)
+JITTER_PROBE_MS = 16
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "   -   " if seconds is None else f"{seconds * 1000:6.1f}"
+
+
+class PerfHud(QLabel):
+    """Performance overlay in the top left corner of a window.
+
+    Example:
+        >>> hud = PerfHud(main_window)
+        >>> hud.watch_paint(score_display, "score1")
+        >>> hud.set_active(True)
+    """
+
+    def __init__(self, window: QWidget) -> None:
+        """Create the (hidden) HUD.
+
+        Args:
+            window: Top-level window to cover; its repaints are the frames
+        """
+        super().__init__(window)
+        self.setObjectName("perfHud")
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self.window_widget = window
+        self.stats: Optional[PerfStats] = None
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(HUD_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._probe_timer.setInterval(JITTER_PROBE_MS)
+        self._probe_timer.timeout.connect(self._on_probe)
+        self._last_probe = 0.0
+
+        self._frames_seen = 0
+        self._last_refresh = 0.0
+        self._fps = 0.0
+
+        self.hide()
+
+    @staticmethod
+    def watch_paint(widget: QWidget, name: str) -> None:
+        """Record the paint time of ``widget`` as metric "paint <name>"."""
+        paint = widget.paintEvent
+        metric = f"paint {name}"
+
+        def timed_paint(event):
+            perf = get_perf_stats()
+            if perf is None:
+                return paint(event)
+            start = time.perf_counter()
+            paint(event)
+            perf.record(metric, time.perf_counter() - start)
+
+        widget.paintEvent = timed_paint
+
+    def set_active(self, active: bool) -> None:
+        """Show the HUD and start collecting, or hide it and stop."""
+        if active:
+            self.stats = enable_perf_stats()
+            self._last_probe = self._last_refresh = time.perf_counter()
+            self._frames_seen = self.stats.metric("frame").count
+            self.window_widget.installEventFilter(self)
+            self._probe_timer.start()
+            self._refresh_timer.start()
+            self.refresh()
+            self.show()
+        else:
+            self._probe_timer.stop()
+            self._refresh_timer.stop()
+            self.window_widget.removeEventFilter(self)
+            self.stats = None
+            disable_perf_stats()
+            self.hide()
+
+    def toggle(self) -> None:
+        self.set_active(self.stats is None)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        # Frame time: the window's UpdateRequest paints all dirty widgets.
+        # Deliver it here to time it; returning True stops a second delivery.
+        if watched is self.window_widget and event.type() == QEvent.Type.UpdateRequest:
+            start = time.perf_counter()
+            watched.event(event)
+            self.stats.record("frame", time.perf_counter() - start)
+            return True
+        return super().eventFilter(watched, event)
+
+    def _on_probe(self) -> None:
+        now = time.perf_counter()
+        self.stats.record("timer jitter", abs(now - self._last_probe - JITTER_PROBE_MS / 1000))
+        self._last_probe = now
+
+    def refresh(self) -> None:
+        """Redraw the HUD text."""
+        stats = self.stats
+        if stats is None:
+            return
+
+        now = time.perf_counter()
+        frames = stats.metric("frame")
+        if now > self._last_refresh:
+            self._fps = (frames.count - self._frames_seen) / (now - self._last_refresh)
+        self._frames_seen = frames.count
+        self._last_refresh = now
+
+        lines = [f"{'(ms)':<16}   last    mean     max"]
+        for name, stat in stats.metrics.items():
+            lines.append(f"{name:<16} {_ms(stat.last)}  {_ms(stat.mean())}  {_ms(stat.max())}")
+        lines.append(f"{'gc pause':<16} {_ms(stats.gc_pauses.last)}  "
+                     f"{_ms(stats.gc_pauses.mean())}  {_ms(stats.gc_pauses.max())}")
+        gen0, gen1, gen2 = stats.gc_collections
+        lines.append(f"{'gc runs':<16} gen0 {gen0}  gen1 {gen1}  gen2 {gen2}")
+        lines.append(f"{'heap':<16} {stats.heap_blocks():,} blocks")
+        lines.append(f"{'fps':<16} {self._fps:5.1f}")
+
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.move(10, 10)
+        self.raise_()
@@ -0,0 +1,150 @@
+"""
+Result Overlay Widget
+=====================
+
+Non-modal "set won" / "match won" popup drawn on top of its parent page.
+
+The old popup built a new frameless QDialog (with its stylesheets) for
+every set and blocked in a nested ``exec()`` event loop until it was
+closed. The overlay is built once, shown with show_result()
+and answered through the ``confirmed`` / ``cancelled`` signals, so the
+caller returns immediately and confetti and timers keep running in the
+normal event loop.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget, QFrame, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
+from PyQt6.QtCore import Qt, QEvent, QObject, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+
+# Dimmed backdrop over the page (confetti stays visible underneath)
+BACKDROP_COLOR = QColor(0, 0, 0, 110)
+
+
+class ResultOverlay(QWidget):
+    """Pre-built popup card covering its parent widget.
+
+    The overlay follows the size of its parent and swallows all mouse
+    input while visible, so the page underneath cannot be tapped.
+    Return/Enter confirms, Escape cancels.
+
+    Signals:
+        confirmed: OK was pressed
+        cancelled: The cancel button was pressed
+
+    Example:
+        >>> overlay = ResultOverlay(page)
+        >>> overlay.confirmed.connect(page.on_result_confirmed)
+        >>> overlay.show_result("Satz gewonnen!", "Anna gewinnt den Satz!", "Zurück")
+    """
+
+    confirmed = pyqtSignal()
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent: QWidget) -> None:
+        """Build the (hidden) overlay.
+
+        Args:
+            parent: Page to cover
+        """
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+        self.card = QFrame(self)
+        self.card.setObjectName("resultCard")  # styled by QFrame#resultCard in styles.qss
+
+        card_layout = QVBoxLayout(self.card)
+        card_layout.setSpacing(20)
+        card_layout.setContentsMargins(30, 30, 30, 40)
+
+        self.lbl_title = QLabel()
+        self.lbl_title.setObjectName("resultTitle")
+        self.lbl_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card_layout.addWidget(self.lbl_title)
+
+        self.lbl_text = QLabel()
+        self.lbl_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_text.setWordWrap(True)
+        card_layout.addWidget(self.lbl_text)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.setSpacing(20)
+        btn_layout.setContentsMargins(10, 10, 10, 10)
+
+        self.btn_confirm = QPushButton("OK")
+        self.btn_confirm.setObjectName("resultConfirm")
+        self.btn_confirm.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_confirm.clicked.connect(self.confirm)
+        btn_layout.addWidget(self.btn_confirm)
+
+        self.btn_cancel = QPushButton()
+        self.btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_cancel.clicked.connect(self.cancel)
+        btn_layout.addWidget(self.btn_cancel)
+
+        card_layout.addLayout(btn_layout)
+
+        parent.installEventFilter(self)
+        self.hide()
+
+    def show_result(self, title: str, text: str, cancel_text: Optional[str] = None) -> None:
+        """Show the overlay and return immediately.
+
+        Args:
+            title: Heading, e.g. "Satz gewonnen!"
+            text: Message below the heading
+            cancel_text: Label of the cancel button (None hides it)
+        """
+        self.lbl_title.setText(title)
+        self.lbl_text.setText(text)
+        self.btn_cancel.setText(cancel_text or "")
+        self.btn_cancel.setVisible(bool(cancel_text))
+
+        self.setGeometry(self.parentWidget().rect())
+        self._center_card()
+        self.raise_()
+        self.show()
+        self.setFocus(Qt.FocusReason.PopupFocusReason)
+
+    def confirm(self) -> None:
+        """Hide the overlay and emit ``confirmed``."""
+        if self.isVisible():
+            self.hide()
+            self.confirmed.emit()
+
+    def cancel(self) -> None:
+        """Hide the overlay and emit ``cancelled``."""
+        if self.isVisible():
+            self.hide()
+            self.cancelled.emit()
+
+    def _center_card(self) -> None:
+        self.card.adjustSize()
+        card = self.card.rect()
+        card.moveCenter(self.rect().center())
+        self.card.setGeometry(card)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self.parentWidget() and event.type() == QEvent.Type.Resize and self.isVisible():
+            self.setGeometry(watched.rect())
+            self._center_card()
+        return super().eventFilter(watched, event)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), BACKDROP_COLOR)
+        painter.end()
+
+    def mousePressEvent(self, event) -> None:
+        # Taps on the backdrop must not reach the scoreboard
+        event.accept()
+
+    def keyPressEvent(self, event) -> None:
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.confirm()
+        elif event.key() == Qt.Key.Key_Escape and self.btn_cancel.isVisible():
+            self.cancel()
+        else:
+            super().keyPressEvent(event)
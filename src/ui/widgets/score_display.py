@@ -0,0 +1,238 @@
+"""
+Score Display Widget
+====================
+
+Lightweight widget for the huge scoreboard numbers, painted from a cache
+of pre-rendered digit pixmaps.
+
+A QLabel rasterizes its glyphs again on every text change. Here the ten
+digits are rendered once per (font, pixel size, colour, device pixel
+ratio) into pixmaps; a score change only blits two or three of them.
+The glyphs are rebuilt only when that key changes, i.e. on resize (the
+font is scaled down to fit), on a font/style/palette change (theme) or
+when the window moves to a screen with another pixel ratio.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QEvent, QPointF, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPalette, QPixmap
+
+# Glyph sets kept in the shared cache (both scores, a few recent sizes)
+GLYPH_CACHE_SIZE = 16
+
+# Share of the widget height the digits may use
+_HEIGHT_FILL = 0.95
+
+GlyphKey = Tuple[str, int, int, float]
+
+
+class DigitGlyphs:
+    """Pre-rendered pixmaps of the digits 0-9 for one font and colour.
+
+    Attributes:
+        pixmaps: Pixmap per digit character
+        advances: Horizontal advance per digit in logical pixels
+        height: Line height in logical pixels
+    """
+
+    DIGITS = "0123456789"
+
+    def __init__(self, font: QFont, color: QColor, device_pixel_ratio: float) -> None:
+        """Render all digits.
+
+        Args:
+            font: Font with pixel size set
+            color: Text colour
+            device_pixel_ratio: Pixel ratio of the target screen
+        """
+        metrics = QFontMetricsF(font)
+        self.height = metrics.height()
+        self.advances: Dict[str, float] = {}
+        self.pixmaps: Dict[str, QPixmap] = {}
+
+        for digit in self.DIGITS:
+            advance = metrics.horizontalAdvance(digit)
+            pixmap = QPixmap(
+                max(1, round(advance * device_pixel_ratio)),
+                max(1, round(self.height * device_pixel_ratio)),
+            )
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(QPointF(0, metrics.ascent()), digit)
+            painter.end()
+
+            self.advances[digit] = advance
+            self.pixmaps[digit] = pixmap
+
+
+class GlyphCache:
+    """LRU cache of DigitGlyphs, shared by all ScoreDisplay widgets."""
+
+    def __init__(self, max_entries: int = GLYPH_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[GlyphKey, DigitGlyphs]" = OrderedDict()
+        self.builds = 0
+
+    def get(self, font: QFont, color: QColor, device_pixel_ratio: float) -> DigitGlyphs:
+        """Get (or render) the glyphs for a font, colour and pixel ratio."""
+        key = (font.key(), font.pixelSize(), color.rgba(), device_pixel_ratio)
+        glyphs = self._entries.get(key)
+        if glyphs is not None:
+            self._entries.move_to_end(key)
+            return glyphs
+
+        glyphs = DigitGlyphs(font, color, device_pixel_ratio)
+        self.builds += 1
+        self._entries[key] = glyphs
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return glyphs
+
+    def clear(self) -> None:
+        """Drop all glyphs."""
+        self._entries.clear()
+
+
+_shared_cache = GlyphCache()
+
+
+def get_glyph_cache() -> GlyphCache:
+    """Get the glyph cache shared by all ScoreDisplay widgets."""
+    return _shared_cache
+
+
+class ScoreDisplay(QWidget):
+    """Centered score number painted from cached digit pixmaps.
+
+    Font and colour come from the widget font and palette, so it is styled
+    like a QLabel (e.g. ``ScoreDisplay#scoreBig { font-size: 540px; }``).
+    The font is scaled down when the number would not fit.
+
+    Signals:
+        painted: Emitted after every paint (input-to-paint latency)
+
+    Example:
+        >>> score = ScoreDisplay("0")
+        >>> score.setObjectName("scoreBig")
+        >>> score.setText("11")
+    """
+
+    painted = pyqtSignal()
+
+    # Events after which the glyphs must be looked up again
+    _THEME_EVENTS = (
+        QEvent.Type.FontChange,
+        QEvent.Type.PaletteChange,
+        QEvent.Type.StyleChange,
+    )
+
+    def __init__(self, text: str = "0", parent: Optional[QWidget] = None,
+                 cache: Optional[GlyphCache] = None) -> None:
+        """Create the widget.
+
+        Args:
+            text: Initial text (digits)
+            parent: Parent widget
+            cache: Glyph cache (default: shared cache)
+        """
+        super().__init__(parent)
+        self._text = text
+        self._cache = cache if cache is not None else _shared_cache
+        self._glyphs: Optional[DigitGlyphs] = None
+        self._glyphs_ratio = 0.0
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def text(self) -> str:
+        """Displayed text."""
+        return self._text
+
+    def setText(self, text: str) -> None:
+        """Set the displayed text (repaints only the area of the old and new number)."""
+        if text == self._text:
+            return
+        old_rect = self._text_rect(self._text)
+        self._text = text
+        new_rect = self._text_rect(text)
+        if old_rect is None or new_rect is None:
+            self.update()
+        else:
+            self.update(old_rect.united(new_rect))
+
+    def sizeHint(self) -> QSize:
+        return QSize(200, 200)
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(10, 10)
+
+    def resizeEvent(self, event) -> None:
+        self._glyphs = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event) -> None:
+        if event.type() in self._THEME_EVENTS:
+            self._glyphs = None
+            self.update()
+        super().changeEvent(event)
+
+    def glyphs(self) -> DigitGlyphs:
+        """Glyphs for the current size, theme and pixel ratio."""
+        ratio = self.devicePixelRatioF()
+        if self._glyphs is None or ratio != self._glyphs_ratio:
+            color = self.palette().color(QPalette.ColorRole.WindowText)
+            self._glyphs = self._cache.get(self._fitted_font(), color, ratio)
+            self._glyphs_ratio = ratio
+        return self._glyphs
+
+    def _fitted_font(self) -> QFont:
+        """Widget font, scaled down so two digits fit the widget."""
+        font = QFont(self.font())
+        size = font.pixelSize()
+        if size <= 0:
+            size = round(font.pointSizeF() * self.logicalDpiY() / 72)
+
+        metrics = QFontMetricsF(font)
+        width = metrics.horizontalAdvance("00") or 1.0
+        scale = min(1.0, self.height() * _HEIGHT_FILL / metrics.height(), self.width() / width)
+        font.setPixelSize(max(1, int(size * scale)))
+        return font
+
+    def _text_rect(self, text: str) -> Optional[QRect]:
+        """Area covered by ``text`` with the current glyphs, if known."""
+        glyphs = self._glyphs
+        if glyphs is None or not all(char in glyphs.pixmaps for char in text):
+            return None
+        width = sum(glyphs.advances[char] for char in text)
+        return QRectF(
+            (self.width() - width) / 2, (self.height() - glyphs.height) / 2,
+            width, glyphs.height,
+        ).toAlignedRect()
+
+    def paintEvent(self, event) -> None:
+        text = self._text
+        if not text:
+            return
+        glyphs = self.glyphs()
+
+        painter = QPainter(self)
+        if all(char in glyphs.pixmaps for char in text):
+            width = sum(glyphs.advances[char] for char in text)
+            x = (self.width() - width) / 2
+            y = (self.height() - glyphs.height) / 2
+            for char in text:
+                painter.drawPixmap(QPointF(x, y), glyphs.pixmaps[char])
+                x += glyphs.advances[char]
+        else:
+            # Anything but digits: plain text rendering
+            painter.setFont(self._fitted_font())
+            painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        self.painted.emit()
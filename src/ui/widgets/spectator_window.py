@@ -0,0 +1,91 @@
+"""
+Spectator Window
+================
+
+Scoreboard for a second monitor facing the spectators.
+
+The window has no widget tree and no copy of the main screen. It paints
+straight from the match state (FrameState) with the ScoreboardPainter of
+the stream frame renderer, laid out for its own screen, with digits from
+the glyph cache shared with the main screen. A new state repaints only the
+elements whose value changed (usually the digits of one score), directly
+into the window's backing store; nothing is rendered twice.
+
+With ``flipped`` the players swap sides, so spectators on the far side of
+the table see each player on the side where they stand.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QScreen
+
+from ..frame_renderer import BACKGROUND_COLOR, FrameState, ScoreboardPainter
+
+
+class SpectatorWindow(QWidget):
+    """Borderless top-level window painting the scoreboard from a FrameState.
+
+    Attributes:
+        state: Shown state, already flipped (None before the first set_state())
+
+    Example:
+        >>> mirror = SpectatorWindow(main_window, flipped=True)
+        >>> mirror.show_on(QGuiApplication.screens()[1])
+        >>> mirror.set_state(FrameState.from_engine(engine))
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None, flipped: bool = False) -> None:
+        """Create the (hidden) window.
+
+        Args:
+            parent: Owning window; the mirror closes with it
+            flipped: Swap the players' sides (players' perspective)
+        """
+        super().__init__(parent, Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint)
+        self.setWindowTitle("TTR - Zuschauer")
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.flipped = flipped
+        self.state: Optional[FrameState] = None
+        self._board: Optional[ScoreboardPainter] = None
+
+    def show_on(self, screen: QScreen) -> None:
+        """Show the window full screen on ``screen``."""
+        self.setScreen(screen)
+        self.setGeometry(screen.geometry())
+        self.showFullScreen()
+
+    def set_state(self, state: FrameState) -> None:
+        """Show ``state`` (as on the main screen); repaints only what changed."""
+        if self.flipped:
+            state = state.swapped()
+        last = self.state
+        if state == last:
+            return
+        self.state = state
+        if self._board is not None:
+            self.update(self._board.changed(last, state))
+
+    def set_flipped(self, flipped: bool) -> None:
+        """Swap (or restore) the players' sides."""
+        if flipped != self.flipped:
+            self.flipped = flipped
+            if self.state is not None:
+                self.state = self.state.swapped()
+            self.update()
+
+    def resizeEvent(self, event) -> None:
+        # New layout for the new size (or pixel ratio), painted in full
+        self._board = ScoreboardPainter(self.size(), device_pixel_ratio=self.devicePixelRatioF())
+        self.update()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        if self._board is None or self.state is None:
+            painter.fillRect(event.rect(), BACKGROUND_COLOR)
+        else:
+            # Also fills the margins around the layout (resize, expose)
+            self._board.paint(painter, event.region(), self.state)
+        painter.end()
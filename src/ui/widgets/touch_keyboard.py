@@ -0,0 +1,127 @@
+"""
+Touch Keyboard Widget
+=====================
+
+On-screen QWERTZ keyboard (KEYBOARD_ROWS) for all text input of the app.
+
+Player names and the tournament name used to come from three separate
+keyboards; the tournament dialog built its button grid again on every
+open. Now there is one keyboard, built once with the keyboard page and
+pointed at the QLineEdit being edited with set_target(). Shift is a
+dynamic property of the shift key ([active="true"] in styles.qss):
+toggling it polishes that one key again and relabels the letters, no
+stylesheet is touched.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout
+from PyQt6.QtCore import pyqtSignal
+
+from ...core.constants import KEYBOARD_ROWS
+from ..style import set_style_state
+
+SPACE_KEY = "___SPACE___"
+SHIFT_KEY = "⇧"
+BACKSPACE_KEY = "⌫"
+ACCEPT_KEY = "✓"
+CANCEL_KEY = "←"
+
+KEY_HEIGHT = 65
+LETTER_KEY_WIDTH = 55
+
+# Object name (styles.qss), label and minimum width of the special keys
+_SPECIAL_KEYS = {
+    SPACE_KEY: ("keySpace", "", 600),
+    ACCEPT_KEY: ("keyAccept", "OK", 120),
+    BACKSPACE_KEY: ("keyBackspace", "⌫", 70),
+    SHIFT_KEY: ("keyShift", "⇧", 55),
+    CANCEL_KEY: ("keyBack", "←", 55),
+}
+
+
+class TouchKeyboard(QWidget):
+    """QWERTZ keyboard typing into a target QLineEdit.
+
+    Letters are lower case; shift makes the next letter upper case.
+
+    Signals:
+        accepted: OK (✓) was pressed
+        cancelled: Back (←) was pressed
+
+    Example:
+        >>> keyboard = TouchKeyboard(page)
+        >>> keyboard.set_target(page.input_field)
+        >>> keyboard.accepted.connect(page.on_confirm)
+    """
+
+    accepted = pyqtSignal()
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Build the key grid (once).
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.target: Optional[QLineEdit] = None
+        self.shift_active = False
+        self.letter_buttons: list[tuple[QPushButton, str]] = []
+        self.shift_button: Optional[QPushButton] = None
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        for row in KEYBOARD_ROWS:
+            row_layout = QHBoxLayout()
+            row_layout.setSpacing(6)
+            for key in row:
+                row_layout.addWidget(self._create_key(key))
+            layout.addLayout(row_layout)
+
+    def _create_key(self, key: str) -> QPushButton:
+        if key in _SPECIAL_KEYS:
+            name, text, width = _SPECIAL_KEYS[key]
+        else:
+            name, text, width = "keyLetter", key.lower(), LETTER_KEY_WIDTH
+        button = QPushButton(text)
+        button.setObjectName(name)
+        button.setMinimumSize(width, KEY_HEIGHT)
+        button.clicked.connect(lambda checked, k=key: self.press(k))
+        if key == SHIFT_KEY:
+            self.shift_button = button
+        elif key not in _SPECIAL_KEYS:
+            self.letter_buttons.append((button, key))
+        return button
+
+    def set_target(self, line_edit: Optional[QLineEdit]) -> None:
+        """Type into ``line_edit`` from now on (shift starts off)."""
+        self.target = line_edit
+        self.set_shift(False)
+
+    def set_shift(self, active: bool) -> None:
+        """Switch the letters between upper and lower case."""
+        if active == self.shift_active:
+            return
+        self.shift_active = active
+        set_style_state(self.shift_button, "active", active)
+        for button, key in self.letter_buttons:
+            button.setText(key.upper() if active else key.lower())
+
+    def press(self, key: str) -> None:
+        """Handle one key of KEYBOARD_ROWS."""
+        if key == ACCEPT_KEY:
+            self.accepted.emit()
+        elif key == CANCEL_KEY:
+            self.cancelled.emit()
+        elif key == SHIFT_KEY:
+            self.set_shift(not self.shift_active)
+        elif self.target is not None:
+            text = self.target.text()
+            if key == BACKSPACE_KEY:
+                self.target.setText(text[:-1])
+            elif key == SPACE_KEY:
+                self.target.setText(text + " ")
+            else:
+                self.target.setText(text + (key.upper() if self.shift_active else key.lower()))
+                self.set_shift(False)
@@ -0,0 +1,118 @@
+"""
+Unit Tests for Batch Replay
+============================
+
+Checks the vectorized NumPy replay against the scalar MatchEngine.
+Run with: pytest tests/test_batch_replay.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.batch_replay import replay_matches
+
+
+def _random_sequences(rng, count, max_length):
+    return [
+        [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(rng.randint(0, max_length))]
+        for _ in range(count)
+    ]
+
+
+def _assert_matches_scalar(result, sequences, sets_to_win, initial_server):
+    for index, points in enumerate(sequences):
+        engine = MatchEngine(
+            sets_to_win=int(sets_to_win[index]),
+            initial_server=int(initial_server[index]),
+        )
+        played = engine.replay_points(points)
+        
+        assert result.get_state(index) == engine.get_current_state()
+        assert result.initial_server[index] == engine.initial_server
+        assert result.winner[index] == (engine.get_winner() or 0)
+        assert result.points_played[index] == played
+
+
+def test_batch_matches_scalar_engine():
+    """Test random sequences (finished and unfinished) against MatchEngine."""
+    rng = random.Random(2024)
+    sequences = _random_sequences(rng, 500, 250)
+    sets_to_win = [rng.randint(1, 4) for _ in sequences]
+    initial_server = [rng.choice((PLAYER_1, PLAYER_2)) for _ in sequences]
+    
+    result = replay_matches(sequences, np.array(sets_to_win), np.array(initial_server))
+    
+    assert len(result) == len(sequences)
+    _assert_matches_scalar(result, sequences, sets_to_win, initial_server)
+
+
+def test_batch_deuce_heavy():
+    """Test long deuce sets (alternating points) against MatchEngine."""
+    rng = random.Random(99)
+    sequences = []
+    for _ in range(200):
+        points = []
+        for _ in range(rng.randint(20, 60)):
+            pair = [PLAYER_1, PLAYER_2]
+            rng.shuffle(pair)
+            points.extend(pair)
+        points.extend([rng.choice((PLAYER_1, PLAYER_2))] * 2)
+        sequences.append(points)
+    
+    result = replay_matches(sequences, sets_to_win=2)
+    _assert_matches_scalar(result, sequences, [2] * 200, [PLAYER_1] * 200)
+
+
+def test_batch_accepts_bytes_and_matrix():
+    """Test bytes input and a pre-padded matrix."""
+    sequences = [bytes([PLAYER_1] * 11), bytes([PLAYER_2] * 33)]
+    result = replay_matches(sequences, sets_to_win=3)
+    assert result.sets_player1.tolist() == [1, 0]
+    assert result.winner.tolist() == [0, PLAYER_2]
+    
+    matrix = np.zeros((2, 33), dtype=np.uint8)
+    matrix[0, :11] = PLAYER_1
+    matrix[1, :] = PLAYER_2
+    assert replay_matches(matrix, sets_to_win=3).winner.tolist() == [0, PLAYER_2]
+
+
+def test_batch_invalid_player():
+    """Test that invalid player numbers raise ValueError."""
+    with pytest.raises(ValueError, match="must be 1 or 2"):
+        replay_matches([[1, 2, 3]])
+
+
+def test_batch_out_of_range_points():
+    """Test that values outside the uint8 range raise instead of wrapping to a player."""
+    for sequences in (
+        [[1, 257]],
+        [np.array([1, 258])],
+        np.array([[1, 257]]),
+        np.array([[1, -255]]),
+        np.array([[1.0, 2.5]]),
+    ):
+        with pytest.raises(ValueError, match="must be 1 or 2"):
+            replay_matches(sequences)
+
+
+def test_batch_zero_inside_sequence():
+    """Test that 0 is only padding: inside a sequence it raises like MatchEngine."""
+    for sequences in ([[1, 0, 1, 1]], [[1, 0, 1, 1], [2, 2, 2, 2]], np.array([[1, 0, 1, 1]])):
+        with pytest.raises(ValueError, match="must be 1 or 2"):
+            replay_matches(sequences)
+    
+    # Trailing zeros of a pre-padded matrix and empty sequences are padding
+    matrix = np.array([[1, 2, 1, 0], [0, 0, 0, 0]], dtype=np.uint8)
+    result = replay_matches(matrix)
+    assert result.points_played.tolist() == [3, 0]
+    _assert_matches_scalar(result, [[1, 2, 1], []], [3, 3], [PLAYER_1, PLAYER_1])
@@ -0,0 +1,157 @@
+"""
+Unit Tests for the Match Codec
+==============================
+
+Checks that encoded engines decode to the same state and history.
+Run with: pytest tests/test_codec.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.models import MatchState
+from core.codec import decode_engine, decode_state, encode_engine
+
+
+def _random_engine(seed, sets_to_win=3, initial_server=PLAYER_1, points=None):
+    rng = random.Random(seed)
+    engine = MatchEngine(sets_to_win=sets_to_win, initial_server=initial_server)
+    played = 0
+    while not engine.is_match_finished() and (points is None or played < points):
+        result = engine.add_point(rng.choice((PLAYER_1, PLAYER_2)))
+        played += 1
+        if result.set_won and not result.match_won:
+            engine.reset_set()
+    return engine
+
+
+def test_round_trip_with_history():
+    """Test state, servers and history for finished and running matches."""
+    for seed in range(20):
+        engine = _random_engine(
+            seed,
+            sets_to_win=1 + seed % 4,
+            initial_server=PLAYER_1 if seed % 2 else PLAYER_2,
+            points=None if seed % 3 else 37,
+        )
+        decoded = decode_engine(encode_engine(engine))
+        
+        assert decoded.get_current_state() == engine.get_current_state()
+        assert decoded.initial_server == engine.initial_server
+        assert decoded.sets_to_win == engine.sets_to_win
+        assert decoded.timeline.events == engine.timeline.events
+
+
+def test_decoded_engine_can_undo():
+    """Test that the decoded history supports undo."""
+    engine = _random_engine(1, points=50)
+    decoded = decode_engine(encode_engine(engine))
+    
+    engine.undo_last_point()
+    decoded.undo_last_point()
+    assert decoded.get_current_state() == engine.get_current_state()
+
+
+def test_state_only():
+    """Test the fixed-size live state without history."""
+    engine = _random_engine(2, points=40)
+    data = encode_engine(engine, include_history=False)
+    
+    assert len(data) == 10
+    assert decode_state(data) == engine.get_current_state()
+    
+    decoded = decode_engine(data)
+    assert decoded.get_current_state() == engine.get_current_state()
+    assert decoded.initial_server == engine.initial_server
+    assert not decoded.undo_last_point()
+    
+    # Play on identically
+    for player in (PLAYER_1, PLAYER_2, PLAYER_2):
+        assert decoded.add_point(player) == engine.add_point(player)
+    assert decoded.get_current_state() == engine.get_current_state()
+
+
+def test_round_trip_from_loaded_state():
+    """Test engines whose history starts at a loaded state, not at 0:0."""
+    engine = MatchEngine()
+    engine.load_state(MatchState(5, 3, 1, 0, PLAYER_2), PLAYER_1)
+    engine.add_point(PLAYER_1)
+    
+    decoded = decode_engine(encode_engine(engine))
+    assert decoded.get_current_state() == engine.get_current_state()
+    assert decoded.initial_server == engine.initial_server
+    assert decoded.timeline.events == engine.timeline.events
+    
+    # Undo stops at the loaded state, like in the original
+    assert decoded.undo_last_point()
+    assert decoded.get_current_state() == MatchState(5, 3, 1, 0, PLAYER_2)
+    assert not decoded.undo_last_point()
+    
+    # A state-only decode that plays on has the same problem
+    engine = _random_engine(5, points=30)
+    resumed = decode_engine(encode_engine(engine, include_history=False))
+    for player in (PLAYER_1, PLAYER_2, PLAYER_1):
+        resumed.add_point(player)
+    decoded = decode_engine(encode_engine(resumed))
+    assert decoded.get_current_state() == resumed.get_current_state()
+    assert decoded.timeline.events == resumed.timeline.events
+
+
+def test_size_is_compact():
+    """Test that a full match stays within a few dozen bytes."""
+    engine = _random_engine(3, sets_to_win=3)
+    data = encode_engine(engine)
+    
+    assert decode_state(data) == engine.get_current_state()
+    assert len(data) <= 10 + 1 + (len(engine.timeline) + 3) // 4 + 1
+
+
+def test_invalid_data():
+    """Test that corrupted data raises ValueError."""
+    data = encode_engine(_random_engine(4, points=30))
+    
+    for broken in (data[:5], b"\x09" + data[1:], data[:-2]):
+        try:
+            decode_engine(broken)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running codec tests...")
+    
+    tests = [
+        test_round_trip_with_history,
+        test_decoded_engine_can_undo,
+        test_state_only,
+        test_round_trip_from_loaded_state,
+        test_size_is_compact,
+        test_invalid_data,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
@@ -0,0 +1,147 @@
+"""
+Unit Tests for the Point Input Queue
+====================================
+
+Checks ordering, per-side debouncing and latency recording.
+Run with: pytest tests/test_input_queue.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.input_queue import PointInputQueue, LatencyRecorder
+from core.constants import PLAYER_1, PLAYER_2, EVENT_UNDO
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_inputs_keep_press_order():
+    """Inputs come out in press order with their press times."""
+    clock = FakeClock()
+    queue = PointInputQueue(clock=clock)
+    for event in (PLAYER_1, PLAYER_2, EVENT_UNDO, PLAYER_2):
+        assert queue.push(event)
+        clock.now += 0.2
+    assert len(queue) == 4
+
+    first = queue.pop()
+    assert (first.event, first.pressed_at) == (PLAYER_1, 100.0)
+    assert [item.event for item in queue.drain()] == [PLAYER_2, EVENT_UNDO, PLAYER_2]
+    assert len(queue) == 0
+    assert queue.pop() is None
+
+
+def test_debounce_per_side():
+    """A repeat on the same side is dropped, the other side is not."""
+    clock = FakeClock()
+    queue = PointInputQueue(debounce=0.15, clock=clock)
+    assert queue.push(PLAYER_1)
+    clock.now += 0.05
+    assert not queue.push(PLAYER_1)  # bounce
+    assert queue.push(PLAYER_2)      # other side unaffected
+    clock.now += 0.11
+    assert queue.push(PLAYER_1)      # 0.16 s after the accepted press
+    assert queue.dropped == 1
+    assert [item.event for item in queue.drain()] == [PLAYER_1, PLAYER_2, PLAYER_1]
+
+
+def test_debounce_uses_given_press_time():
+    """Explicit press times are used instead of the clock."""
+    queue = PointInputQueue(debounce=0.1, clock=lambda: 0.0)
+    assert queue.push(PLAYER_1, pressed_at=1.0)
+    assert not queue.push(PLAYER_1, pressed_at=1.05)
+    assert queue.push(PLAYER_1, pressed_at=1.2)
+
+
+def test_debounce_disabled():
+    """With debounce 0 every input is queued."""
+    queue = PointInputQueue(debounce=0, clock=lambda: 5.0)
+    assert all(queue.push(PLAYER_1) for _ in range(3))
+    assert len(queue) == 3
+
+
+def test_clear_counts_dropped():
+    """Cleared inputs count as dropped."""
+    queue = PointInputQueue(clock=FakeClock())
+    queue.push(PLAYER_1)
+    queue.push(PLAYER_2)
+    queue.clear()
+    assert len(queue) == 0
+    assert queue.dropped == 2
+
+
+def test_latency_per_applied_input():
+    """Each input applied before a paint gets one sample."""
+    clock = FakeClock()
+    latency = LatencyRecorder(clock=clock)
+    latency.mark_applied(99.99)
+    latency.mark_applied(99.95)
+    latency.record_paint()
+    assert latency.count == 2
+    assert [round(sample, 6) for sample in latency.samples] == [0.01, 0.05]
+    assert round(latency.last, 6) == 0.05
+
+    # Paint without a new input records nothing
+    latency.record_paint()
+    assert latency.count == 2
+
+
+def test_latency_statistics():
+    """Mean and nearest-rank percentiles over the kept samples."""
+    latency = LatencyRecorder(size=4)
+    assert latency.mean() is None and latency.percentile(50) is None
+
+    for sample in (0.5, 0.001, 0.002, 0.003, 0.004):
+        latency.mark_applied(0.0)
+        latency.record_paint(painted_at=sample)
+    assert latency.count == 5
+    assert list(latency.samples) == [0.001, 0.002, 0.003, 0.004]  # oldest dropped
+    assert latency.percentile(50) == 0.002
+    assert latency.percentile(100) == 0.004
+    assert latency.percentile(0) == 0.001
+    assert round(latency.mean(), 6) == 0.0025
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running input queue tests...")
+
+    tests = [
+        test_inputs_keep_press_order,
+        test_debounce_per_side,
+        test_debounce_uses_given_press_time,
+        test_debounce_disabled,
+        test_clear_counts_dropped,
+        test_latency_per_applied_input,
+        test_latency_statistics,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
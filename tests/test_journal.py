@@ -0,0 +1,170 @@
+"""
+Unit Tests for the Point Journal
+================================
+
+Checks that a journal written during a match restores the same MatchEngine state.
+Run with: pytest tests/test_journal.py -v
+"""
+
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET, EVENT_UNDO
+from core.journal import JournalHeader, PointJournal, read_journal
+
+
+def _play_with_journal(journal, engine, rng, points):
+    """Play random points with undos and set resets, journaling each event."""
+    for _ in range(points):
+        if rng.random() < 0.1:
+            if engine.undo_last_point():
+                journal.append(EVENT_UNDO)
+            continue
+        player = rng.choice((PLAYER_1, PLAYER_2))
+        result = engine.add_point(player)
+        journal.append(player)
+        if result.match_won:
+            break
+        if result.set_won:
+            engine.reset_set()
+            journal.append(EVENT_RESET_SET)
+
+
+def test_header_round_trip(tmp_path):
+    """Test that the match setup survives, including umlauts and missing IDs."""
+    header = JournalHeader("Jürgen Groß", "Zoë", sets_to_win=4, initial_server=PLAYER_2,
+                           player1_id=17, turnier_id=3, turnier_name="Vereinsmeisterschaft Süd")
+    journal = PointJournal(tmp_path / "match.journal", header)
+    journal.close()
+    
+    contents = read_journal(tmp_path / "match.journal")
+    assert contents.header == header
+    assert contents.events == b""
+
+
+def test_version_1_header_is_read(tmp_path):
+    """Test that a journal from before the tournament name still restores."""
+    path = tmp_path / "match.journal"
+    path.write_bytes(
+        struct.pack("<4sBBBiiiHH", b"TTRJ", 1, 2, PLAYER_1, 4, -1, 9, 1, 1)
+        + b"AB" + bytes([PLAYER_2, PLAYER_2])
+    )
+    
+    contents = read_journal(path)
+    assert contents.header == JournalHeader("A", "B", sets_to_win=2, player1_id=4, turnier_id=9)
+    assert contents.events == bytes([PLAYER_2, PLAYER_2])
+
+
+def test_version_1_journal_is_resumed(tmp_path):
+    """Test that appending to a resumed version 1 journal keeps its events."""
+    path = tmp_path / "match.journal"
+    path.write_bytes(
+        struct.pack("<4sBBBiiiHH", b"TTRJ", 1, 2, PLAYER_1, -1, -1, -1, 1, 1)
+        + b"AB" + bytes([PLAYER_1] * 3) + b"\xff"
+    )
+    
+    journal = PointJournal.resume(path, read_journal(path))
+    journal.append(PLAYER_2)
+    journal.close()
+    
+    contents = read_journal(path)
+    assert contents.events == bytes([PLAYER_1, PLAYER_1, PLAYER_1, PLAYER_2])
+    engine = contents.to_engine()
+    assert (engine.score_player1, engine.score_player2) == (3, 1)
+
+
+def test_recovery_matches_engine(tmp_path):
+    """Test that a crashed match is restored exactly (without close())."""
+    path = tmp_path / "match.journal"
+    rng = random.Random(5)
+    engine = MatchEngine("A", "B", sets_to_win=3, initial_server=PLAYER_2)
+    journal = PointJournal(path, JournalHeader("A", "B", sets_to_win=3, initial_server=PLAYER_2))
+    
+    _play_with_journal(journal, engine, rng, 150)
+    
+    restored = read_journal(path).to_engine()
+    assert restored.get_current_state() == engine.get_current_state()
+    assert restored.initial_server == engine.initial_server
+    assert restored.timeline.events == engine.timeline.events
+    assert restored.statistics is None
+    assert read_journal(path).to_engine(track_statistics=True).statistics is not None
+    journal.close()
+
+
+def test_torn_tail_is_dropped_and_resumed(tmp_path):
+    """Test that garbage after the last event is ignored and cut on resume."""
+    path = tmp_path / "match.journal"
+    journal = PointJournal(path, JournalHeader("A", "B", sets_to_win=1))
+    for _ in range(5):
+        journal.append(PLAYER_1)
+    journal.close()
+    with open(path, "ab") as f:
+        f.write(b"\xff\x01")
+    
+    contents = read_journal(path)
+    assert contents.events == bytes([PLAYER_1] * 5)
+    
+    journal = PointJournal.resume(path, contents)
+    journal.append(PLAYER_2)
+    journal.close()
+    
+    engine = read_journal(path).to_engine()
+    assert (engine.score_player1, engine.score_player2) == (5, 1)
+
+
+def test_discard_removes_file(tmp_path):
+    """Test that a finished match leaves no journal behind."""
+    path = tmp_path / "match.journal"
+    journal = PointJournal(path, JournalHeader("A", "B"))
+    journal.append(PLAYER_1)
+    journal.discard()
+    
+    assert not path.exists()
+    assert read_journal(path) is None
+
+
+def test_discard_does_not_wait_for_sync(tmp_path):
+    """Test that discard() returns at once and the sync thread still ends."""
+    path = tmp_path / "match.journal"
+    journal = PointJournal(path, JournalHeader("A", "B"), sync_interval=30)
+    journal.append(PLAYER_1)
+    
+    start = time.perf_counter()
+    journal.discard()
+    assert time.perf_counter() - start < 1
+    assert not path.exists()
+    
+    journal._sync_thread.join(timeout=5)
+    assert not journal._sync_thread.is_alive()
+
+
+def test_append_after_close_raises(tmp_path):
+    """Test that a closed or discarded journal rejects further events."""
+    for finish in ("close", "discard"):
+        path = tmp_path / f"{finish}.journal"
+        journal = PointJournal(path, JournalHeader("A", "B"))
+        getattr(journal, finish)()
+        
+        with pytest.raises(ValueError):
+            journal.append(PLAYER_1)
+        with pytest.raises(ValueError):
+            journal.flush()
+
+
+def test_invalid_file_is_ignored(tmp_path):
+    """Test that a foreign or truncated file is not restored."""
+    path = tmp_path / "match.journal"
+    path.write_bytes(b"TTR")
+    assert read_journal(path) is None
+    
+    path.write_bytes(b"not a journal at all")
+    assert read_journal(path) is None
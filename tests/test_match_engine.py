@@ -6,14 +6,18 @@ Tests the core business logic without any UI dependencies.
 Run with: pytest tests/test_match_engine.py -v
 """
 
+import dataclasses
+import random
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from core.match_engine import MatchEngine
-from core.constants import PLAYER_1, PLAYER_2
+from core.constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET, EVENT_UNDO
 
 
 def test_match_initialization():
@@ -196,6 +200,93 @@ def test_undo_set_win():
     assert engine.sets_player1 == 0  # Set win was undone
 
 
+def test_undo_reset_set_restores_server():
+    """Test that undoing the set-winning point also undoes reset_set()."""
+    engine = MatchEngine(sets_to_win=3, initial_server=PLAYER_1)
+    
+    for _ in range(11):
+        engine.add_point(PLAYER_1)
+    engine.reset_set()
+    assert engine.initial_server == PLAYER_2
+    
+    assert engine.undo_last_point()
+    assert engine.score_player1 == 10
+    assert engine.sets_player1 == 0
+    assert engine.initial_server == PLAYER_1
+    assert engine.server == PLAYER_2  # 10 points played: 5 serve changes
+
+
+def test_undo_long_match_matches_snapshots():
+    """Test undo across many checkpoints against full per-point snapshots."""
+    rng = random.Random(1234)
+    engine = MatchEngine(sets_to_win=4)
+    snapshots = []
+    
+    while not engine.is_match_finished():
+        snapshots.append((engine.get_current_state(), engine.initial_server))
+        result = engine.add_point(rng.choice((PLAYER_1, PLAYER_2)))
+        if result.set_won and not result.match_won:
+            engine.reset_set()
+    
+    assert len(snapshots) > 64
+    
+    while snapshots:
+        assert engine.undo_last_point()
+        state, initial_server = snapshots.pop()
+        assert engine.get_current_state() == state
+        assert engine.initial_server == initial_server
+    
+    assert not engine.undo_last_point()
+
+
+def test_add_point_results_are_shared():
+    """Test that add_point() returns shared, immutable SetResult instances."""
+    engine = MatchEngine(sets_to_win=1)
+    
+    first = engine.add_point(PLAYER_1)
+    second = engine.add_point(PLAYER_2)
+    assert first is second
+    assert not first.set_won
+    
+    with pytest.raises((AttributeError, dataclasses.FrozenInstanceError)):
+        first.set_won = True
+    
+    for _ in range(10):
+        result = engine.add_point(PLAYER_1)
+    assert result.set_won and result.match_won and result.winner == PLAYER_1
+
+
+def test_replay_events_matches_live_play():
+    """Test that a logged event sequence with undos rebuilds the same engine."""
+    rng = random.Random(11)
+    engine = MatchEngine(initial_server=PLAYER_2, track_statistics=True)
+    events = []
+    while not engine.is_match_finished():
+        if rng.random() < 0.1:
+            if engine.undo_last_point():
+                events.append(EVENT_UNDO)
+            continue
+        player = rng.choice((PLAYER_1, PLAYER_2))
+        events.append(player)
+        result = engine.add_point(player)
+        if result.set_won and not result.match_won:
+            engine.reset_set()
+            events.append(EVENT_RESET_SET)
+    
+    replayed = MatchEngine(initial_server=PLAYER_2, track_statistics=True)
+    replayed.replay_events(events)
+    assert replayed.get_current_state() == engine.get_current_state()
+    assert replayed.timeline.events == engine.timeline.events
+    assert replayed.statistics.serve_points_won == engine.statistics.serve_points_won
+    assert replayed.statistics.set_points == engine.statistics.set_points
+    
+    try:
+        MatchEngine().replay_events([PLAYER_1, 7])
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "invalid event" in str(e)
+
+
 def test_invalid_player():
     """Test that invalid player numbers raise ValueError."""
     engine = MatchEngine()
@@ -230,6 +321,10 @@ if __name__ == "__main__":
         test_serve_change_deuce,
         test_undo_point,
         test_undo_set_win,
+        test_undo_reset_set_restores_server,
+        test_undo_long_match_matches_snapshots,
+        test_add_point_results_are_shared,
+        test_replay_events_matches_live_play,
         test_invalid_player,
         test_invalid_sets_to_win,
     ]
@@ -0,0 +1,173 @@
+"""
+Unit Tests for MatchEngine Change Notifications
+===============================================
+
+Checks coalescing, field diffs, schedulers and several observers.
+Run with: pytest tests/test_notifications.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+
+
+class ManualScheduler:
+    """Collects scheduled flushes like a UI event loop would."""
+
+    def __init__(self):
+        self.pending = []
+
+    def __call__(self, flush):
+        self.pending.append(flush)
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for flush in pending:
+            flush()
+
+
+def test_synchronous_notification_diff():
+    """Test one notification per operation with the changed fields."""
+    engine = MatchEngine(initial_server=PLAYER_1)
+    changes = []
+    engine.subscribe(changes.append)
+
+    engine.add_point(PLAYER_1)
+    assert len(changes) == 1
+    assert changes[0].changed == {"score_player1"}
+    assert changes[0].before.score_player1 == 0
+    assert changes[0].after.score_player1 == 1
+
+    engine.add_point(PLAYER_2)  # 1:1, serve changes
+    assert changes[-1].changed == {"score_player2", "server"}
+    assert changes[-1].events == 1
+
+
+def test_scheduler_coalesces_per_frame():
+    """Test that everything until the next frame arrives as one change."""
+    engine = MatchEngine()
+    scheduler = ManualScheduler()
+    engine.set_scheduler(scheduler)
+    changes = []
+    engine.subscribe(changes.append)
+
+    for _ in range(10):
+        engine.add_point(PLAYER_1)
+    assert changes == []
+    assert len(scheduler.pending) == 1  # scheduled once per frame
+
+    scheduler.run()
+    assert len(changes) == 1
+    assert changes[0].events == 10
+    assert changes[0].after.score_player1 == 10
+
+
+def test_set_win_arrives_as_one_change():
+    """Test that point, serve change and set win are one notification."""
+    engine = MatchEngine(sets_to_win=2)
+    scheduler = ManualScheduler()
+    engine.set_scheduler(scheduler)
+    for _ in range(10):
+        engine.add_point(PLAYER_1)
+    scheduler.run()
+
+    changes = []
+    engine.subscribe(changes.append)
+    engine.add_point(PLAYER_1)
+    scheduler.run()
+    assert len(changes) == 1
+    assert changes[0].changed == {"score_player1", "sets_player1"}
+    assert changes[0].set_winner == PLAYER_1
+    assert changes[0].match_winner is None
+
+    engine.reset_set()
+    scheduler.run()
+    assert changes[-1].set_winner is None
+    assert "score_player1" in changes[-1].changed
+
+
+def test_no_notification_without_net_change():
+    """Test that a point undone in the same frame is not reported."""
+    engine = MatchEngine()
+    scheduler = ManualScheduler()
+    engine.set_scheduler(scheduler)
+    changes = []
+    engine.subscribe(changes.append)
+
+    engine.add_point(PLAYER_2)
+    engine.undo_last_point()
+    scheduler.run()
+    assert changes == []
+
+
+def test_replay_points_is_one_change():
+    """Test that bulk operations and batch_changes() notify once."""
+    engine = MatchEngine(sets_to_win=3)
+    changes = []
+    engine.subscribe(changes.append)
+
+    engine.replay_points([PLAYER_1] * 25)
+    assert len(changes) == 1
+    assert changes[0].after.sets_player1 == 2
+
+    with engine.batch_changes():
+        engine.add_point(PLAYER_2)
+        engine.add_point(PLAYER_2)
+        engine.undo_last_point()
+    assert len(changes) == 2
+    assert changes[1].events == 1
+
+
+def test_several_views_and_unsubscribe():
+    """Test that all observers get the same change and can unsubscribe."""
+    engine = MatchEngine()
+    first, second = [], []
+    unsubscribe = engine.subscribe(first.append)
+    engine.subscribe(second.append)
+
+    engine.add_point(PLAYER_1)
+    assert first == second and len(first) == 1
+    assert first[0] is second[0]
+
+    unsubscribe()
+    engine.add_point(PLAYER_1)
+    assert len(first) == 1
+    assert len(second) == 2
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running notification tests...")
+    
+    tests = [
+        test_synchronous_notification_diff,
+        test_scheduler_coalesces_per_frame,
+        test_set_win_arrives_as_one_change,
+        test_no_notification_without_net_change,
+        test_replay_points_is_one_change,
+        test_several_views_and_unsubscribe,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
@@ -0,0 +1,114 @@
+"""
+Unit Tests for Performance Statistics
+=====================================
+
+Checks rolling metrics, the enable/disable hook and GC tracking.
+Run with: pytest tests/test_perf_stats.py -v
+"""
+
+import gc
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.perf_stats import (
+    PerfStats,
+    RollingStat,
+    get_perf_stats,
+    enable_perf_stats,
+    disable_perf_stats,
+)
+
+
+def test_rolling_stat_window():
+    """Only the last samples are kept, the total count keeps growing."""
+    stat = RollingStat(window=3)
+    assert stat.last is None and stat.mean() is None and stat.max() is None
+
+    for sample in (0.5, 0.1, 0.2, 0.3):
+        stat.add(sample)
+    assert list(stat.samples) == [0.1, 0.2, 0.3]
+    assert stat.count == 4
+    assert stat.last == 0.3
+    assert stat.max() == 0.3
+    assert round(stat.mean(), 6) == 0.2
+
+
+def test_metrics_created_on_first_record():
+    """record() creates metrics in order of first use."""
+    perf = PerfStats()
+    perf.record("frame", 0.016)
+    perf.record("db", 0.004)
+    perf.record("frame", 0.017)
+    assert list(perf.metrics) == ["frame", "db"]
+    assert perf.metric("frame").count == 2
+    assert perf.metric("db").last == 0.004
+    assert perf.heap_blocks() > 0
+
+
+def test_hook_is_none_while_disabled():
+    """get_perf_stats() is None until enabled and again after disabling."""
+    disable_perf_stats()
+    assert get_perf_stats() is None
+
+    perf = enable_perf_stats()
+    try:
+        assert get_perf_stats() is perf
+        assert enable_perf_stats() is perf  # keeps the running collector
+    finally:
+        disable_perf_stats()
+    assert get_perf_stats() is None
+
+
+def test_gc_tracking():
+    """Collections are counted per generation while tracking."""
+    perf = PerfStats()
+    perf.start_gc_tracking()
+    perf.start_gc_tracking()  # registered once
+    try:
+        gc.collect(0)
+        gc.collect()
+    finally:
+        perf.stop_gc_tracking()
+    assert perf.gc_collections[0] >= 1
+    assert perf.gc_collections[2] >= 1
+    assert perf.gc_pauses.count == sum(perf.gc_collections)
+    assert perf._on_gc not in gc.callbacks
+
+    # Not counted after stopping
+    collections = list(perf.gc_collections)
+    gc.collect()
+    assert perf.gc_collections == collections
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running perf stats tests...")
+
+    tests = [
+        test_rolling_stat_window,
+        test_metrics_created_on_first_record,
+        test_hook_is_none_while_disabled,
+        test_gc_tracking,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
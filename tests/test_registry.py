@@ -0,0 +1,203 @@
+"""
+Unit Tests for the Match Registry
+==================================
+
+Checks bulk event handling, snapshots and archiving of the multi-table registry.
+Run with: pytest tests/test_registry.py -v
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.registry import InMemoryMatchArchive, MatchRegistry
+
+
+def _random_events(rng, table_ids, count):
+    return [(rng.choice(table_ids), rng.choice((PLAYER_1, PLAYER_2))) for _ in range(count)]
+
+
+def test_apply_events_matches_engines():
+    """Test that batched events give the same state as one engine per table."""
+    rng = random.Random(1)
+    tables = [f"T{i}" for i in range(8)]
+    registry = MatchRegistry(memory_budget=None)
+    engines = {}
+    for table_id in tables:
+        registry.open_match(table_id, sets_to_win=2)
+        engines[table_id] = MatchEngine(sets_to_win=2)
+    
+    for _ in range(20):
+        events = _random_events(rng, tables, 50)
+        registry.apply_events(events)
+        for table_id in tables:
+            if engines[table_id].is_match_finished():
+                continue
+            engines[table_id].replay_points(
+                [player for event_table, player in events if event_table == table_id]
+            )
+    
+    for table_id, engine in engines.items():
+        snapshot = registry.snapshot(table_id)
+        assert snapshot.state == engine.get_current_state()
+        assert snapshot.winner == engine.get_winner()
+        assert snapshot.points_played == engine.timeline.point_count
+
+
+def test_snapshots_are_replaced_not_mutated():
+    """Test that a held snapshot mapping never changes."""
+    registry = MatchRegistry()
+    registry.open_match("T1")
+    before = registry.snapshots()
+    
+    registry.add_point("T1", PLAYER_1)
+    
+    assert before["T1"].state.score_player1 == 0
+    assert registry.snapshot("T1").state.score_player1 == 1
+    assert registry.snapshot("T1").version == before["T1"].version + 1
+
+
+def test_finished_match_ignores_points_and_undo():
+    """Test match end, ignored extra points and undo of the winning point."""
+    registry = MatchRegistry()
+    registry.open_match("T1", sets_to_win=1)
+    
+    applied = registry.apply_events([("T1", PLAYER_2)] * 15)
+    assert applied == 11
+    assert registry.snapshot("T1").winner == PLAYER_2
+    
+    assert registry.undo_last_point("T1")
+    snapshot = registry.snapshot("T1")
+    assert snapshot.winner is None
+    assert snapshot.state.score_player2 == 10
+
+
+def test_open_match_on_running_table_fails():
+    """Test that a running match cannot be replaced."""
+    registry = MatchRegistry()
+    registry.open_match("T1")
+    
+    try:
+        registry.open_match("T1")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "still running" in str(e)
+
+
+def test_events_for_unknown_tables_are_skipped():
+    """Test that late events for archived or unopened tables do not abort a batch."""
+    archive = InMemoryMatchArchive()
+    registry = MatchRegistry(archive=archive, memory_budget=0)
+    registry.open_match("T1", sets_to_win=1)
+    registry.open_match("T2")
+    registry.apply_events([("T1", PLAYER_1)] * 11)
+    assert [match.table_id for match in archive.matches] == ["T1"]
+    final = registry.snapshot("T1")
+    
+    applied = registry.apply_events(
+        [("T1", PLAYER_2), ("T2", PLAYER_1), ("T3", PLAYER_1), ("T2", PLAYER_1)]
+    )
+    assert applied == 2
+    assert registry.snapshot("T2").state.score_player1 == 2
+    assert registry.snapshot("T1") is final
+    assert registry.snapshot("T3") is None
+    
+    # Nothing applied: no new snapshot mapping
+    before = registry.snapshots()
+    assert registry.add_point("T1", PLAYER_1) == 0
+    assert registry.snapshots() is before
+
+
+def test_memory_budget_archives_finished_matches():
+    """Test that finished matches are evicted to the archive when over budget."""
+    archive = InMemoryMatchArchive()
+    registry = MatchRegistry(archive=archive, memory_budget=0)
+    
+    registry.open_match("T1", "Alice", "Bob", sets_to_win=2)
+    registry.open_match("T2", sets_to_win=2)
+    registry.apply_events([("T1", PLAYER_1)] * 11 + [("T2", PLAYER_1)] * 5)
+    registry.apply_events([("T1", PLAYER_2)] * 3 + [("T1", PLAYER_1)] * 11)
+    
+    # Only the finished match is archived; the running one stays live
+    assert [match.table_id for match in archive.matches] == ["T1"]
+    assert registry.snapshot("T1").winner == PLAYER_1
+    registry.add_point("T2", PLAYER_2)
+    assert registry.memory_usage > 0
+    
+    archived = archive.get_by_table("T1")[0]
+    engine = archived.to_engine()
+    assert engine.get_winner() == PLAYER_1
+    assert (engine.sets_player1, engine.sets_player2) == (2, 0)
+    assert engine.player1_name == "Alice"
+    assert engine.get_current_state() == registry.snapshot("T1").state
+    
+    # A new match can be opened on the archived table
+    registry.open_match("T1")
+    assert registry.snapshot("T1").points_played == 0
+
+
+def test_concurrent_readers_see_consistent_snapshots():
+    """Test that readers never see a partially applied batch."""
+    registry = MatchRegistry()
+    tables = ["T1", "T2"]
+    for table_id in tables:
+        registry.open_match(table_id, sets_to_win=50)
+    
+    errors = []
+    done = threading.Event()
+    
+    def reader():
+        while not done.is_set():
+            snapshots = registry.snapshots()
+            # Every batch adds one point to each table
+            if snapshots["T1"].points_played != snapshots["T2"].points_played:
+                errors.append(snapshots)
+    
+    thread = threading.Thread(target=reader)
+    thread.start()
+    for _ in range(2000):
+        registry.apply_events([("T1", PLAYER_1), ("T2", PLAYER_2)])
+    done.set()
+    thread.join()
+    
+    assert not errors
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running MatchRegistry tests...")
+    
+    tests = [
+        test_apply_events_matches_engines,
+        test_snapshots_are_replaced_not_mutated,
+        test_finished_match_ignores_points_and_undo,
+        test_open_match_on_running_table_fails,
+        test_events_for_unknown_tables_are_skipped,
+        test_memory_budget_archives_finished_matches,
+        test_concurrent_readers_see_consistent_snapshots,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
@@ -0,0 +1,210 @@
+"""
+Unit Tests for Rule Sets
+========================
+
+Checks the predefined rule sets, handicap starts and that the scalar and
+table-driven engines agree for every variant.
+Run with: pytest tests/test_rules.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.codec import decode_engine, encode_engine
+from core.registry import MatchRegistry
+from core.rules import (
+    LEGACY_21_RULES,
+    RULE_SETS,
+    STANDARD_RULES,
+    RuleSet,
+    handicap_rules,
+)
+from core.transition_table import DEFAULT_RULES
+
+
+def _play(engine, points):
+    for player in points:
+        result = engine.add_point(player)
+        if result.match_won:
+            break
+        if result.set_won:
+            engine.reset_set()
+
+
+def test_standard_rules_match_constants():
+    """Test that the default rule set is the old constant-based rules."""
+    assert STANDARD_RULES.key == DEFAULT_RULES
+    assert STANDARD_RULES.start_scores == (0, 0)
+    assert RULE_SETS["Standard"] is STANDARD_RULES
+    assert MatchEngine().rules is STANDARD_RULES
+
+
+def test_legacy_21_set():
+    """Test set length and serve rotation of the 21-point rules."""
+    engine = MatchEngine(rules=LEGACY_21_RULES, initial_server=PLAYER_1)
+    for _ in range(4):
+        engine.add_point(PLAYER_1)
+    assert engine.server == PLAYER_1
+    engine.add_point(PLAYER_1)
+    assert engine.server == PLAYER_2  # serve changes every 5 points
+
+    for _ in range(15):
+        assert not engine.add_point(PLAYER_1).set_won
+    result = engine.add_point(PLAYER_1)
+    assert result.set_won
+    assert engine.score_player1 == 21
+
+
+def test_legacy_21_deuce():
+    """Test that the serve changes every point from 20:20."""
+    engine = MatchEngine(rules=LEGACY_21_RULES)
+    _play(engine, [PLAYER_1, PLAYER_2] * 20)
+    assert (engine.score_player1, engine.score_player2) == (20, 20)
+    server = engine.server
+    engine.add_point(PLAYER_1)
+    assert engine.server != server
+    assert not engine.add_point(PLAYER_2).set_won
+    engine.add_point(PLAYER_1)
+    assert engine.add_point(PLAYER_1).set_won
+
+
+def test_handicap_start_scores():
+    """Test that every set (and undo back to it) starts at the handicap."""
+    rules = handicap_rules(3, 0)
+    assert rules.name == "Standard (3:0)"
+    engine = MatchEngine(rules=rules)
+    assert (engine.score_player1, engine.score_player2) == (3, 0)
+
+    _play(engine, [PLAYER_1] * 8)
+    assert engine.sets_player1 == 1
+    assert (engine.score_player1, engine.score_player2) == (3, 0)
+
+    engine.undo_last_point()
+    assert (engine.score_player1, engine.score_player2) == (10, 0)
+    engine.rewind_to_point(0)
+    assert (engine.score_player1, engine.score_player2) == (3, 0)
+
+
+def test_handicap_serve_rotation_counts_rallies():
+    """Test that handicap start points do not count for the serve rotation."""
+    rules = handicap_rules(3, 0)
+    for engine in (
+        MatchEngine(rules=rules, initial_server=PLAYER_1),
+        MatchEngine(rules=rules, initial_server=PLAYER_1, use_transition_table=True),
+    ):
+        servers = []
+        for player in (PLAYER_2, PLAYER_1, PLAYER_2, PLAYER_1):
+            servers.append(engine.server)
+            engine.add_point(player)
+        servers.append(engine.server)
+        assert servers == [PLAYER_1, PLAYER_1, PLAYER_2, PLAYER_2, PLAYER_1]
+        assert engine.timeline.state_at_point(2).server == PLAYER_2
+
+
+def test_handicap_find_score():
+    """Test score lookups in the timeline of a handicap match."""
+    engine = MatchEngine(rules=handicap_rules(0, 4))
+    _play(engine, [PLAYER_1] * 11 + [PLAYER_2, PLAYER_1])
+    timeline = engine.timeline
+    assert timeline.state_at_score(0, 0, 5, 4).score_player1 == 5
+    assert timeline.state_at_score(1, 0, 1, 5) is not None
+    assert timeline.state_at_score(0, 0, 1, 0) is None
+
+
+def test_invalid_rules():
+    """Test validation of rule values and start scores."""
+    for kwargs in (
+        {"points_to_win_set": 0},
+        {"serve_change_interval": 0},
+        {"start_score_player1": 11},
+        {"start_score_player2": -1},
+    ):
+        try:
+            RuleSet(**kwargs)
+        except ValueError:
+            pass
+        else:
+            assert False, f"{kwargs} should be rejected"
+
+
+def test_table_matches_scalar_for_all_variants():
+    """Test that the compiled table and the scalar rules agree."""
+    variants = (STANDARD_RULES, LEGACY_21_RULES, handicap_rules(2, 5), handicap_rules(7, 0, LEGACY_21_RULES))
+    for rules in variants:
+        for seed in range(10):
+            rng = random.Random(seed)
+            points = [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(400)]
+            scalar = MatchEngine(sets_to_win=3, rules=rules)
+            table = MatchEngine(sets_to_win=3, rules=rules, use_transition_table=True)
+            _play(scalar, points)
+            table.replay_points(points)
+            assert scalar.get_current_state() == table.get_current_state(), rules.name
+            assert scalar.timeline.events == table.timeline.events
+
+
+def test_rules_survive_codec_and_registry():
+    """Test that the rule set travels with encoded and archived matches."""
+    rules = handicap_rules(0, 2, LEGACY_21_RULES)
+    engine = MatchEngine(rules=rules)
+    _play(engine, [PLAYER_1, PLAYER_2, PLAYER_2] * 10)
+    data = encode_engine(engine)
+    decoded = decode_engine(data)
+    assert decoded.rules == rules
+    assert decoded.get_current_state() == engine.get_current_state()
+
+    standard = encode_engine(MatchEngine(), include_history=False)
+    assert len(standard) == 10
+    assert len(encode_engine(MatchEngine(rules=rules), include_history=False)) == 16
+
+    registry = MatchRegistry()
+    registry.open_match("T1", rules=LEGACY_21_RULES)
+    registry.open_match("T2")
+    registry.apply_events([("T1", PLAYER_1)] * 11 + [("T2", PLAYER_1)] * 11)
+    assert registry.snapshot("T1").state.score_player1 == 11
+    assert registry.snapshot("T2").state.sets_player1 == 1
+    registry.close_match("T1")
+    archived = registry.archive.get_by_table("T1")[0]
+    assert archived.rules is LEGACY_21_RULES
+    assert archived.to_engine().score_player1 == 11
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running rule set tests...")
+    
+    tests = [
+        test_standard_rules_match_constants,
+        test_legacy_21_set,
+        test_legacy_21_deuce,
+        test_handicap_start_scores,
+        test_handicap_serve_rotation_counts_rallies,
+        test_handicap_find_score,
+        test_invalid_rules,
+        test_table_matches_scalar_for_all_variants,
+        test_rules_survive_codec_and_registry,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the Monte Carlo Simulation
+=========================================
+
+Checks the simulator against the MatchEngine rules and the win probability model.
+Run with: pytest tests/test_simulation.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from core.constants import PLAYER_1
+from core.models import MatchState
+from core.simulation import simulate_matches, simulate_round_robin
+from core.win_probability import match_win_probability
+
+
+def test_dominant_player_wins_every_set_to_zero():
+    """Test that a player winning every rally wins every set 11:0."""
+    result = simulate_matches(100, 1.0, 0.0, sets_to_win=3, seed=0)
+    
+    assert np.all(result.winner == PLAYER_1)
+    assert np.all(result.sets_player1 == 3)
+    assert np.all(result.sets_player2 == 0)
+    assert np.all(result.points_played == 33)
+    assert result.set_score_distribution() == {(3, 0): 1.0}
+
+
+def test_endless_deuce_stops_at_max_points():
+    """Test that an endless deuce stops at max_points without a winner."""
+    # Both players always win their own serve: 10:10, then deuce forever
+    result = simulate_matches(50, 1.0, 1.0, sets_to_win=1, seed=0, max_points=300)
+    
+    assert np.all(result.winner == 0)
+    assert np.all(result.points_played == 300)
+
+
+def test_same_seed_same_result():
+    """Test that the same seed reproduces the same matches."""
+    first = simulate_matches(5000, 0.52, 0.48, sets_to_win=2, seed=7)
+    second = simulate_matches(5000, 0.52, 0.48, sets_to_win=2, seed=7)
+    
+    assert np.array_equal(first.winner, second.winner)
+    assert np.array_equal(first.points_played, second.points_played)
+
+
+def test_final_scores_are_valid():
+    """Test that every simulated match ends with a valid final score."""
+    result = simulate_matches(20000, 0.5, 0.5, sets_to_win=3, seed=3)
+    
+    assert np.all(result.winner != 0)
+    winner_sets = np.where(result.winner == PLAYER_1, result.sets_player1, result.sets_player2)
+    loser_sets = np.where(result.winner == PLAYER_1, result.sets_player2, result.sets_player1)
+    assert np.all(winner_sets == 3)
+    assert np.all(loser_sets < 3)
+    # Every set needs at least 11 points
+    assert np.all(result.points_played >= 11 * (winner_sets + loser_sets))
+    assert sum(result.set_score_distribution().values()) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("rates, sets_to_win", [
+    ((0.55, 0.50), 3),
+    ((0.60, 0.65), 2),
+    ((0.45, 0.50), 1),
+])
+def test_win_rate_matches_probability_model(rates, sets_to_win):
+    """Test that the simulated win rate matches the probability model."""
+    count = 200_000
+    result = simulate_matches(count, *rates, sets_to_win=sets_to_win, seed=11)
+    expected = match_win_probability(MatchState(0, 0, 0, 0, PLAYER_1), sets_to_win, *rates)
+    
+    # 5 standard errors
+    tolerance = 5 * (expected * (1 - expected) / count) ** 0.5
+    assert abs(result.win_rate(PLAYER_1) - expected) < tolerance
+
+
+def test_round_robin_standings():
+    """Test that round robin standings are consistent and ordered by strength."""
+    result = simulate_round_robin([0.7, 0.5, 0.3], tournaments=2000, sets_to_win=2, seed=5)
+    
+    assert result.matches_per_tournament == 3
+    # Every match has exactly one winner
+    assert np.all(result.wins.sum(axis=1) == 3)
+    assert np.all(result.set_difference.sum(axis=1) == 0)
+    
+    champion = result.champion_probabilities()
+    assert champion.sum() == pytest.approx(1.0)
+    assert champion[0] > champion[1] > champion[2]
+
+
+def test_invalid_arguments():
+    """Test that invalid probabilities and player counts are rejected."""
+    with pytest.raises(ValueError):
+        simulate_matches(10, 1.5, 0.5)
+    with pytest.raises(ValueError):
+        simulate_round_robin([0.5], tournaments=10)
@@ -0,0 +1,121 @@
+"""
+Unit Tests for the Startup Profile
+==================================
+
+Checks marks, phase durations, the report and the enable/disable hook.
+Run with: pytest tests/test_startup_profile.py -v
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.startup_profile import (
+    StartupProfile,
+    get_startup_profile,
+    enable_startup_profile,
+    disable_startup_profile,
+    mark_process_start,
+    mark_startup,
+)
+
+
+class FakeClock:
+    """Clock returning preset times in order."""
+
+    def __init__(self, *times: float) -> None:
+        self.times = list(times)
+
+    def __call__(self) -> float:
+        return self.times.pop(0)
+
+
+def test_marks_relative_to_origin():
+    """Marks are seconds since the origin, phases since the previous mark."""
+    profile = StartupProfile(origin=10.0, clock=FakeClock(10.5, 10.75, 12.0))
+    assert profile.mark("config") == 0.5
+    profile.mark("qt")
+    profile.mark("window")
+    assert profile.phases() == [
+        ("config", 0.5, 0.5),
+        ("qt", 0.75, 0.25),
+        ("window", 2.0, 1.25),
+    ]
+
+
+def test_report_lists_marks_in_order():
+    """One line per mark with total and phase time in ms."""
+    profile = StartupProfile(origin=0.0, clock=FakeClock(0.012, 0.1))
+    profile.mark("config")
+    profile.mark("first frame")
+    lines = profile.report().splitlines()
+    assert len(lines) == 4
+    assert lines[2].split() == ["12.0", "ms", "12.0", "ms", "config"]
+    assert lines[3].split() == ["100.0", "ms", "88.0", "ms", "first", "frame"]
+
+
+def test_hook_is_noop_while_disabled():
+    """mark_startup() only records while a profile is enabled."""
+    disable_startup_profile()
+    assert get_startup_profile() is None
+    mark_startup("ignored")
+
+    profile = enable_startup_profile()
+    try:
+        assert enable_startup_profile() is profile  # kept
+        mark_startup("recorded")
+        assert [label for label, _ in profile.marks] == ["interpreter started", "recorded"]
+    finally:
+        disable_startup_profile()
+    assert get_startup_profile() is None
+
+
+def test_profile_starts_at_the_process_start():
+    """The default origin is the process start, which includes the interpreter start."""
+    cpu_used = time.process_time()
+    start = mark_process_start()
+    # At least the CPU time used so far lies between the start and now
+    assert start <= time.perf_counter() - cpu_used
+    assert mark_process_start() == start  # the first entry point wins
+
+    disable_startup_profile()
+    try:
+        profile = enable_startup_profile()
+        assert profile.origin == start
+        assert [label for label, _ in profile.marks] == ["interpreter started"]
+    finally:
+        disable_startup_profile()
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running startup profile tests...")
+
+    tests = [
+        test_marks_relative_to_origin,
+        test_report_lists_marks_in_order,
+        test_hook_is_noop_while_disabled,
+        test_profile_starts_at_the_process_start,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
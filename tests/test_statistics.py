@@ -0,0 +1,198 @@
+"""
+Unit Tests for Match Statistics
+===============================
+
+Checks the incremental statistics against a recomputation from the
+timeline, including rollback on undo and rewind.
+Run with: pytest tests/test_statistics.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2, EVENT_RESET_SET, COMEBACK_MIN_DEFICIT
+from core.rules import handicap_rules
+
+
+def _recompute(engine):
+    """Naive statistics from the full history (reference)."""
+    timeline = engine.timeline
+    events = timeline.events
+    served = [0, 0, 0]
+    serve_won = [0, 0, 0]
+    receive_won = [0, 0, 0]
+    longest = [0, 0, 0]
+    comebacks = [0, 0, 0]
+    deuces = 0
+    set_points = [0]
+    run_player, run_length = 0, 0
+    start1, start2 = engine.rules.start_scores
+    deficits = [0, max(start2 - start1, 0), max(start1 - start2, 0)]
+
+    for index, event in enumerate(events):
+        if event == EVENT_RESET_SET:
+            set_points.append(0)
+            deficits = [0, max(start2 - start1, 0), max(start1 - start2, 0)]
+            continue
+        before = timeline.state_after(index)
+        score1, score2, sets1, sets2 = timeline.state_after(index + 1)[:4]
+        server = before[4]
+        served[server] += 1
+        if event == server:
+            serve_won[event] += 1
+        else:
+            receive_won[event] += 1
+        run_length = run_length + 1 if event == run_player else 1
+        run_player = event
+        longest[event] = max(longest[event], run_length)
+        deficits[PLAYER_1] = max(deficits[PLAYER_1], score2 - score1)
+        deficits[PLAYER_2] = max(deficits[PLAYER_2], score1 - score2)
+        if score1 == score2 and score1 >= engine.rules.deuce_threshold:
+            deuces += 1
+        if sets1 > before[2] and deficits[PLAYER_1] >= COMEBACK_MIN_DEFICIT:
+            comebacks[PLAYER_1] += 1
+        if sets2 > before[3] and deficits[PLAYER_2] >= COMEBACK_MIN_DEFICIT:
+            comebacks[PLAYER_2] += 1
+        set_points[-1] += 1
+
+    return {
+        "serve_points_played": served,
+        "serve_points_won": serve_won,
+        "receive_points_won": receive_won,
+        "longest_run": longest,
+        "run": (run_player, run_length),
+        "comebacks": comebacks,
+        "deuces": deuces,
+        "set_points": set_points,
+    }
+
+
+def _current(statistics):
+    return {
+        "serve_points_played": statistics.serve_points_played,
+        "serve_points_won": statistics.serve_points_won,
+        "receive_points_won": statistics.receive_points_won,
+        "longest_run": statistics.longest_run,
+        "run": (statistics.run_player, statistics.run_length),
+        "comebacks": statistics.comebacks,
+        "deuces": statistics.deuces,
+        "set_points": statistics.set_points,
+    }
+
+
+def test_disabled_by_default():
+    """Test that statistics are only kept on request."""
+    assert MatchEngine().statistics is None
+
+
+def test_basic_counters():
+    """Test serve/receive points, runs and points per set."""
+    engine = MatchEngine(initial_server=PLAYER_1, track_statistics=True)
+    for player in (PLAYER_1, PLAYER_1, PLAYER_2, PLAYER_1):
+        engine.add_point(player)
+    stats = engine.statistics
+
+    # Points 1-2 served by player 1, points 3-4 by player 2
+    assert stats.serve_points_played[PLAYER_1] == 2
+    assert stats.serve_points_won[PLAYER_1] == 2
+    assert stats.serve_points_won[PLAYER_2] == 1
+    assert stats.receive_points_won[PLAYER_1] == 1
+    assert stats.longest_run[PLAYER_1] == 2
+    assert (stats.run_player, stats.run_length) == (PLAYER_1, 1)
+    assert stats.points_won(PLAYER_1) == 3
+    assert stats.points_played == 4
+    assert stats.set_points == [4]
+
+
+def test_deuce_and_comeback():
+    """Test deuce counting and a comeback set win."""
+    engine = MatchEngine(track_statistics=True)
+    for _ in range(COMEBACK_MIN_DEFICIT):
+        engine.add_point(PLAYER_2)
+    for _ in range(10):
+        engine.add_point(PLAYER_1)
+    for _ in range(5):
+        engine.add_point(PLAYER_2)
+    assert engine.statistics.deuces == 1  # 10:10
+    engine.add_point(PLAYER_1)
+    engine.add_point(PLAYER_2)
+    assert engine.statistics.deuces == 2  # 11:11
+    engine.add_point(PLAYER_1)
+    result = engine.add_point(PLAYER_1)
+    assert result.set_won and result.winner == PLAYER_1
+    assert engine.statistics.comebacks == [0, 1, 0]
+
+    engine.undo_last_point()
+    assert engine.statistics.comebacks == [0, 0, 0]
+    assert engine.statistics.deuces == 2
+
+
+def test_undo_rolls_back_exactly():
+    """Test random matches with undos against the recomputation."""
+    for seed in range(15):
+        rng = random.Random(seed)
+        rules = handicap_rules(seed % 4, 0) if seed % 3 == 0 else handicap_rules(0, 0)
+        engine = MatchEngine(sets_to_win=3, rules=rules, track_statistics=True)
+        for step in range(400):
+            if engine.is_match_finished():
+                break
+            if rng.random() < 0.15:
+                engine.undo_last_point()
+            else:
+                result = engine.add_point(rng.choice((PLAYER_1, PLAYER_2)))
+                if result.set_won and not result.match_won:
+                    engine.reset_set()
+            if step % 20 == 0:
+                assert _current(engine.statistics) == _recompute(engine)
+        assert _current(engine.statistics) == _recompute(engine)
+
+        engine.rewind_to_point(engine.timeline.point_count // 2)
+        assert _current(engine.statistics) == _recompute(engine)
+        assert len(engine.statistics) == len(engine.timeline)
+
+
+def test_replay_points_feeds_statistics():
+    """Test that the bulk path records the same statistics as add_point."""
+    rng = random.Random(7)
+    points = [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(300)]
+    for use_table in (False, True):
+        engine = MatchEngine(track_statistics=True, use_transition_table=use_table)
+        engine.replay_points(points)
+        assert _current(engine.statistics) == _recompute(engine)
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running statistics tests...")
+    
+    tests = [
+        test_disabled_by_default,
+        test_basic_counters,
+        test_deuce_and_comeback,
+        test_undo_rolls_back_exactly,
+        test_replay_points_feeds_statistics,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
@@ -0,0 +1,154 @@
+"""
+Unit Tests for the Match Timeline
+==================================
+
+Checks time travel on the event log against states recorded while playing.
+Run with: pytest tests/test_timeline.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+
+
+def _play_match(seed, sets_to_win=3, bias=0.5):
+    """Play a random match and record the state after every point.
+    
+    Returns:
+        Tuple of (engine, states by point count, states by (sets, score))
+    """
+    rng = random.Random(seed)
+    engine = MatchEngine(sets_to_win=sets_to_win)
+    by_point = [engine.get_current_state()]
+    by_score = {}
+    sets_before = (0, 0)
+    
+    while not engine.is_match_finished():
+        player = PLAYER_1 if rng.random() < bias else PLAYER_2
+        result = engine.add_point(player)
+        state = engine.get_current_state()
+        by_score.setdefault(sets_before + (state.score_player1, state.score_player2), state)
+        if result.set_won and not result.match_won:
+            engine.reset_set()
+            sets_before = (engine.sets_player1, engine.sets_player2)
+        by_point.append(engine.get_current_state())
+    
+    return engine, by_point, by_score
+
+
+def test_state_at_point():
+    """Test that every point of a match can be looked up."""
+    engine, by_point, _ = _play_match(seed=1, sets_to_win=4)
+    timeline = engine.timeline
+    
+    assert timeline.point_count == len(by_point) - 1
+    for points, state in enumerate(by_point):
+        assert timeline.state_at_point(points) == state
+
+
+def test_state_at_score():
+    """Test lookups by set score and point score."""
+    engine, _, by_score = _play_match(seed=2, sets_to_win=3)
+    timeline = engine.timeline
+    
+    for (sets1, sets2, score1, score2), state in by_score.items():
+        assert timeline.state_at_score(sets1, sets2, score1, score2) == state
+    
+    assert timeline.state_at_score(0, 0, 0, 0).server == PLAYER_1
+    assert timeline.state_at_score(5, 0, 1, 1) is None
+    assert timeline.state_at_score(0, 0, 20, 0) is None
+
+
+def test_state_at_score_long_deuce():
+    """Test a score beyond the precomputed transition table."""
+    engine = MatchEngine(sets_to_win=1)
+    for _ in range(10):
+        engine.add_point(PLAYER_1)
+        engine.add_point(PLAYER_2)
+    for _ in range(40):
+        engine.add_point(PLAYER_1)
+        engine.add_point(PLAYER_2)
+    
+    state = engine.timeline.state_at_score(0, 0, 30, 30)
+    assert (state.score_player1, state.score_player2) == (30, 30)
+    assert state == engine.timeline.state_at_point(60)
+
+
+def test_rewind_to_point():
+    """Test that rewinding truncates the match like repeated undo."""
+    engine, by_point, _ = _play_match(seed=3, sets_to_win=3)
+    
+    engine.rewind_to_point(37)
+    assert engine.get_current_state() == by_point[37]
+    assert engine.timeline.point_count == 37
+    
+    # Play on from the rewound state
+    engine.add_point(PLAYER_2)
+    assert engine.timeline.point_count == 38
+    
+    engine.rewind_to_point(0)
+    assert engine.get_current_state() == by_point[0]
+    assert not engine.undo_last_point()
+
+
+def test_lookup_does_not_change_engine():
+    """Test that time travel queries leave the live state untouched."""
+    engine, by_point, _ = _play_match(seed=4, sets_to_win=2)
+    final = engine.get_current_state()
+    
+    engine.timeline.state_at_point(5)
+    engine.timeline.state_at_score(1, 0, 3, 3)
+    
+    assert engine.get_current_state() == final
+    assert engine.timeline.point_count == len(by_point) - 1
+
+
+def test_point_out_of_range():
+    """Test that invalid point numbers raise IndexError."""
+    engine = MatchEngine()
+    engine.add_point(PLAYER_1)
+    
+    try:
+        engine.timeline.state_at_point(2)
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running MatchTimeline tests...")
+    
+    tests = [
+        test_state_at_point,
+        test_state_at_score,
+        test_state_at_score_long_deuce,
+        test_rewind_to_point,
+        test_lookup_does_not_change_engine,
+        test_point_out_of_range,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
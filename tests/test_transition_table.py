@@ -0,0 +1,131 @@
+"""
+Unit Tests for the Transition Table
+====================================
+
+Checks that table-driven scoring gives exactly the same results as the
+scalar MatchEngine rules.
+Run with: pytest tests/test_transition_table.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.constants import PLAYER_1, PLAYER_2
+from core.transition_table import (
+    DEFAULT_RULES,
+    compute_transition,
+    get_transition_table,
+)
+
+
+def _play(engine, points):
+    """Play points like the UI does (reset after each set) and collect states."""
+    states = []
+    for player in points:
+        result = engine.add_point(player)
+        states.append((result, engine.get_current_state(), engine.initial_server))
+        if result.match_won:
+            break
+        if result.set_won:
+            engine.reset_set()
+    return states
+
+
+def test_table_is_cached_per_rules():
+    """Test that the table is built once per rules tuple."""
+    assert get_transition_table() is get_transition_table(DEFAULT_RULES)
+    assert get_transition_table((21, 2, 5, 20)) is not get_transition_table()
+
+
+def test_table_matches_scalar_rules():
+    """Test every table entry against the scalar transition."""
+    table = get_transition_table()
+    for score1 in range(table.size):
+        for score2 in range(table.size):
+            for server in (PLAYER_1, PLAYER_2):
+                for player in (PLAYER_1, PLAYER_2):
+                    expected = compute_transition(score1, score2, server, player)
+                    assert table.step(score1, score2, server, player) == expected
+
+
+def test_deuce_folding():
+    """Test long deuce scores outside the table."""
+    table = get_transition_table()
+    assert table.step(25, 25, PLAYER_1, PLAYER_2) == (25, 26, PLAYER_2, 0)
+    assert table.step(26, 25, PLAYER_2, PLAYER_1) == (27, 25, PLAYER_1, PLAYER_1)
+    assert table.step(40, 0, PLAYER_1, PLAYER_1) is None
+
+
+def test_engine_table_mode_matches_scalar():
+    """Test that both engine modes produce identical states on random matches."""
+    rng = random.Random(42)
+    for _ in range(200):
+        # Bias towards close scores to exercise deuce
+        points = [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(400)]
+        scalar = MatchEngine(sets_to_win=4)
+        table = MatchEngine(sets_to_win=4, use_transition_table=True)
+        assert _play(scalar, points) == _play(table, points)
+
+
+def test_replay_points_matches_add_point():
+    """Test the bulk replay path in both modes against add_point()."""
+    rng = random.Random(7)
+    for _ in range(100):
+        points = [rng.choice((PLAYER_1, PLAYER_2)) for _ in range(300)]
+        reference = MatchEngine(sets_to_win=3)
+        played = len(_play(reference, points))
+        for use_table in (False, True):
+            engine = MatchEngine(sets_to_win=3, use_transition_table=use_table)
+            assert engine.replay_points(points) == played
+            assert engine.get_current_state() == reference.get_current_state()
+            assert engine.initial_server == reference.initial_server
+            assert engine.undo_last_point()
+
+
+def test_engine_table_mode_undo():
+    """Test undo in table mode."""
+    engine = MatchEngine(sets_to_win=1, use_transition_table=True)
+    for _ in range(10):
+        engine.add_point(PLAYER_1)
+        engine.add_point(PLAYER_2)
+    engine.add_point(PLAYER_1)
+    assert engine.undo_last_point()
+    assert (engine.score_player1, engine.score_player2) == (10, 10)
+
+
+if __name__ == "__main__":
+    # Run tests manually
+    print("Running TransitionTable tests...")
+    
+    tests = [
+        test_table_is_cached_per_rules,
+        test_table_matches_scalar_rules,
+        test_deuce_folding,
+        test_engine_table_mode_matches_scalar,
+        test_replay_points_matches_add_point,
+        test_engine_table_mode_undo,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: Unexpected error: {e}")
+            failed += 1
+    
+    print(f"\n{'='*50}")
+    print(f"Results: {passed} passed, {failed} failed")
+    print(f"{'='*50}")
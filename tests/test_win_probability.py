@@ -0,0 +1,124 @@
+"""
+Unit Tests for the Win Probability Model
+=========================================
+
+Checks the memoized Markov chain against a brute-force recursion over the
+MatchEngine rules.
+Run with: pytest tests/test_win_probability.py -v
+"""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.match_engine import MatchEngine
+from core.models import MatchState
+from core.constants import PLAYER_1, PLAYER_2
+from core.transition_table import compute_transition
+from core.win_probability import (
+    estimate_serve_win_rate,
+    get_win_probability_model,
+    match_win_probability,
+)
+
+RATE1 = 0.58
+RATE2 = 0.52
+
+
+@lru_cache(maxsize=None)
+def _brute_force_set(score1, score2, server):
+    """P(player 1 wins the set) by plain recursion, truncated in long deuces."""
+    if score1 + score2 > 100:
+        return 0.5
+    p = RATE1 if server == PLAYER_1 else 1.0 - RATE2
+    total = 0.0
+    for player, weight in ((PLAYER_1, p), (PLAYER_2, 1.0 - p)):
+        new1, new2, new_server, winner = compute_transition(score1, score2, server, player)
+        if winner:
+            total += weight * (1.0 if winner == PLAYER_1 else 0.0)
+        else:
+            total += weight * _brute_force_set(new1, new2, new_server)
+    return total
+
+
+def _reachable_states(first_server):
+    """All running set scores reachable from 0:0, with their server."""
+    states = {}
+    frontier = [(0, 0, first_server)]
+    while frontier:
+        score1, score2, server = frontier.pop()
+        if (score1, score2) in states:
+            assert states[(score1, score2)] == server  # Server is path-independent
+            continue
+        if score1 + score2 > 30:
+            continue
+        states[(score1, score2)] = server
+        for player in (PLAYER_1, PLAYER_2):
+            new1, new2, new_server, winner = compute_transition(score1, score2, server, player)
+            if not winner:
+                frontier.append((new1, new2, new_server))
+    return states
+
+
+def test_set_probability_matches_brute_force():
+    """Test every set score reachable from 0:0 against the recursion."""
+    model = get_win_probability_model(RATE1, RATE2, sets_to_win=1)
+    for first_server in (PLAYER_1, PLAYER_2):
+        for (score1, score2), server in _reachable_states(first_server).items():
+            expected = _brute_force_set(score1, score2, server)
+            actual = model.set_probability(score1, score2, first_server)
+            assert abs(actual - expected) < 1e-9, (score1, score2, first_server)
+
+
+def test_match_probability_live():
+    """Test the live match probability against the set and match chain."""
+    model = get_win_probability_model(RATE1, RATE2, sets_to_win=3)
+    engine = MatchEngine(sets_to_win=3)
+    start = model.probability(engine.get_current_state())
+    assert 0.5 < start < 1.0  # Player 1 is the better server
+    
+    engine.add_point(PLAYER_1)
+    assert model.probability(engine.get_current_state()) > start
+
+
+def test_finished_and_won_set_states():
+    """Test terminal states and a won set that was not reset yet."""
+    model = get_win_probability_model(RATE1, RATE2, sets_to_win=2)
+    assert model.probability(MatchState(11, 3, 2, 0, PLAYER_1)) == 1.0
+    assert model.probability(MatchState(3, 11, 0, 2, PLAYER_1)) == 0.0
+    
+    engine = MatchEngine(sets_to_win=2)
+    for _ in range(11):
+        engine.add_point(PLAYER_1)
+    before_reset = model.probability(engine.get_current_state())
+    engine.reset_set()
+    assert abs(before_reset - model.probability(engine.get_current_state())) < 1e-12
+
+
+def test_symmetry():
+    """Test that swapping players gives the complementary probability."""
+    state = MatchState(7, 9, 1, 2, PLAYER_2)
+    swapped = MatchState(9, 7, 2, 1, PLAYER_1)
+    p = match_win_probability(state, 3, RATE1, RATE2)
+    q = match_win_probability(swapped, 3, RATE2, RATE1)
+    assert abs(p + q - 1.0) < 1e-12
+
+
+def test_long_deuce_lookup():
+    """Test that long deuces reuse the 10:10 entries."""
+    model = get_win_probability_model(RATE1, RATE2, sets_to_win=1)
+    assert model.set_probability(25, 24, PLAYER_1) == model.set_probability(11, 10, PLAYER_1)
+
+
+def test_models_are_cached():
+    """Test the LRU cache for rate pairs."""
+    assert get_win_probability_model(0.5, 0.5, 3) is get_win_probability_model(0.5, 0.5, 3)
+
+
+def test_estimate_serve_win_rate():
+    """Test the smoothed serve win rate."""
+    assert estimate_serve_win_rate(0, 0) == 0.5
+    assert estimate_serve_win_rate(10, 10) == 0.75
@@ -10,6 +10,12 @@ FEATURES:
 
 import sys
 import random
+import time
+
+# Startzeitpunkt für "Start bis erstes bedienbares Bild" (src.main setzt ihn vorher)
+from src.core.startup_profile import get_startup_profile, mark_process_start, mark_startup
+STARTUP_CLOCK = mark_process_start()
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QStackedWidget, QLineEdit, QFrame, QMessageBox,
@@ -17,17 +23,44 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem, QHeaderView, QInputDialog, QAbstractItemView,
     QComboBox, QRadioButton, QButtonGroup, QCompleter, QDialog
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, QRectF
-from PyQt6.QtGui import QFont, QColor, QPalette, QPixmap, QPainter, QBrush
+from PyQt6.QtCore import Qt, QEvent, QEventLoop, QSize, QTimer, QRectF, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QColor, QPalette, QPixmap, QPainter, QBrush, QKeySequence, QShortcut
 import os
 
-try:
-    import mysql.connector
-    from mysql.connector import Error
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
-    print("⚠️ mysql.connector nicht installiert. Nutze Dummy-Daten.")
+mark_startup("PyQt6 imported")
+
+from src.config import get_app_config
+from src.core.constants import EVENT_RESET_SET, EVENT_UNDO, PageIndex
+from src.core.input_queue import LatencyRecorder, PointInputQueue
+from src.core.journal import JournalHeader, PointJournal, read_journal
+from src.core.match_engine import MatchEngine
+from src.core.perf_stats import get_perf_stats
+from src.core.win_probability import estimate_serve_win_rate, match_win_probability
+from src.ui.widgets.score_display import ScoreDisplay
+from src.ui.screens import spectator_screen
+from src.ui.style import load_stylesheet, set_style_state
+from src.ui.widgets.touch_keyboard import TouchKeyboard
+
+mark_startup("GUI modules imported")
+
+# mysql.connector wird erst beim Verbinden geladen (load_mysql), nicht beim Start
+mysql = None
+Error = Exception
+MYSQL_AVAILABLE = None  # None = noch nicht versucht
+
+
+def load_mysql():
+    """Importiert mysql.connector beim ersten Verbindungsaufbau."""
+    global mysql, Error, MYSQL_AVAILABLE
+    if MYSQL_AVAILABLE is None:
+        try:
+            import mysql.connector
+            from mysql.connector import Error
+            MYSQL_AVAILABLE = True
+        except ImportError:
+            MYSQL_AVAILABLE = False
+            print("⚠️ mysql.connector nicht installiert. Nutze Dummy-Daten.")
+    return MYSQL_AVAILABLE
 
 
 # ==================== DATENBANK-KONFIGURATION ====================
@@ -40,131 +73,6 @@ DB_CONFIG = {
 }
 
 
-# ==================== STYLESHEET (Globales Dark Theme) ====================
-DARK_STYLESHEET = """
-QMainWindow, QWidget {
-    background-color: #1a1a2e;
-    color: #ffffff;
-}
-
-QLabel {
-    color: #ffffff;
-    font-family: 'Segoe UI', Arial, sans-serif;
-}
-
-QPushButton {
-    background-color: #16213e;
-    color: #ffffff;
-    border: 2px solid #0f3460;
-    border-radius: 15px;
-    padding: 20px;
-    font-size: 22px;
-    font-weight: bold;
-    font-family: 'Segoe UI', Arial, sans-serif;
-    min-height: 60px;
-}
-
-QPushButton:hover {
-    background-color: #0f3460;
-    border-color: #00d9ff;
-}
-
-QPushButton:pressed {
-    background-color: #00d9ff;
-    color: #1a1a2e;
-}
-
-QPushButton#primary {
-    background-color: #00d9ff;
-    color: #1a1a2e;
-    border: none;
-}
-
-QPushButton#primary:hover {
-    background-color: #00b8d4;
-}
-
-QPushButton#danger {
-    background-color: #e94560;
-    border-color: #e94560;
-}
-
-QPushButton#danger:hover {
-    background-color: #c73e54;
-}
-
-QPushButton#score {
-    background-color: #0f3460;
-    border: 3px solid #00d9ff;
-    border-radius: 20px;
-    font-size: 48px;
-    min-width: 120px;
-    min-height: 120px;
-}
-
-QPushButton#score:pressed {
-    background-color: #00d9ff;
-    color: #1a1a2e;
-}
-
-QLineEdit {
-    background-color: #16213e;
-    color: #ffffff;
-    border: 2px solid #0f3460;
-    border-radius: 10px;
-    padding: 15px;
-    font-size: 22px;
-    min-height: 50px;
-}
-
-QLineEdit:focus {
-    border-color: #00d9ff;
-}
-
-QLineEdit::placeholder {
-    color: #666666;
-}
-
-QFrame#separator {
-    background-color: #0f3460;
-    max-height: 2px;
-}
-
-QLabel#title {
-    color: #00d9ff;
-    font-size: 48px;
-    font-weight: bold;
-}
-
-QLabel#subtitle {
-    color: #888888;
-    font-size: 18px;
-}
-
-QLabel#scoreBig {
-    color: #ffffff;
-    font-size: 540px;
-    font-weight: bold;
-}
-
-QLabel#playerName {
-    color: #00d9ff;
-    font-size: 48px;
-    font-weight: bold;
-}
-
-QLabel#setScore {
-    color: #ffffff;
-    font-size: 108px;
-    font-weight: bold;
-}
-
-QLabel#setLabel {
-    color: #888888;
-    font-size: 24px;
-}
-"""
-
 # ==================== HILFSFUNKTION FÜR RAHMENLOSE POPUPS ====================
 def show_custom_confirm_dialog(parent, title, text):
     """Zeigt ein rahmenloses Bestätigungsfenster an (Style wie Info-Dialog).
@@ -182,24 +90,12 @@ def show_custom_confirm_dialog(parent, title, text):
     layout.setSpacing(20)
     layout.setContentsMargins(30, 30, 30, 40)
     
-    # Style setzen
-    dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a2e;
-            border: 3px solid #00d9ff;
-            border-radius: 15px;
-        }
-    """)
+    # Style: QDialog#popupDialog in styles.qss
+    dialog.setObjectName("popupDialog")
     
     # Text Label
     lbl_text = QLabel(text)
-    lbl_text.setStyleSheet("""
-        color: white;
-        font-size: 22px;
-        font-weight: bold;
-        background: transparent;
-        border: none;
-    """)
+    lbl_text.setObjectName("popupText")
     lbl_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
     lbl_text.setWordWrap(True)
     layout.addWidget(lbl_text)
@@ -212,52 +108,20 @@ def show_custom_confirm_dialog(parent, title, text):
     # Ja Button (Blau)
     btn_yes = QPushButton("Ja")
     btn_yes.setCursor(Qt.CursorShape.PointingHandCursor)
-    btn_yes.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #00d9ff;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-        }
-    """)
     btn_yes.clicked.connect(dialog.accept)
     btn_layout.addWidget(btn_yes)
     
     # Nein Button (Rot)
     btn_no = QPushButton("Nein")
     btn_no.setCursor(Qt.CursorShape.PointingHandCursor)
-    btn_no.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #e94560;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #e94560;
-        }
-    """)
+    btn_no.setObjectName("popupCancel")
     btn_no.clicked.connect(dialog.reject)
     btn_layout.addWidget(btn_no)
     
     # Buttons zentriert ins Layout
     wrapper_widget = QWidget()
     wrapper_widget.setLayout(btn_layout)
-    wrapper_widget.setStyleSheet("background: transparent; border: none;")
+    wrapper_widget.setObjectName("popupButtons")
     layout.addWidget(wrapper_widget, 0, Qt.AlignmentFlag.AlignCenter)
     
     return dialog.exec() == QDialog.DialogCode.Accepted
@@ -280,40 +144,12 @@ def show_custom_info_dialog(parent, title, text, cancel_text=None):
     layout.setSpacing(20)
     layout.setContentsMargins(30, 30, 30, 40)
     
-    # Style setzen - Identisch zu show_custom_confirm_dialog
-    dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a2e;
-            border: 3px solid #00d9ff;
-            border-radius: 15px;
-        }
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 2px solid #0f3460;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-            border-color: #00d9ff;
-        }
-    """)
+    # Style - Identisch zu show_custom_confirm_dialog
+    dialog.setObjectName("popupDialog")
     
     # Text Label
     lbl_text = QLabel(text)
-    lbl_text.setStyleSheet("""
-        color: white;
-        font-size: 22px;
-        font-weight: bold;
-        background: transparent;
-        border: none;
-    """)
+    lbl_text.setObjectName("popupText")
     lbl_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
     lbl_text.setWordWrap(True)
     layout.addWidget(lbl_text)
@@ -327,23 +163,6 @@ def show_custom_info_dialog(parent, title, text, cancel_text=None):
     btn_ok = QPushButton("OK")
     btn_ok.setCursor(Qt.CursorShape.PointingHandCursor)
     # OK Button bekommt blauen Rahmen
-    btn_ok.setStyleSheet("""
-        QPushButton {
-            background-color: #16213e;
-            color: white;
-            border: 3px solid #00d9ff;
-            border-radius: 10px;
-            font-size: 22px;
-            font-weight: bold;
-            min-width: 140px;
-            min-height: 60px;
-            padding: 10px;
-        }
-        QPushButton:hover {
-            background-color: #00d9ff;
-            color: #1a1a2e;
-        }
-    """)
     btn_ok.clicked.connect(dialog.accept)
     btn_layout.addWidget(btn_ok)
     
@@ -352,22 +171,7 @@ def show_custom_info_dialog(parent, title, text, cancel_text=None):
         btn_cancel = QPushButton(cancel_text)
         btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
         # Cancel Button bekommt roten Rahmen
-        btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #16213e;
-                color: white;
-                border: 3px solid #e94560;
-                border-radius: 10px;
-                font-size: 22px;
-                font-weight: bold;
-                min-width: 140px;
-                min-height: 60px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e94560;
-            }
-        """)
+        btn_cancel.setObjectName("popupCancel")
         btn_cancel.clicked.connect(dialog.reject)
         btn_layout.addWidget(btn_cancel)
     
@@ -375,12 +179,19 @@ def show_custom_info_dialog(parent, title, text, cancel_text=None):
     wrapper_widget = QWidget()
     wrapper_widget.setLayout(btn_layout)
     # WICHTIG: Transparent background für Wrapper, sonst grauer Kasten
-    wrapper_widget.setStyleSheet("background: transparent; border: none;")
+    wrapper_widget.setObjectName("popupButtons")
     layout.addWidget(wrapper_widget, 0, Qt.AlignmentFlag.AlignCenter)
     
     return dialog.exec() == QDialog.DialogCode.Accepted
 
 
+def keep_size_when_hidden(widget):
+    """Unsichtbares Widget behält seinen Platz im Layout (kein Springen beim Umschalten)."""
+    policy = widget.sizePolicy()
+    policy.setRetainSizeWhenHidden(True)
+    widget.setSizePolicy(policy)
+
+
 # ==================== KONFETTI-OVERLAY FÜR SATZGEWINN ====================
 class ConfettiParticle:
     """Einzelnes Konfetti-Partikel für Explosionseffekt."""
@@ -424,7 +235,6 @@ class ConfettiOverlay(QWidget):
         # Transparenter Hintergrund
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self.setStyleSheet("background: transparent;")
         
         # Konfetti-Farben (festlich)
         self.colors = [
@@ -533,19 +343,21 @@ class ConfettiOverlay(QWidget):
 
 # ==================== VOLLBILD TOUCH-TASTATUR ====================
 class FullscreenKeyboardPage(QWidget):
-    """Vollbild Touch-Tastatur Seite."""
+    """Vollbild Touch-Tastatur Seite.
+    
+    Einzige Tastatur der App (Spielernamen, Turniername): Seite und Tasten
+    werden einmal gebaut, open_for_field() richtet sie nur neu aus.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
         self.target_field = None  # Welches Feld wird bearbeitet
-        self.callback = None  # Callback nach Eingabe
-        self.shift_active = False
+        self.callback = None  # callback(accepted) nach Eingabe
+        self.all_suggestions = []
         self.setup_ui()
     
     def setup_ui(self):
-        self.setStyleSheet("background-color: #1a1a2e;")
-        
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -560,7 +372,7 @@ class FullscreenKeyboardPage(QWidget):
         
         # Titel in der Mitte
         self.title_label = QLabel("Eingabe")
-        self.title_label.setStyleSheet("font-size: 28px; color: #00d9ff; font-weight: bold;")
+        self.title_label.setObjectName("keyboardTitle")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         top_layout.addWidget(self.title_label, 1)
         
@@ -578,33 +390,14 @@ class FullscreenKeyboardPage(QWidget):
         
         self.input_field = QLineEdit()
         self.input_field.setMinimumHeight(80)
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background-color: #16213e;
-                color: white;
-                border: 3px solid #00d9ff;
-                border-radius: 15px;
-                padding: 15px;
-                font-size: 32px;
-            }
-        """)
+        self.input_field.setObjectName("keyboardInput")
         self.input_field.setReadOnly(True)
         input_row.addWidget(self.input_field)
         
         # Dropdown-Button für Vorschläge
         self.btn_dropdown = QPushButton("▼")
         self.btn_dropdown.setFixedSize(80, 80)
-        self.btn_dropdown.setStyleSheet("""
-            QPushButton {
-                background-color: #00d9ff;
-                color: #1a1a2e;
-                border: none;
-                border-radius: 15px;
-                font-size: 28px;
-                font-weight: bold;
-            }
-            QPushButton:pressed { background-color: #00b8d4; }
-        """)
+        self.btn_dropdown.setObjectName("suggestionToggle")
         self.btn_dropdown.clicked.connect(self.toggle_suggestions)
         input_row.addWidget(self.btn_dropdown)
         
@@ -613,205 +406,39 @@ class FullscreenKeyboardPage(QWidget):
         # Vorschlagsliste (zunächst versteckt)
         self.suggestions_list = QListWidget()
         self.suggestions_list.setMaximumHeight(200)
-        self.suggestions_list.setStyleSheet("""
-            QListWidget {
-                background-color: #16213e;
-                color: white;
-                border: 2px solid #00d9ff;
-                border-radius: 10px;
-                font-size: 24px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 12px;
-                border-bottom: 1px solid #0f3460;
-            }
-            QListWidget::item:selected {
-                background-color: #00d9ff;
-                color: #1a1a2e;
-            }
-        """)
+        self.suggestions_list.setObjectName("suggestionList")
         self.suggestions_list.itemClicked.connect(self.on_suggestion_selected)
         self.suggestions_list.hide()
         layout.addWidget(self.suggestions_list)
         
         layout.addSpacing(20)
         
-        # ===== Tastatur =====
-        keyboard_widget = QWidget()
-        keyboard_layout = QVBoxLayout(keyboard_widget)
-        keyboard_layout.setSpacing(8)
-        
-        # Schweizer QWERTZ Layout
-        rows = [
-            ['Q', 'W', 'E', 'R', 'T', 'Z', 'U', 'I', 'O', 'P', 'Ü'],
-            ['A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Ö', 'Ä'],
-            ['⇧', 'Y', 'X', 'C', 'V', 'B', 'N', 'M', '⌫'],
-            ['←', '___SPACE___', '✓']
-        ]
-        
-        self.shift_btn = None  # Referenz für Farbwechsel
-        self.letter_buttons = []  # Referenzen für Buchstaben-Tasten
-        self.number_mode = False
-        
-        for row in rows:
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(6)
-            
-            for key in row:
-                btn = QPushButton()
-                btn.setMinimumHeight(65)
-                
-                if key == '___SPACE___':
-                    btn.setText("")
-                    btn.setMinimumWidth(600)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    actual_key = ' '
-                elif key == '✓':
-                    btn.setText("OK")
-                    btn.setMinimumWidth(120)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #00d9ff;
-                            color: #1a1a2e;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 18px;
-                            font-weight: bold;
-                        }
-                        QPushButton:pressed { background-color: #00b8d4; }
-                    """)
-                    actual_key = key
-                elif key == '⌫':
-                    btn.setText("⌫")
-                    btn.setMinimumWidth(70)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 24px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    actual_key = key
-                elif key == '⇧':
-                    btn.setText("⇧")
-                    btn.setMinimumWidth(55)
-                    self.shift_btn = btn  # Speichere Referenz
-                    self.update_shift_button_style()
-                    actual_key = key
-                elif key == '←':
-                    btn.setText("←")
-                    btn.setMinimumWidth(55)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #e94560;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 20px;
-                        }
-                        QPushButton:pressed { background-color: #c73648; }
-                    """)
-                    actual_key = '←'
-                else:
-                    btn.setText(key.lower())  # Standardmäßig klein
-                    btn.setMinimumWidth(55)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #4a4a5a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 22px;
-                            font-weight: bold;
-                        }
-                        QPushButton:pressed { background-color: #6a6a7a; }
-                    """)
-                    actual_key = key
-                    self.letter_buttons.append((btn, key))  # Speichere Referenz
-                
-                btn.clicked.connect(lambda checked, k=actual_key: self.key_pressed(k))
-                row_layout.addWidget(btn)
-            
-            keyboard_layout.addLayout(row_layout)
-        
-        layout.addWidget(keyboard_widget)
+        # ===== Tastatur (tippt in das Eingabefeld der Seite) =====
+        self.keyboard = TouchKeyboard()
+        self.keyboard.set_target(self.input_field)
+        self.keyboard.accepted.connect(self.on_confirm)
+        self.keyboard.cancelled.connect(self.on_exit)  # Zurück ohne zu speichern
+        layout.addWidget(self.keyboard)
         layout.addStretch()
     
-    def update_shift_button_style(self):
-        """Aktualisiert Shift-Button Farbe basierend auf Status."""
-        if self.shift_btn:
-            if self.shift_active:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00d9ff;
-                        color: #1a1a2e;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 24px;
-                    }
-                """)
-            else:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a4a;
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 24px;
-                    }
-                    QPushButton:pressed { background-color: #5a5a6a; }
-                """)
-        
-        # Buchstaben groß/klein aktualisieren
-        for btn, key in self.letter_buttons:
-            if self.shift_active:
-                btn.setText(key.upper())
-            else:
-                btn.setText(key.lower())
-    
-    def key_pressed(self, key):
-        """Verarbeitet Tastendruck."""
-        current = self.input_field.text()
-        
-        if key == '⌫':
-            self.input_field.setText(current[:-1])
-        elif key == '⇧':
-            self.shift_active = not self.shift_active
-            self.update_shift_button_style()
-        elif key == '✓':
-            self.on_confirm()
-        elif key == ' ':
-            self.input_field.setText(current + ' ')
-        elif key == '←':
-            self.on_exit()  # Zurück ohne zu speichern
-        else:
-            char = key.lower() if not self.shift_active else key.upper()
-            self.input_field.setText(current + char)
-            if self.shift_active:
-                self.shift_active = False
-                self.update_shift_button_style()
-    
-    def open_for_field(self, target_line_edit, callback, title="Eingabe"):
-        """Öffnet Tastatur für ein bestimmtes Feld."""
+    def open_for_field(self, target_line_edit, callback, title="Eingabe", placeholder="", suggestions=True):
+        """Öffnet Tastatur für ein bestimmtes Feld.
+        
+        callback(accepted) wird beim Verlassen aufgerufen; nur bei OK wird der
+        Text ins Feld übernommen. Vorschläge (Spielernamen) sind abschaltbar.
+        """
         self.target_field = target_line_edit
         self.callback = callback
         self.input_field.setText(target_line_edit.text())
-        self.shift_active = False
+        self.input_field.setPlaceholderText(placeholder)
+        self.keyboard.set_target(self.input_field)  # Shift aus
         self.suggestions_list.hide()
+        self.btn_dropdown.setVisible(suggestions)
         self.title_label.setText(title)
-        self.load_suggestions()
+        if suggestions:
+            self.load_suggestions()
+        else:
+            self.all_suggestions = []
     
     def load_suggestions(self):
         """Lädt Spielervorschläge aus der Datenbank."""
@@ -847,527 +474,37 @@ class FullscreenKeyboardPage(QWidget):
         if self.target_field:
             self.target_field.setText(self.input_field.text())
         if self.callback:
-            self.callback()
+            self.callback(True)
     
     def on_exit(self):
         """Beenden ohne Speichern."""
         if self.callback:
-            self.callback()
+            self.callback(False)
 
-class TouchKeyboard(QWidget):
-    """Wiederverwendbare Touch-Tastatur Komponente."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.target_field = None
-        self.shift_active = False
-        self.letter_buttons = []  # Referenzen für Buchstaben-Tasten
-        self.shift_btn = None
-        self.setup_ui()
-        
-    def set_target(self, target_line_edit):
-        self.target_field = target_line_edit
-        
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Schweizer QWERTZ Layout
-        rows = [
-            ['Q', 'W', 'E', 'R', 'T', 'Z', 'U', 'I', 'O', 'P', 'Ü'],
-            ['A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Ö', 'Ä'],
-            ['⇧', 'Y', 'X', 'C', 'V', 'B', 'N', 'M', '⌫'],
-            [' ', '___SPACE___', ' '] # Vereinfacht
-        ]
-        
-        for row in rows:
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(8)
-            
-            for key in row:
-                if key == ' ': # Spacer
-                    continue
-                    
-                btn = QPushButton()
-                btn.setMinimumHeight(80)  # Größer: von 60 auf 80
-                
-                actual_key = key
-                
-                if key == '___SPACE___':
-                    btn.setText("SPACE")
-                    btn.setMinimumWidth(450)  # Größer: von 300 auf 450
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 24px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    actual_key = ' '
-                elif key == '⌫':
-                    btn.setText("⌫")
-                    btn.setMinimumWidth(90)  # Größer: von 60 auf 90
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 28px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    actual_key = key
-                elif key == '⇧':
-                    btn.setText("⇧")
-                    btn.setMinimumWidth(75)  # Größer: von 50 auf 75
-                    self.shift_btn = btn
-                    self.update_shift_button_style()
-                    actual_key = key
-                else:
-                    btn.setText(key.lower())
-                    btn.setMinimumWidth(65)  # Größer: von 45 auf 65
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #4a4a5a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 26px;
-                            font-weight: bold;
-                        }
-                        QPushButton:pressed { background-color: #6a6a7a; }
-                    """)
-                    actual_key = key
-                    self.letter_buttons.append((btn, key))
-                
-                btn.clicked.connect(lambda checked, k=actual_key: self.key_pressed(k))
-                row_layout.addWidget(btn)
-            
-            layout.addLayout(row_layout)
-            
-    def update_shift_button_style(self):
-        if self.shift_btn:
-            if self.shift_active:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00d9ff;
-                        color: #1a1a2e;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 28px;
-                    }
-                """)
-            else:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a4a;
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 28px;
-                    }
-                    QPushButton:pressed { background-color: #5a5a6a; }
-                """)
-        
-        for btn, key in self.letter_buttons:
-            if self.shift_active:
-                btn.setText(key.upper())
-            else:
-                btn.setText(key.lower())
 
-    def key_pressed(self, key):
-        if not self.target_field:
-            return
-            
-        current = self.target_field.text()
-        
-        if key == '⌫':
-            self.target_field.setText(current[:-1])
-        elif key == '⇧':
-            self.shift_active = not self.shift_active
-            self.update_shift_button_style()
-        else:
-            char = key.lower() if not self.shift_active else key.upper()
-            self.target_field.setText(current + char)
-            
-            if self.shift_active:
-                self.shift_active = False
-                self.update_shift_button_style()
-class TouchInputDialog(QWidget):
-    """Dialog mit Touch-Tastatur für Texteingabe."""
+# ==================== NEUES TURNIER (NAME + MODUS) ====================
+def get_turnier_info(parent):
+    """Fragt nacheinander Turniername (Vollbild-Tastatur) und Spielmodus ab.
+       Returns: (name, sets_to_win, ok)
+    """
+    # Schritt 1: Name eingeben
+    tournament_name, ok = parent.window().ask_text("Turniername", "Turniername eingeben...")
+    tournament_name = tournament_name.strip()
+    if not ok or not tournament_name:
+        return "", 3, False
     
-    def __init__(self, parent, title, label):
-        super().__init__(parent, Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
-        self.result_text = ""
-        self.accepted = False
-        self.setup_ui(title, label)
-    
-    def setup_ui(self, title, label):
-        self.setStyleSheet("""
-            TouchInputDialog {
-                background-color: #1a1a2e;
-                border: 3px solid #00d9ff;
-                border-radius: 15px;
-            }
-        """)
-        self.setMinimumSize(600, 450)
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Titel
-        title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 26px; color: #00d9ff; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # Label
-        lbl = QLabel(label)
-        lbl.setStyleSheet("font-size: 20px; color: white;")
-        layout.addWidget(lbl)
-        
-        # Eingabefeld
-        self.input_field = QLineEdit()
-        self.input_field.setMinimumHeight(50)
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background-color: #16213e;
-                color: white;
-                border: 2px solid #0f3460;
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 20px;
-            }
-        """)
-        layout.addWidget(self.input_field)
-        
-        # Touch-Tastatur
-        self.keyboard = TouchKeyboard(self)
-        self.keyboard.set_target(self.input_field)
-        self.keyboard.show()  # Immer sichtbar im Dialog
-        layout.addWidget(self.keyboard)
-        
-        # Buttons
-        btn_layout = QHBoxLayout()
-        
-        btn_cancel = QPushButton("Abbrechen")
-        btn_cancel.setMinimumHeight(50)
-        btn_cancel.setStyleSheet("""
-            QPushButton { background-color: #16213e; color: white; border: 2px solid #e94560; border-radius: 10px; font-size: 18px; }
-            QPushButton:pressed { background-color: #e94560; }
-        """)
-        btn_cancel.clicked.connect(self.on_cancel)
-        btn_layout.addWidget(btn_cancel)
-        
-        btn_ok = QPushButton("OK")
-        btn_ok.setMinimumHeight(50)
-        btn_ok.setStyleSheet("""
-            QPushButton { background-color: #00d9ff; color: #1a1a2e; border: none; border-radius: 10px; font-size: 18px; font-weight: bold; }
-            QPushButton:pressed { background-color: #00b8d4; }
-        """)
-        btn_ok.clicked.connect(self.on_ok)
-        btn_layout.addWidget(btn_ok)
-        
-        layout.addLayout(btn_layout)
+    # Schritt 2: Spielmodus wählen
+    mode_dialog = TurnierModeDialog(parent, tournament_name)
+    mode_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+    mode_dialog.show()
     
-    def on_ok(self):
-        self.result_text = self.input_field.text()
-        self.accepted = True
-        self.close()
+    while mode_dialog.isVisible():
+        QApplication.processEvents()
     
-    def on_cancel(self):
-        self.result_text = ""
-        self.accepted = False
-        self.close()
+    if not mode_dialog.accepted:
+        return tournament_name, 3, False
     
-    @staticmethod
-    def get_text(parent, title, label):
-        """Zeigt den Dialog und gibt (text, ok) zurück."""
-        dialog = TouchInputDialog(parent, title, label)
-        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        
-        # Dialog zentrieren
-        if parent:
-            parent_rect = parent.window().geometry()
-            dialog.move(
-                parent_rect.center().x() - dialog.width() // 2,
-                parent_rect.center().y() - dialog.height() // 2
-            )
-        
-        dialog.show()
-        
-        # Event-Loop bis Dialog geschlossen
-        from PyQt6.QtCore import QEventLoop
-        loop = QEventLoop()
-        dialog.destroyed.connect(loop.quit)
-        
-        # Workaround: Warten auf Schließen
-        while dialog.isVisible():
-            QApplication.processEvents()
-        
-        return dialog.result_text, dialog.accepted
-
-
-
-
-# ==================== TURNIER-NAME DIALOG (MIT TASTATUR) ====================
-class NewTurnierDialog(QDialog):
-    """Dialog zum Eingeben des Turniernamens - mit Touch-Tastatur wie bei Spielername."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent, Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
-        self.result_name = ""
-        self.accepted = False
-        self.setup_ui()
-        
-    def setup_ui(self):
-        # VOLLBILD - exakt wie FullscreenKeyboardPage
-        self.setStyleSheet("background-color: #1a1a2e;")
-        if self.parent():
-            self.setGeometry(self.parent().geometry())
-        else:
-            self.showMaximized()
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # ===== Oben: Titel zentriert (gleiche Grösse wie "Spieler 1") =====
-        top_layout = QHBoxLayout()
-        
-        spacer_left = QWidget()
-        spacer_left.setFixedWidth(60)
-        top_layout.addWidget(spacer_left)
-        
-        title = QLabel("Turniername")
-        title.setStyleSheet("font-size: 28px; color: #00d9ff; font-weight: bold;")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        top_layout.addWidget(title, 1)
-        
-        spacer_right = QWidget()
-        spacer_right.setFixedWidth(60)
-        top_layout.addWidget(spacer_right)
-        
-        layout.addLayout(top_layout)
-        
-        # ===== Mitte: Eingabefeld (wie FullscreenKeyboardPage) =====
-        layout.addStretch()
-        
-        self.input_name = QLineEdit()
-        self.input_name.setPlaceholderText("Turniername eingeben...")
-        self.input_name.setMinimumHeight(80)
-        self.input_name.setStyleSheet("""
-            QLineEdit {
-                background-color: #16213e;
-                color: white;
-                border: 3px solid #00d9ff;
-                border-radius: 15px;
-                padding: 15px;
-                font-size: 32px;
-            }
-        """)
-        self.input_name.setReadOnly(True)
-        layout.addWidget(self.input_name)
-        
-        layout.addSpacing(20)
-        
-        # ===== Tastatur (EXAKT wie FullscreenKeyboardPage) =====
-        keyboard_widget = QWidget()
-        keyboard_layout = QVBoxLayout(keyboard_widget)
-        keyboard_layout.setSpacing(8)
-        
-        rows = [
-            ['Q', 'W', 'E', 'R', 'T', 'Z', 'U', 'I', 'O', 'P', 'Ü'],
-            ['A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Ö', 'Ä'],
-            ['⇧', 'Y', 'X', 'C', 'V', 'B', 'N', 'M', '⌫'],
-            ['←', '___SPACE___', '✓']
-        ]
-        
-        self.shift_active = False
-        self.shift_btn = None
-        self.letter_buttons = []
-        
-        for row in rows:
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(6)
-            
-            for key in row:
-                btn = QPushButton()
-                btn.setMinimumHeight(65)
-                
-                if key == '___SPACE___':
-                    btn.setText("")
-                    btn.setMinimumWidth(600)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    btn.clicked.connect(lambda: self.add_char(' '))
-                elif key == '✓':
-                    btn.setText("OK")
-                    btn.setMinimumWidth(120)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #00d9ff;
-                            color: #1a1a2e;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 18px;
-                            font-weight: bold;
-                        }
-                        QPushButton:pressed { background-color: #00b8d4; }
-                    """)
-                    btn.clicked.connect(self.on_accept)
-                elif key == '⌫':
-                    btn.setText("⌫")
-                    btn.setMinimumWidth(70)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #3a3a4a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 24px;
-                        }
-                        QPushButton:pressed { background-color: #5a5a6a; }
-                    """)
-                    btn.clicked.connect(self.backspace)
-                elif key == '⇧':
-                    btn.setText("⇧")
-                    btn.setMinimumWidth(55)
-                    self.shift_btn = btn
-                    self.update_shift_style()
-                    btn.clicked.connect(self.toggle_shift)
-                elif key == '←':
-                    btn.setText("←")
-                    btn.setMinimumWidth(55)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #e94560;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 20px;
-                        }
-                        QPushButton:pressed { background-color: #c73648; }
-                    """)
-                    btn.clicked.connect(self.reject)
-                else:
-                    btn.setText(key.lower())
-                    btn.setMinimumWidth(55)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #4a4a5a;
-                            color: white;
-                            border: none;
-                            border-radius: 8px;
-                            font-size: 22px;
-                            font-weight: bold;
-                        }
-                        QPushButton:pressed { background-color: #6a6a7a; }
-                    """)
-                    btn.clicked.connect(lambda checked, k=key: self.add_char(k))
-                    self.letter_buttons.append((btn, key))
-                
-                row_layout.addWidget(btn)
-            
-            keyboard_layout.addLayout(row_layout)
-        
-        layout.addWidget(keyboard_widget)
-        layout.addStretch()
-    
-    def add_char(self, key):
-        current = self.input_name.text()
-        char = key.lower() if not self.shift_active else key.upper()
-        self.input_name.setText(current + char)
-        if self.shift_active:
-            self.shift_active = False
-            self.update_shift_style()
-    
-    def backspace(self): 
-        current = self.input_name.text()
-        self.input_name.setText(current[:-1])
-    
-    def toggle_shift(self):
-        self.shift_active = not self.shift_active
-        self.update_shift_style()
-    
-    def update_shift_style(self):
-        """Aktualisiert Shift-Button Farbe basierend auf Status."""
-        if self.shift_btn:
-            if self.shift_active:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00d9ff;
-                        color: #1a1a2e;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 24px;
-                    }
-                """)
-            else:
-                self.shift_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a4a;
-                        color: white;
-                        border: none;
-                        border-radius: 8px;
-                        font-size: 24px;
-                    }
-                    QPushButton:pressed { background-color: #5a5a6a; }
-                """)
-        
-        # Buchstaben groß/klein aktualisieren
-        for btn, key in self.letter_buttons:
-            if self.shift_active:
-                btn.setText(key.upper())
-            else:
-                btn.setText(key.lower())
-        
-    def on_accept(self):
-        self.result_name = self.input_name.text()
-        self.accepted = True
-        self.close()
-    
-    @staticmethod
-    def get_turnier_info(parent):
-        """Zeigt beide Dialoge nacheinander: Name-Eingabe, dann Modus-Auswahl."""
-        # Schritt 1: Name eingeben
-        name_dialog = NewTurnierDialog(parent)
-        name_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        name_dialog.show()
-        
-        while name_dialog.isVisible():
-            QApplication.processEvents()
-        
-        if not name_dialog.accepted or not name_dialog.result_name.strip():
-            return "", 3, False
-        
-        tournament_name = name_dialog.result_name.strip()
-        
-        # Schritt 2: Spielmodus wählen
-        mode_dialog = TurnierModeDialog(parent, tournament_name)
-        mode_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        mode_dialog.show()
-        
-        while mode_dialog.isVisible():
-            QApplication.processEvents()
-        
-        if not mode_dialog.accepted:
-            return tournament_name, 3, False
-        
-        return tournament_name, mode_dialog.result_sets, True
+    return tournament_name, mode_dialog.result_sets, True
 
 
 # ==================== SPIELMODUS-AUSWAHL DIALOG ====================
@@ -1382,13 +519,6 @@ class TurnierModeDialog(QDialog):
         self.setup_ui()
         
     def setup_ui(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a2e;
-                border: none;
-            }
-            QLabel { color: white; }
-        """)
         if self.parent():
             self.setGeometry(self.parent().geometry())
         else:
@@ -1400,12 +530,12 @@ class TurnierModeDialog(QDialog):
         
         # Titel
         title = QLabel(f"Turnier: {self.tournament_name}")
-        title.setStyleSheet("font-size: 48px; color: #00d9ff; font-weight: bold;")
+        title.setObjectName("title")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         subtitle = QLabel("Wähle den Spielmodus")
-        subtitle.setStyleSheet("font-size: 32px; color: #ffffff;")
+        subtitle.setObjectName("modeSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
         
@@ -1414,30 +544,6 @@ class TurnierModeDialog(QDialog):
         # Radio Buttons für Modi (GROSS)
         self.mode_group = QButtonGroup(self)
         
-        # Kompakteres Styling für Radio Buttons
-        radio_style = """
-            QRadioButton { 
-                font-size: 42px; 
-                color: #ffffff; 
-                spacing: 15px;
-                padding: 15px;
-            }
-            QRadioButton::indicator { 
-                width: 50px; 
-                height: 50px; 
-            }
-            QRadioButton::indicator:checked { 
-                background-color: #00d9ff; 
-                border: 4px solid #00d9ff; 
-                border-radius: 25px; 
-            }
-            QRadioButton::indicator:unchecked { 
-                background-color: transparent; 
-                border: 4px solid #0f3460; 
-                border-radius: 25px; 
-            }
-        """
-        
         modes_container = QVBoxLayout()
         modes_container.setSpacing(20)  # Reduziert von 40
         
@@ -1449,7 +555,7 @@ class TurnierModeDialog(QDialog):
         
         for mode_id, text in modes:
             rb = QRadioButton(text)
-            rb.setStyleSheet(radio_style)
+            rb.setObjectName("modeOption")
             self.mode_group.addButton(rb, mode_id)
             modes_container.addWidget(rb, alignment=Qt.AlignmentFlag.AlignCenter)
             
@@ -1469,17 +575,7 @@ class TurnierModeDialog(QDialog):
         btn_back = QPushButton("Zurück")
         btn_back.setMinimumHeight(100)
         btn_back.setMinimumWidth(250)
-        btn_back.setStyleSheet("""
-            QPushButton {
-                background-color: #e94560;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 32px;
-                font-weight: bold;
-            }
-            QPushButton:pressed { background-color: #c73648; }
-        """)
+        btn_back.setObjectName("backButton")
         btn_back.clicked.connect(self.reject)
         btn_layout.addWidget(btn_back)
         
@@ -1489,17 +585,7 @@ class TurnierModeDialog(QDialog):
         btn_ok = QPushButton("OK")
         btn_ok.setMinimumHeight(100)
         btn_ok.setMinimumWidth(250)
-        btn_ok.setStyleSheet("""
-            QPushButton {
-                background-color: #00d9ff;
-                color: #1a1a2e;
-                border: none;
-                border-radius: 15px;
-                font-size: 32px;
-                font-weight: bold;
-            }
-            QPushButton:pressed { background-color: #00b8d4; }
-        """)
+        btn_ok.setObjectName("modeOk")
         btn_ok.clicked.connect(self.on_accept)
         btn_layout.addWidget(btn_ok)
         
@@ -1522,21 +608,31 @@ class TurnierModeDialog(QDialog):
 
 # ==================== DATENBANKVERBINDUNG ====================
 class DatabaseManager:
-    """Verwaltet alle Datenbankoperationen."""
+    """Verwaltet alle Datenbankoperationen.
+    
+    Solange ``connecting`` gesetzt ist (Verbindungsaufbau im Hintergrund),
+    liefern die Abfragen leere Ergebnisse statt Dummy-Daten.
+    """
     
     def __init__(self):
         self.connection = None
+        self.connecting = False
     
     def connect(self):
-        """Stellt Verbindung zur Datenbank her."""
-        if not MYSQL_AVAILABLE:
+        """Stellt Verbindung zur Datenbank her (auch aus einem Hintergrund-Thread).
+        
+        ``connection`` wird erst nach der Schema-Prüfung gesetzt, vorher
+        sieht der GUI-Thread keine halb eingerichtete Verbindung.
+        """
+        if not load_mysql():
             return False
         
         try:
-            self.connection = mysql.connector.connect(**DB_CONFIG)
-            if self.connection.is_connected():
+            connection = mysql.connector.connect(**DB_CONFIG)
+            if connection.is_connected():
                 print("✅ Datenbankverbindung hergestellt.")
-                self.ensure_schema()
+                self.ensure_schema(connection)
+                self.connection = connection
                 return True
         except Error as e:
             print(f"❌ Datenbankfehler: {e}")
@@ -1549,17 +645,17 @@ class DatabaseManager:
             self.connection.close()
             print("🔌 Datenbankverbindung geschlossen.")
 
-    def ensure_schema(self):
+    def ensure_schema(self, connection):
         """Prüft und aktualisiert das Datenbankschema."""
         try:
-            cursor = self.connection.cursor()
+            cursor = connection.cursor()
             # Prüfen ob Spalte sets_to_win in turniere existiert
             cursor.execute("SHOW COLUMNS FROM turniere LIKE 'sets_to_win'")
             result = cursor.fetchone()
             if not result:
                 print("⚠️ Spalte 'sets_to_win' fehlt in 'turniere'. Füge hinzu...")
                 cursor.execute("ALTER TABLE turniere ADD COLUMN sets_to_win INT DEFAULT 3")
-                self.connection.commit()
+                connection.commit()
                 print("✅ Schema aktualisiert.")
             cursor.close()
         except Error as e:
@@ -1569,6 +665,9 @@ class DatabaseManager:
         """Lädt alle Spieler aus der Datenbank."""
         spieler_liste = []
         
+        if self.connecting:
+            return spieler_liste  # Noch keine Verbindung: keine Dummy-Namen vorschlagen
+        
         if not MYSQL_AVAILABLE or not self.connection:
             # Dummy-Daten
             return [(1, "Max", "Mustermann"), (2, "Anna", "Schmidt")]
@@ -1665,6 +764,9 @@ class DatabaseManager:
         return self.get_turniere()
     
     def create_turnier(self, name, sets_to_win=3):
+        if self.connecting:
+            print("⚠️ Datenbank wird noch verbunden, Turnier nicht angelegt.")
+            return None
         if not MYSQL_AVAILABLE or not self.connection:
             return 1
         try:
@@ -1755,6 +857,116 @@ class DatabaseManager:
             print(f"❌ Fehler beim Laden der Turnierspieler: {e}")
             return []
 
+
+# ==================== HINTERGRUND-SPEICHERUNG ====================
+class MatchSaveWorker(QObject):
+    """Läuft im Speicher-Thread und schreibt Matches über eine eigene Verbindung.
+    
+    Eine mysql-Verbindung darf nicht von zwei Threads benutzt werden, deshalb
+    öffnet der Worker beim ersten Match seinen eigenen DatabaseManager.
+    """
+    saved = pyqtSignal(object, bool)  # turnier_id, erfolgreich
+    connected = pyqtSignal(bool)
+    
+    def __init__(self):
+        super().__init__()
+        self.db = None
+    
+    @pyqtSlot(object)
+    def connect_database(self, db):
+        """Baut die Verbindung des GUI-Threads auf (der nutzt sie erst nach ``connected``)."""
+        try:
+            ok = db.connect()
+        except Exception as e:
+            print(f"❌ Datenbankfehler: {e}")
+            ok = False
+        self.connected.emit(bool(ok))
+    
+    @pyqtSlot(str, str, int, int, object)
+    def save_match(self, spieler1_name, spieler2_name, satz_score_s1, satz_score_s2, turnier_id):
+        if self.db is None:
+            self.db = DatabaseManager()
+            self.db.connect()
+        start = time.perf_counter()
+        try:
+            ok = bool(self.db.save_match_with_names(spieler1_name, spieler2_name, satz_score_s1, satz_score_s2, turnier_id))
+        except Exception as e:
+            # Eine Ausnahme im Thread würde die ganze App beenden
+            print(f"❌ Fehler beim Speichern des Matches: {e}")
+            ok = False
+        perf = get_perf_stats()
+        if perf is not None:
+            perf.record("db save", time.perf_counter() - start)
+        self.saved.emit(turnier_id, ok)
+    
+    @pyqtSlot()
+    def close(self):
+        """Letzter Auftrag: Verbindung schliessen und den Thread beenden."""
+        if self.db:
+            self.db.disconnect()
+            self.db = None
+        QThread.currentThread().quit()
+
+
+class MatchSaver(QObject):
+    """Speichert beendete Matches im Hintergrund (eigener QThread).
+    
+    save() kehrt sofort zurück, die Aufträge laufen der Reihe nach im
+    Speicher-Thread; match_saved meldet das Ergebnis im GUI-Thread. Auch
+    der Verbindungsaufbau der GUI-Datenbank läuft dort (connect_database,
+    Ergebnis über database_connected). Der Thread startet beim ersten
+    Auftrag. shutdown() reiht das Schliessen
+    hinter alle offenen Aufträge ein und wartet, bis sie gespeichert sind
+    (beim Schliessen des Fensters bzw. Beenden der App).
+    """
+    match_saved = pyqtSignal(object, bool)  # turnier_id, erfolgreich
+    database_connected = pyqtSignal(bool)
+    _save_requested = pyqtSignal(str, str, int, int, object)
+    _connect_requested = pyqtSignal(object)
+    _close_requested = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread = None
+        self.worker = None
+    
+    def save(self, spieler1_name, spieler2_name, satz_score_s1, satz_score_s2, turnier_id=None):
+        """Reiht ein Match zum Speichern ein (blockiert nicht)."""
+        if self.thread is None:
+            self.start()
+        self._save_requested.emit(spieler1_name, spieler2_name, satz_score_s1, satz_score_s2, turnier_id)
+    
+    def connect_database(self, db):
+        """Verbindet ``db`` im Speicher-Thread (blockiert nicht)."""
+        if self.thread is None:
+            self.start()
+        db.connecting = True
+        self._connect_requested.emit(db)
+    
+    def start(self):
+        self.thread = QThread()
+        self.thread.setObjectName("MatchSaver")
+        self.worker = MatchSaveWorker()
+        self.worker.moveToThread(self.thread)
+        self._save_requested.connect(self.worker.save_match)
+        self._connect_requested.connect(self.worker.connect_database)
+        self._close_requested.connect(self.worker.close)
+        self.worker.saved.connect(self.match_saved)
+        self.worker.connected.connect(self.database_connected)
+        self.thread.finished.connect(self.worker.deleteLater)
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+        self.thread.start()
+    
+    def shutdown(self):
+        """Arbeitet offene Aufträge ab und beendet den Speicher-Thread."""
+        if self.thread is None:
+            return
+        self._close_requested.emit()  # Worker beendet den Thread danach
+        self.thread.wait()
+        self.thread = None
+        self.worker = None
+
+
 # ==================== SEITE 1: STARTMENÜ ====================
 class StartMenuPage(QWidget):
     def __init__(self, parent=None):
@@ -1853,7 +1065,7 @@ class MatchSetupPage(QWidget):
         mode_layout.setSpacing(15)
         
         lbl_mode = QLabel("Match-Typ:")
-        lbl_mode.setStyleSheet("font-size: 22px; color: #888888;")
+        lbl_mode.setObjectName("modeLabel")
         mode_layout.addWidget(lbl_mode)
         
         # Button Group für exklusive Auswahl
@@ -1869,38 +1081,9 @@ class MatchSetupPage(QWidget):
             (4, "Turnier")       # Turnier
         ]
         
-        radio_style = """
-            QRadioButton { 
-                font-size: 20px; 
-                color: #ffffff; 
-                spacing: 8px;
-                padding: 10px;
-                border: 1px solid transparent;
-                border-radius: 5px;
-            }
-            QRadioButton:hover {
-                background-color: #1a1a2e;
-                border: 1px solid #0f3460;
-            }
-            QRadioButton::indicator { 
-                width: 24px; 
-                height: 24px; 
-            }
-            QRadioButton::indicator:checked { 
-                background-color: #00d9ff; 
-                border: 2px solid #00d9ff; 
-                border-radius: 12px; 
-            }
-            QRadioButton::indicator:unchecked { 
-                background-color: #16213e; 
-                border: 2px solid #0f3460; 
-                border-radius: 12px; 
-            }
-        """
-        
         for mode_id, text in modes:
             rb = QRadioButton(text)
-            rb.setStyleSheet(radio_style)
+            rb.setObjectName("matchMode")
             self.mode_group.addButton(rb, mode_id)
             mode_layout.addWidget(rb)
             
@@ -1913,7 +1096,7 @@ class MatchSetupPage(QWidget):
         # Separator
         separator1 = QFrame()
         separator1.setFrameShape(QFrame.Shape.HLine)
-        separator1.setStyleSheet("background-color: #0f3460; max-height: 2px;")
+        separator1.setObjectName("separator")
         layout.addWidget(separator1)
         
         # ===== Turnier-Auswahl (Versteckt, nur bei "Turnier") =====
@@ -1922,15 +1105,12 @@ class MatchSetupPage(QWidget):
         turnier_layout.setContentsMargins(0, 0, 0, 0)
         
         lbl_turnier = QLabel("Turnier:")
-        lbl_turnier.setStyleSheet("font-size: 22px; color: #00d9ff;")
+        lbl_turnier.setObjectName("fieldLabel")
         turnier_layout.addWidget(lbl_turnier)
         
         self.combo_turnier = QComboBox()
         self.combo_turnier.setMinimumHeight(55)
-        self.combo_turnier.setStyleSheet("""
-            QComboBox { background-color: #16213e; color: #ffffff; border: 2px solid #0f3460; border-radius: 10px; padding: 10px; font-size: 18px; }
-            QComboBox QAbstractItemView { background-color: #16213e; color: #ffffff; selection-background-color: #00d9ff; selection-color: #1a1a2e; }
-        """)
+        self.combo_turnier.setObjectName("turnierCombo")
         turnier_layout.addWidget(self.combo_turnier, 1)
         
         btn_new_turnier = QPushButton("+ Neu")
@@ -1947,7 +1127,7 @@ class MatchSetupPage(QWidget):
         player_layout.setSpacing(10)
         
         lbl_player1 = QLabel("Spieler 1 (Links)")
-        lbl_player1.setStyleSheet("font-size: 22px; color: #00d9ff;")
+        lbl_player1.setObjectName("fieldLabel")
         player_layout.addWidget(lbl_player1)
         
         self.input_player1 = QLineEdit()
@@ -1957,11 +1137,11 @@ class MatchSetupPage(QWidget):
         
         self.vs_label = QLabel("VS")
         self.vs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.vs_label.setStyleSheet("font-size: 32px; color: #e94560; font-weight: bold; margin: 10px 0;")
+        self.vs_label.setObjectName("vsLabel")
         player_layout.addWidget(self.vs_label)
         
         lbl_player2 = QLabel("Spieler 2 (Rechts)")
-        lbl_player2.setStyleSheet("font-size: 22px; color: #00d9ff;")
+        lbl_player2.setObjectName("fieldLabel")
         player_layout.addWidget(lbl_player2)
         
         self.input_player2 = QLineEdit()
@@ -1974,7 +1154,7 @@ class MatchSetupPage(QWidget):
         # ===== Quick Match Info Label (Nur sichtbar bei Schnelles Spiel) =====
         self.quick_label = QLabel("Starte das Spiel")
         self.quick_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.quick_label.setStyleSheet("font-size: 96px; color: #00d9ff; font-weight: bold; margin: 40px;")
+        self.quick_label.setObjectName("quickStart")
         self.quick_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(self.quick_label, 1)
         
@@ -2110,7 +1290,7 @@ class MatchSetupPage(QWidget):
     
     def on_new_turnier(self):
         # Dialog für Name UND Gewinnsätze
-        name, sets, ok = NewTurnierDialog.get_turnier_info(self)
+        name, sets, ok = get_turnier_info(self)
         if ok and name.strip():
             if self.main_window and self.main_window.db:
                 new_id = self.main_window.db.create_turnier(name.strip(), sets)
@@ -2193,7 +1373,7 @@ class MatchSetupPage(QWidget):
             self.main_window.page_scoreboard.turnier_id = turnier_id
             # Hier übergeben wir sets_to_win an reset_match
             self.main_window.page_scoreboard.reset_match(None, player1_name, None, player2_name, sets_to_win=sets_to_win)
-            self.main_window.stack.setCurrentIndex(4)
+            self.main_window.show_page(PageIndex.SCOREBOARD)
 
 
 # ==================== SEITE 3: TURNIER-LISTE ====================
@@ -2215,11 +1395,7 @@ class TurnierListPage(QWidget):
         layout.addWidget(title)
         
         self.turnier_list = QListWidget()
-        self.turnier_list.setStyleSheet("""
-            QListWidget { background-color: #16213e; border: 2px solid #0f3460; border-radius: 10px; padding: 10px; font-size: 20px; }
-            QListWidget::item { padding: 15px; border-bottom: 1px solid #0f3460; color: #ffffff; }
-            QListWidget::item:selected { background-color: #00d9ff; color: #1a1a2e; }
-        """)
+        self.turnier_list.setObjectName("turnierList")
         self.turnier_list.itemClicked.connect(self.on_turnier_clicked)
         layout.addWidget(self.turnier_list)
         
@@ -2227,17 +1403,7 @@ class TurnierListPage(QWidget):
         btn_layout = QHBoxLayout()
         btn_back = QPushButton("← Zurück")
         btn_back.setMinimumHeight(70)
-        btn_back.setStyleSheet("""
-            QPushButton {
-                background-color: #e94560;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 22px;
-                font-weight: bold;
-            }
-            QPushButton:pressed { background-color: #c73648; }
-        """)
+        btn_back.setObjectName("backButton")
         btn_back.clicked.connect(self.on_back)
         btn_layout.addWidget(btn_back)
         
@@ -2269,7 +1435,7 @@ class TurnierListPage(QWidget):
         """Erstellt ein neues Turnier mit 2-Schritt-Dialog (Name + Modus)."""
         try:
             # Verwende get_turnier_info für 2-Schritt-Prozess
-            name, sets_to_win, ok = NewTurnierDialog.get_turnier_info(self)
+            name, sets_to_win, ok = get_turnier_info(self)
             
             if ok and name.strip():
                 # Turnier erstellen
@@ -2329,7 +1495,7 @@ class TurnierDetailPage(QWidget):
         left_widget = QWidget()
         left_layout = QVBoxLayout(left_widget)
         left_title = QLabel("Match-Historie")
-        left_title.setStyleSheet("font-size: 20px; color: #00d9ff; font-weight: bold;")
+        left_title.setObjectName("sectionTitle")
         left_layout.addWidget(left_title)
         
         self.match_table = QTableWidget()
@@ -2339,11 +1505,7 @@ class TurnierDetailPage(QWidget):
         self.match_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.match_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.match_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.match_table.setStyleSheet("""
-            QTableWidget { background-color: #16213e; border: 2px solid #0f3460; border-radius: 10px; font-size: 16px; }
-            QHeaderView::section { background-color: #0f3460; color: #00d9ff; border: none; font-weight: bold; }
-            QTableWidget::item { padding: 8px; color: #ffffff; }
-        """)
+        self.match_table.setObjectName("resultTable")
         left_layout.addWidget(self.match_table)
         content_layout.addWidget(left_widget)
         
@@ -2351,7 +1513,7 @@ class TurnierDetailPage(QWidget):
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
         right_title = QLabel("Rangliste")
-        right_title.setStyleSheet("font-size: 20px; color: #00d9ff; font-weight: bold;")
+        right_title.setObjectName("sectionTitle")
         right_layout.addWidget(right_title)
         
         self.rank_table = QTableWidget()
@@ -2361,11 +1523,7 @@ class TurnierDetailPage(QWidget):
         self.rank_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.rank_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.rank_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.rank_table.setStyleSheet("""
-            QTableWidget { background-color: #16213e; border: 2px solid #0f3460; border-radius: 10px; font-size: 16px; }
-            QHeaderView::section { background-color: #0f3460; color: #00d9ff; border: none; font-weight: bold; }
-            QTableWidget::item { padding: 8px; color: #ffffff; }
-        """)
+        self.rank_table.setObjectName("resultTable")
         right_layout.addWidget(self.rank_table)
         content_layout.addWidget(right_widget)
         
@@ -2392,6 +1550,7 @@ class TurnierDetailPage(QWidget):
         self.title_label.setText(turnier_name)
         
         if self.main_window and self.main_window.db:
+            start = time.perf_counter()
             matches = self.main_window.db.get_turnier_matches(turnier_id)
             self.match_table.setRowCount(len(matches))
             for row, match in enumerate(matches):
@@ -2409,6 +1568,10 @@ class TurnierDetailPage(QWidget):
                 self.rank_table.setItem(row, 0, QTableWidgetItem(name))
                 self.rank_table.setItem(row, 1, QTableWidgetItem(str(siege)))
                 self.rank_table.setItem(row, 2, QTableWidgetItem(str(niederlagen)))
+            
+            perf = get_perf_stats()
+            if perf is not None:
+                perf.record("db load", time.perf_counter() - start)
     
     def on_back(self):
         if self.main_window:
@@ -2443,7 +1606,7 @@ class TurnierDetailPage(QWidget):
                 self.main_window.current_turnier_name = self.turnier_name
                 self.main_window.page_scoreboard.turnier_id = self.turnier_id
                 self.main_window.page_scoreboard.reset_match(player1_id, player1_name, player2_id, player2_name, sets_to_win=sets_to_win)
-                self.main_window.stack.setCurrentIndex(4) # Scoreboard Page
+                self.main_window.show_page(PageIndex.SCOREBOARD)
                 return
 
         # Fallback: Standard-Verhalten (Setup-Seite)
@@ -2463,18 +1626,31 @@ class ScoreboardPage(QWidget):
         self.player1_name = ""
         self.player2_id = None
         self.player2_name = ""
-        self.score1 = 0
-        self.score2 = 0
-        self.sets1 = 0
-        self.sets2 = 0
-        self.sets1 = 0
-        self.sets2 = 0
         self.sets_to_win = 3  # Standard: Best of 5 (3 Gewinnsätze)
         self.turnier_id = None
         
-        # Aufschlag-Tracking: 1 = Spieler 1, 2 = Spieler 2
-        self.server = 1
-        self.initial_server = 1
+        # Spielstand, Aufschlag, Undo und Live-Statistik liegen in der MatchEngine (src/core).
+        # Änderungen kommen gebündelt als eine MatchChange-Benachrichtigung pro Frame.
+        self.engine = None
+        self.unsubscribe_engine = None
+        self.result_overlay = None
+        self.set_engine(MatchEngine(track_statistics=True))
+        
+        # Zuletzt angezeigte Werte pro Widget (update_display zeichnet nur Änderungen)
+        self.rendered = {}
+        
+        # Eingaben (Touch, Tastatur, Fusspedal) werden beim Drücken mit Zeitstempel
+        # eingereiht und im nächsten Event-Loop-Durchlauf der Reihe nach verbucht
+        self.input_queue = PointInputQueue()
+        self.input_latency = LatencyRecorder()
+        self.input_scheduled = False
+        
+        # Zuschauer-Spiegel (zweiter Monitor), wird vom Hauptfenster gesetzt
+        self.spectator = None
+        
+        # Crash-Journal: jeder Punkt wird sofort angehängt (Wiederherstellung beim Neustart)
+        self.journal = None
+        self.journal_path = get_app_config().journal_path
         
         # Konfetti-Overlays
         self.confetti_overlay1 = None
@@ -2513,17 +1689,18 @@ class ScoreboardPage(QWidget):
         self.lbl_player1_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
         name1_row.addWidget(self.lbl_player1_name)
         self.serve_indicator1 = QLabel("●")
-        self.serve_indicator1.setStyleSheet("font-size: 32px; color: white; margin-left: 10px;")
+        self.serve_indicator1.setObjectName("serveIndicatorLeft")
+        keep_size_when_hidden(self.serve_indicator1)
         name1_row.addWidget(self.serve_indicator1)
         name1_row.addStretch()
         player1_area.addLayout(name1_row)
         
         # Punkt (klickbar, zentriert)
-        self.lbl_score1 = QLabel("0")
+        self.lbl_score1 = ScoreDisplay("0")
         self.lbl_score1.setObjectName("scoreBig")
-        self.lbl_score1.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_score1.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.lbl_score1.mousePressEvent = lambda e: self.add_point(1)
+        self.lbl_score1.mousePressEvent = lambda e: self.queue_input(1)
+        self.lbl_score1.painted.connect(self.on_score_painted)
         player1_area.addWidget(self.lbl_score1, 1)
         
         # Konfetti-Overlay für Spieler 1
@@ -2534,7 +1711,7 @@ class ScoreboardPage(QWidget):
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.VLine)
-        separator.setStyleSheet("background-color: #0f3460; max-width: 3px;")
+        separator.setObjectName("scoreSeparator")
         main_layout.addWidget(separator)
         
         # Spieler 2 Bereich (Name + Satz oben, Punkt unten)
@@ -2547,7 +1724,9 @@ class ScoreboardPage(QWidget):
         name2_row = QHBoxLayout()
         name2_row.addStretch()
         self.serve_indicator2 = QLabel("●")
-        self.serve_indicator2.setStyleSheet("font-size: 32px; color: transparent; margin-right: 10px;")
+        self.serve_indicator2.setObjectName("serveIndicatorRight")
+        keep_size_when_hidden(self.serve_indicator2)
+        self.serve_indicator2.setVisible(False)
         name2_row.addWidget(self.serve_indicator2)
         self.lbl_player2_name = QLabel("Spieler 2")
         self.lbl_player2_name.setObjectName("playerName")
@@ -2565,11 +1744,11 @@ class ScoreboardPage(QWidget):
         player2_area.addLayout(name2_row)
         
         # Punkt (klickbar, zentriert)
-        self.lbl_score2 = QLabel("0")
+        self.lbl_score2 = ScoreDisplay("0")
         self.lbl_score2.setObjectName("scoreBig")
-        self.lbl_score2.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_score2.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.lbl_score2.mousePressEvent = lambda e: self.add_point(2)
+        self.lbl_score2.mousePressEvent = lambda e: self.queue_input(2)
+        self.lbl_score2.painted.connect(self.on_score_painted)
         player2_area.addWidget(self.lbl_score2, 1)
         
         # Konfetti-Overlay für Spieler 2
@@ -2579,6 +1758,12 @@ class ScoreboardPage(QWidget):
         
         layout.addLayout(main_layout, 1)
         
+        # ===== Live-Siegchance =====
+        self.lbl_win_probability = QLabel("")
+        self.lbl_win_probability.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_win_probability.setObjectName("winProbability")
+        layout.addWidget(self.lbl_win_probability)
+        
         # ===== Handle Button - schmaler Balken mit Pfeil innen =====
         handle_wrapper = QWidget()
         handle_wrapper_layout = QHBoxLayout(handle_wrapper)
@@ -2589,6 +1774,7 @@ class ScoreboardPage(QWidget):
         self.dropdown_handle = QPushButton("▲")
         self.dropdown_handle.setFixedSize(268, 24)  # Höher für zentrierten Pfeil
         self.dropdown_handle.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.dropdown_handle.setObjectName("dropdownHandle")
         self.dropdown_expanded = False
         self.update_dropdown_handle()
         self.dropdown_handle.clicked.connect(self.toggle_dropdown)
@@ -2598,7 +1784,7 @@ class ScoreboardPage(QWidget):
         # ===== Button Container (versteckt, volle Breite wie im Bild) =====
         self.dropdown_buttons = QWidget()
         self.dropdown_buttons.setVisible(False)
-        self.dropdown_buttons.setStyleSheet("background-color: #1a1a2e;")
+        self.dropdown_buttons.setObjectName("scoreActions")
         btn_layout = QHBoxLayout(self.dropdown_buttons)
         btn_layout.setSpacing(15)
         btn_layout.setContentsMargins(30, 15, 30, 20)
@@ -2611,57 +1797,42 @@ class ScoreboardPage(QWidget):
         
         btn_undo = QPushButton("Rückgängig")
         btn_undo.setMinimumHeight(55)
-        btn_undo.setStyleSheet("""
-            QPushButton {
-                background-color: #16213e;
-                color: #ffffff;
-                border: 2px solid #00d9ff;
-                border-radius: 15px;
-                padding: 15px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00d9ff;
-                color: #1a1a2e;
-            }
-        """)
+        btn_undo.setObjectName("undoButton")
         btn_undo.clicked.connect(self.on_undo)
         btn_layout.addWidget(btn_undo)
         
         layout.addWidget(self.dropdown_buttons)
         
         self.setLayout(layout)
+        
+        # ===== Satz-/Matchgewinn-Overlay (einmal gebaut, nicht-modal) =====
+        # Erst mit dem Scoreboard geladen, nicht beim Start
+        from src.ui.widgets.result_overlay import ResultOverlay
+        self.result_overlay = ResultOverlay(self)
+        self.result_overlay.confirmed.connect(self.on_result_confirmed)
+        self.result_overlay.cancelled.connect(self.on_result_cancelled)
+        
+        self.setup_key_bindings()
+    
+    def setup_key_bindings(self):
+        """Tasten aus der Konfiguration (APP_KEYS_*) laufen über dieselbe Eingabe-Queue."""
+        config = get_app_config()
+        bindings = ((config.keys_player1, 1), (config.keys_player2, 2), (config.keys_undo, EVENT_UNDO))
+        for keys, event in bindings:
+            for key in keys:
+                sequence = QKeySequence(key)
+                if not sequence.toString():
+                    print(f"⚠️ Unbekannte Taste in der Konfiguration: {key}")
+                    continue
+                shortcut = QShortcut(sequence, self)
+                shortcut.setAutoRepeat(False)
+                shortcut.activated.connect(lambda e=event: self.queue_input(e))
     
     def update_dropdown_handle(self):
         """Aktualisiert den Handle-Style basierend auf Zustand."""
-        # Farbdesign wie Rückgängig-Button mit runderen Ecken
-        if self.dropdown_expanded:
-            # Aktiver Zustand - heller, Pfeil nach unten
-            self.dropdown_handle.setText("▼")
-            self.dropdown_handle.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d9ff;
-                    color: #1a1a2e;
-                    border: none;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    padding-top: -8px;
-                }
-            """)
-        else:
-            # Normaler Zustand
-            self.dropdown_handle.setText("▲")
-            self.dropdown_handle.setStyleSheet("""
-                QPushButton {
-                    background-color: #16213e;
-                    color: #888888;
-                    border: 2px solid #444444;
-                    border-radius: 6px;
-                    font-size: 16px;
-                    padding-top: -8px;
-                }
-            """)
+        # Aktiver Zustand: hell, Pfeil nach unten (dropdownHandle[expanded="true"])
+        self.dropdown_handle.setText("▼" if self.dropdown_expanded else "▲")
+        set_style_state(self.dropdown_handle, "expanded", self.dropdown_expanded)
     
     def toggle_dropdown(self):
         """Öffnet/Schliesst das Dropdown-Menu."""
@@ -2676,15 +1847,82 @@ class ScoreboardPage(QWidget):
         self.player2_name = player2_name
         self.sets_to_win = sets_to_win
         
-        self.score1 = 0
-        self.score2 = 0
-        self.sets1 = 0
-        self.sets2 = 0
-        self.history = []
-        
         # Aufschlag-Auswahl anzeigen
-        self.choose_initial_server()
+        initial_server = self.choose_initial_server()
+        self.set_engine(MatchEngine(player1_name, player2_name, sets_to_win, initial_server, track_statistics=True))
+        self.start_journal()
+        self.update_display()
+    
+    # ---------- Crash-Journal ----------
+    
+    def start_journal(self):
+        """Legt das Journal für das neue Match an (ersetzt ein altes)."""
+        self.close_journal()
+        header = JournalHeader(
+            player1_name=self.player1_name,
+            player2_name=self.player2_name,
+            sets_to_win=self.sets_to_win,
+            initial_server=self.engine.initial_server,
+            player1_id=self.player1_id,
+            player2_id=self.player2_id,
+            turnier_id=self.turnier_id,
+            turnier_name=self.main_window.current_turnier_name if self.turnier_id else None,
+        )
+        try:
+            self.journal = PointJournal(self.journal_path, header)
+        except OSError as e:
+            print(f"⚠️ Journal nicht verfügbar: {e}")
+            self.journal = None
+    
+    def journal_event(self, event):
+        """Hängt ein Ereignis an (ein os.write, fsync läuft im Hintergrund)."""
+        if self.journal:
+            try:
+                self.journal.append(event)
+            except OSError as e:
+                print(f"⚠️ Journal-Schreibfehler: {e}")
+                self.journal = None
+    
+    def close_journal(self):
+        """Match beendet oder abgebrochen: Journal löschen."""
+        if self.journal:
+            self.journal.discard()
+            self.journal = None
+    
+    def restore_from_journal(self):
+        """Stellt ein unterbrochenes Match aus dem Journal wieder her.
+        
+        Returns:
+            JournalHeader des wiederhergestellten Matches (mit Turnier-ID
+            und -Name), None wenn es keins gab
+        """
+        contents = read_journal(self.journal_path)
+        if contents is None:
+            return None
+        
+        header = contents.header
+        self.player1_id = header.player1_id
+        self.player1_name = header.player1_name
+        self.player2_id = header.player2_id
+        self.player2_name = header.player2_name
+        self.sets_to_win = header.sets_to_win
+        self.turnier_id = header.turnier_id
+        
+        self.set_engine(MatchEngine(header.player1_name, header.player2_name, header.sets_to_win, header.initial_server, track_statistics=True))
+        self.engine.replay_events(contents.events)
+        
+        try:
+            self.journal = PointJournal.resume(self.journal_path, contents)
+        except OSError as e:
+            print(f"⚠️ Journal nicht verfügbar: {e}")
+            self.journal = None
+        
         self.update_display()
+        print(f"♻️ Match wiederhergestellt: {self.player1_name} vs {self.player2_name} ({len(contents.events)} Ereignisse)")
+        
+        # War ein Satz entschieden, der Dialog aber noch offen, öffnet ihn die
+        # gebündelte Benachrichtigung der Wiederherstellung (on_engine_changed)
+        return header
     
     def choose_initial_server(self):
         """Zeigt Dialog zur Auswahl des ersten Aufschlägers."""
@@ -2692,12 +1930,7 @@ class ScoreboardPage(QWidget):
         msg_box.setWindowTitle("Aufschlag")
         msg_box.setText("Wer hat Aufschlag?")
         msg_box.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
-        msg_box.setStyleSheet("""
-            QMessageBox { background-color: #1a1a2e; border: 3px solid #00d9ff; border-radius: 15px; }
-            QLabel { color: white; font-size: 26px; margin: 20px; font-weight: bold; }
-            QPushButton { background-color: #16213e; color: white; border: 2px solid #0f3460; border-radius: 10px; padding: 15px 30px; font-size: 20px; min-width: 120px; min-height: 50px; }
-            QPushButton:hover { background-color: #00d9ff; color: #1a1a2e; }
-        """)
+        msg_box.setObjectName("serveChoice")
         
         btn_player1 = msg_box.addButton(self.player1_name, QMessageBox.ButtonRole.YesRole)
         btn_player2 = msg_box.addButton(self.player2_name, QMessageBox.ButtonRole.NoRole)
@@ -2705,141 +1938,191 @@ class ScoreboardPage(QWidget):
         msg_box.exec()
         
         if msg_box.clickedButton() == btn_player1:
-            self.server = 1
-        else:
-            self.server = 2
-        
-        self.initial_server = self.server
+            return 1
+        return 2
     
     def update_display(self):
-        self.lbl_player1_name.setText(self.player1_name)
-        self.lbl_player2_name.setText(self.player2_name)
-        self.lbl_score1.setText(str(self.score1))
-        self.lbl_score2.setText(str(self.score2))
-        self.lbl_sets1.setText(str(self.sets1))
-        self.lbl_sets2.setText(str(self.sets2))
+        """Zeichnet nur die Widgets neu, deren Wert sich geändert hat."""
+        engine = self.engine
+        self.set_label_text(self.lbl_player1_name, self.player1_name)
+        self.set_label_text(self.lbl_player2_name, self.player2_name)
+        self.set_label_text(self.lbl_score1, str(engine.score_player1))
+        self.set_label_text(self.lbl_score2, str(engine.score_player2))
+        self.set_label_text(self.lbl_sets1, str(engine.sets_player1))
+        self.set_label_text(self.lbl_sets2, str(engine.sets_player2))
         self.update_serve_indicator()
+        self.update_win_probability()
+        self.update_spectator()
     
-    def update_serve_indicator(self):
-        """Zeigt/versteckt den Aufschlag-Punkt."""
-        if self.server == 1:
-            self.serve_indicator1.setStyleSheet("font-size: 32px; color: white; margin-left: 10px;")
-            self.serve_indicator2.setStyleSheet("font-size: 32px; color: transparent; margin-right: 10px;")
-        else:
-            self.serve_indicator1.setStyleSheet("font-size: 32px; color: transparent; margin-left: 10px;")
-            self.serve_indicator2.setStyleSheet("font-size: 32px; color: white; margin-right: 10px;")
-    
-    def check_serve_change(self):
-        """Prüft ob Aufschlag wechseln muss (alle 2 Punkte, in Verlängerung jeder Punkt)."""
-        total_points = self.score1 + self.score2
+    def update_spectator(self):
+        """Überträgt den Spielstand auf den Zuschauer-Monitor.
         
-        # Bei Verlängerung (beide >= 10): Wechsel nach jedem Punkt
-        if self.score1 >= 10 and self.score2 >= 10:
-            self.server = 1 if self.server == 2 else 2
-        else:
-            # Normal: Wechsel alle 2 Punkte
-            if total_points % 2 == 0 and total_points > 0:
-                self.server = 1 if self.server == 2 else 2
+        Der Spiegel zeichnet selbst aus dem Stand, und nur die Elemente,
+        deren Wert sich geändert hat (meist die Ziffern eines Punktestands).
+        """
+        if self.spectator is None or not self.spectator.isVisible():
+            return
+        from src.ui.frame_renderer import FrameState
+        engine = self.engine
+        self.spectator.set_state(FrameState(
+            self.player1_name, self.player2_name,
+            engine.score_player1, engine.score_player2,
+            engine.sets_player1, engine.sets_player2,
+            engine.server,
+        ))
+    
+    def set_label_text(self, label, text):
+        """Setzt den Text nur, wenn er sich gegenüber der letzten Anzeige geändert hat."""
+        if self.rendered.get(label) != text:
+            label.setText(text)
+            self.rendered[label] = text
+    
+    def update_win_probability(self):
+        """Zeigt die Live-Siegchance (Markov-Modell, O(1) pro Punkt dank LRU-Cache)."""
+        stats = self.engine.statistics
+        rate1 = estimate_serve_win_rate(stats.serve_points_won[1], stats.serve_points_played[1])
+        rate2 = estimate_serve_win_rate(stats.serve_points_won[2], stats.serve_points_played[2])
+        p1 = match_win_probability(self.engine.get_current_state(), self.sets_to_win, rate1, rate2)
+        self.set_label_text(self.lbl_win_probability, f"Siegchance  {p1:.0%} : {1 - p1:.0%}")
     
-    def add_point(self, player):
-        self.history.append((self.score1, self.score2, self.sets1, self.sets2, self.server))
-        
-        if player == 1:
-            self.score1 += 1
-        else:
-            self.score2 += 1
+    def update_serve_indicator(self):
+        """Zeigt/versteckt den Aufschlag-Punkt.
         
-        self.check_serve_change()
+        Der Stil ist fest, umgeschaltet wird nur die Sichtbarkeit (der Platz bleibt
+        reserviert) - kein setStyleSheet und damit kein Re-Polish pro Punkt.
+        """
+        server = self.engine.server
+        if self.rendered.get("server") != server:
+            self.serve_indicator1.setVisible(server == 1)
+            self.serve_indicator2.setVisible(server == 2)
+            self.rendered["server"] = server
+    
+    def set_engine(self, engine):
+        """Übernimmt eine neue MatchEngine und abonniert ihre Änderungen.
+        
+        Benachrichtigungen werden per QTimer auf den nächsten Event-Loop-Durchlauf
+        verschoben, so dass Punkt, Aufschlagwechsel und Satzgewinn als eine
+        einzige Änderung (ein Repaint) ankommen.
+        """
+        if self.unsubscribe_engine:
+            self.unsubscribe_engine()
+        if self.result_overlay:
+            # Neues Match: offenes Satzgewinn-Overlay gehört zum alten
+            self.result_overlay.hide()
+            self.stop_confetti()
+        self.engine = engine
+        engine.set_scheduler(lambda flush: QTimer.singleShot(0, flush))
+        self.unsubscribe_engine = engine.subscribe(self.on_engine_changed)
+    
+    def on_engine_changed(self, change):
+        """Eine gebündelte Änderung der Engine: einmal neu zeichnen."""
         self.update_display()
-        self.check_set_win()
+        if change.set_winner and ({"sets_player1", "sets_player2"} & change.changed):
+            self.show_set_won(change.set_winner)
+    
+    def queue_input(self, event):
+        """Nimmt einen Punkt (1/2) oder EVENT_UNDO beim Drücken entgegen."""
+        if self.input_queue.push(event) and not self.input_scheduled:
+            self.input_scheduled = True
+            QTimer.singleShot(0, self.process_input)
+    
+    def process_input(self):
+        """Verbucht alle eingereihten Eingaben in Drück-Reihenfolge."""
+        self.input_scheduled = False
+        for item in self.input_queue.drain():
+            if item.event == EVENT_UNDO:
+                if self.result_overlay.isVisible():
+                    # Undo-Taste beim Satzgewinn entspricht "Zurück"
+                    self.result_overlay.cancel()
+                elif not self.on_undo():
+                    continue
+            elif self.engine.get_set_winner():
+                continue
+            else:
+                self.add_point(item.event)
+            self.input_latency.mark_applied(item.pressed_at)
     
-    def check_set_win(self):
-        if self.score1 >= 11 and self.score1 - self.score2 >= 2:
-            self.sets1 += 1
-            self.show_set_won(1)
-        elif self.score2 >= 11 and self.score2 - self.score1 >= 2:
-            self.sets2 += 1
-            self.show_set_won(2)
+    def on_score_painted(self):
+        """Punktanzeige gezeichnet: Latenz Drücken -> Anzeige erfassen."""
+        self.input_latency.record_paint()
+    
+    def add_point(self, player):
+        # Satz entschieden, Dialog noch nicht bestätigt: weitere Taps ignorieren
+        if self.engine.get_set_winner():
+            return
+        # Anzeige und Satzgewinn-Dialog folgen über on_engine_changed
+        self.journal_event(player)
+        self.engine.add_point(player)
     
     def show_set_won(self, player):
-        self.update_display()
-        if self.sets1 >= self.sets_to_win:
-            self.match_won(1)
-        elif self.sets2 >= self.sets_to_win:
-            self.match_won(2)
+        """Zeigt das Satz- bzw. Matchgewinn-Overlay (kehrt sofort zurück).
+        
+        Die Antwort kommt über on_result_confirmed / on_result_cancelled;
+        bis dahin ist der Satz entschieden und add_point ignoriert Taps.
+        """
+        if self.engine.is_match_finished():
+            self.match_won(self.engine.get_winner())
         else:
             winner_name = self.player1_name if player == 1 else self.player2_name
-            
-            # Konfetti auf der Gewinnerseite starten
-            if player == 1 and self.confetti_overlay1:
-                self.confetti_overlay1.setGeometry(0, 0, self.player1_container.width(), self.player1_container.height())
-                self.confetti_overlay1.start_confetti()
-            elif player == 2 and self.confetti_overlay2:
-                self.confetti_overlay2.setGeometry(0, 0, self.player2_container.width(), self.player2_container.height())
-                self.confetti_overlay2.start_confetti()
-            
-            # Rahmenloses Popup für den Satzgewinn (stoppt Konfetti automatisch durch Klick)
-            confirmed = show_custom_info_dialog(self, "Satz gewonnen!", f"{winner_name} gewinnt den Satz!\nStand: {self.sets1} : {self.sets2}", cancel_text="Zurück")
-            
-            # Konfetti stoppen falls noch aktiv
-            if self.confetti_overlay1:
-                self.confetti_overlay1.stop_confetti()
-            if self.confetti_overlay2:
-                self.confetti_overlay2.stop_confetti()
-            
-            if confirmed:
-                self.score1 = 0
-                self.score2 = 0
-                # Aufschlag wechselt nach jedem Satz
-                self.initial_server = 1 if self.initial_server == 2 else 2
-                self.server = self.initial_server
-                self.update_display()
-            else:
-                # ABBRECHEN: Exakt den letzten Punkt (der zum Satzgewinn führte) rückgängig machen
-                self.on_undo()
+            self.start_confetti(player)
+            self.result_overlay.show_result("Satz gewonnen!", f"{winner_name} gewinnt den Satz!\nStand: {self.engine.sets_player1} : {self.engine.sets_player2}", cancel_text="Zurück")
     
     def match_won(self, player):
         winner_name = self.player1_name if player == 1 else self.player2_name
-        
-        # Konfetti auf der Gewinnerseite starten
+        self.start_confetti(player)
+        self.result_overlay.show_result("MATCH GEWONNEN!", f"{winner_name} gewinnt das Match!\nEndstand: {self.engine.sets_player1} : {self.engine.sets_player2}", cancel_text="Zurück")
+    
+    def start_confetti(self, player):
+        """Startet das Konfetti auf der Gewinnerseite."""
         if player == 1 and self.confetti_overlay1:
             self.confetti_overlay1.setGeometry(0, 0, self.player1_container.width(), self.player1_container.height())
             self.confetti_overlay1.start_confetti()
         elif player == 2 and self.confetti_overlay2:
             self.confetti_overlay2.setGeometry(0, 0, self.player2_container.width(), self.player2_container.height())
             self.confetti_overlay2.start_confetti()
-        
-        # Rahmenloses Popup
-        confirmed = show_custom_info_dialog(self, "MATCH GEWONNEN!", f"{winner_name} gewinnt das Match!\nEndstand: {self.sets1} : {self.sets2}", cancel_text="Zurück")
-        
-        # Konfetti stoppen
+    
+    def stop_confetti(self):
         if self.confetti_overlay1:
             self.confetti_overlay1.stop_confetti()
         if self.confetti_overlay2:
             self.confetti_overlay2.stop_confetti()
+    
+    def on_result_confirmed(self):
+        """OK im Overlay: neuer Satz bzw. Match speichern und zurück."""
+        self.stop_confetti()
+        if not self.engine.is_match_finished():
+            # Neuer Satz: Aufschlag wechselt (MatchEngine.reset_set)
+            self.engine.reset_set()
+            self.journal_event(EVENT_RESET_SET)
+            return
         
-        if confirmed:
-            # ERST JETZT in DB speichern
-            if self.main_window and self.main_window.db:
-                self.main_window.db.save_match_with_names(self.player1_name, self.player2_name, self.sets1, self.sets2, self.turnier_id)
-            
-            if self.main_window:
-                if self.turnier_id and self.main_window.current_turnier_name:
-                    self.main_window.show_turnier_detail(self.turnier_id, self.main_window.current_turnier_name)
-                else:
-                    self.main_window.show_start_menu()
-        else:
-            # ABBRECHEN: Exakt den letzten Punkt (der zum Matchgewinn führte) rückgängig machen
-            self.on_undo()
+        # ERST JETZT speichern - im Hintergrund, die nächste Seite erscheint sofort
+        if self.main_window:
+            self.main_window.match_saver.save(self.player1_name, self.player2_name, self.engine.sets_player1, self.engine.sets_player2, self.turnier_id)
+        self.close_journal()
+        
+        if self.main_window:
+            if self.turnier_id and self.main_window.current_turnier_name:
+                self.main_window.show_turnier_detail(self.turnier_id, self.main_window.current_turnier_name)
+            else:
+                self.main_window.show_start_menu()
+    
+    def on_result_cancelled(self):
+        """Zurück im Overlay: exakt den letzten Punkt (der zum Satz-/Matchgewinn führte) rückgängig machen."""
+        self.stop_confetti()
+        self.on_undo()
     
     def on_undo(self):
-        if self.history:
-            self.score1, self.score2, self.sets1, self.sets2, self.server = self.history.pop()
-            self.update_display()
+        # Nimmt den letzten Punkt zurück (inkl. Satzwechsel danach), Statistik rollt mit
+        if not self.engine.undo_last_point():
+            return False
+        self.journal_event(EVENT_UNDO)
+        return True
     
     def on_quit(self):
         # HIER: Neues, rahmenloses Popup beim Abbrechen
         if show_custom_confirm_dialog(self, 'Abbrechen', 'Match abbrechen ohne Speichern?'):
+            self.close_journal()
             if self.main_window:
                 if self.turnier_id and self.main_window.current_turnier_name:
                     self.main_window.show_turnier_detail(self.turnier_id, self.main_window.current_turnier_name)
@@ -2848,79 +2131,330 @@ class ScoreboardPage(QWidget):
 
 
 # ==================== HAUPTFENSTER ====================
+# Pause zwischen zwei im Leerlauf vorgewärmten Seiten (Touch bleibt bedienbar)
+PAGE_WARMUP_INTERVAL_MS = 50
+
+
+class FirstFrameProbe(QObject):
+    """Misst die Zeit bis zum ersten gezeichneten, bedienbaren Bild.
+    
+    Das erste UpdateRequest des Fensters zeichnet alles; der Timer danach
+    läuft erst, wenn das Bild fertig ist und die Event-Loop wieder frei.
+    """
+    
+    shown = pyqtSignal(float)
+    
+    def __init__(self, window, started):
+        super().__init__(window)
+        self.started = started
+        window.installEventFilter(self)
+    
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.UpdateRequest:
+            watched.removeEventFilter(self)
+            QTimer.singleShot(0, self.report)
+        return False
+    
+    def report(self):
+        self.shown.emit(time.perf_counter() - self.started)
+
+
+def _page_property(index):
+    """Attribut (page_start, ...) für die Seite ``index``, gebaut beim ersten Zugriff."""
+    return property(lambda self: self.page(index))
+
+
 class TTRMainWindow(QMainWindow):
+    # Seiten werden erst bei der ersten Navigation gebaut (Kaltstart)
+    PAGE_FACTORIES = {
+        PageIndex.START_MENU: StartMenuPage,
+        PageIndex.MATCH_SETUP: MatchSetupPage,
+        PageIndex.TURNIER_LIST: TurnierListPage,
+        PageIndex.TURNIER_DETAIL: TurnierDetailPage,
+        PageIndex.SCOREBOARD: ScoreboardPage,
+        PageIndex.KEYBOARD: FullscreenKeyboardPage,  # Vollbild-Tastatur
+    }
+    # Reihenfolge beim Vorwärmen: häufigste Ziele zuerst
+    WARMUP_ORDER = (
+        PageIndex.SCOREBOARD,
+        PageIndex.MATCH_SETUP,
+        PageIndex.KEYBOARD,
+        PageIndex.TURNIER_LIST,
+        PageIndex.TURNIER_DETAIL,
+    )
+    
+    page_start = _page_property(PageIndex.START_MENU)
+    page_setup = _page_property(PageIndex.MATCH_SETUP)
+    page_turnier_list = _page_property(PageIndex.TURNIER_LIST)
+    page_turnier_detail = _page_property(PageIndex.TURNIER_DETAIL)
+    page_scoreboard = _page_property(PageIndex.SCOREBOARD)
+    page_keyboard = _page_property(PageIndex.KEYBOARD)
+    
     def __init__(self):
         super().__init__()
+        # Verbunden wird erst nach dem ersten Bild, im Speicher-Thread (connect_database)
         self.db = DatabaseManager()
-        self.db.connect()
+        
+        # Beendete Matches werden im Hintergrund gespeichert (GUI wartet nie auf MySQL)
+        self.match_saver = MatchSaver(self)
+        self.match_saver.match_saved.connect(self.on_match_saved)
+        self.match_saver.database_connected.connect(self.on_database_connected)
         
         self.current_turnier_id = None
         self.current_turnier_name = None
         
+        # Kaltstart messen; danach im Leerlauf die übrigen Seiten bauen
+        self.first_frame_seconds = None
+        self.first_frame_probe = FirstFrameProbe(self, STARTUP_CLOCK)
+        self.first_frame_probe.shown.connect(self.on_first_frame)
+        
+        # Werden beim Bau des Scoreboards angehängt (on_page_built)
+        self.spectator = None
+        self.perf_hud = None
+        
         self.setup_ui()
         self.setWindowTitle("TTR - Table Tennis Referee")
+        
+        # Zuschauer-Spiegel auf dem zweiten Monitor (APP_SPECTATOR_SCREEN)
+        screen = spectator_screen(get_app_config().spectator_screen)
+        if screen is not None:
+            self.setup_spectator(screen)
+        
+        # Performance-HUD nur im Debug-Modus (F12 blendet ein/aus)
+        if get_app_config().debug:
+            self.setup_perf_hud()
         self.setMinimumSize(800, 600)
+        
+        # Nach einem Absturz: laufendes Match aus dem Journal wiederherstellen
+        QTimer.singleShot(0, self.restore_running_match)
     
     def setup_ui(self):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
         
-        self.page_start = StartMenuPage(self)
-        self.page_setup = MatchSetupPage(self)
-        self.page_turnier_list = TurnierListPage(self)
-        self.page_turnier_detail = TurnierDetailPage(self)
-        self.page_scoreboard = ScoreboardPage(self)
-        self.page_keyboard = FullscreenKeyboardPage(self)  # Vollbild-Tastatur
+        # Platzhalter halten die Indizes stabil (Index 4 ist immer das Scoreboard)
+        self.pages = {}
+        for _ in PageIndex:
+            self.stack.addWidget(QWidget())
+        
+        self.show_page(PageIndex.START_MENU)
+    
+    def page(self, index):
+        """Gibt die Seite ``index`` zurück und baut sie beim ersten Aufruf."""
+        page = self.pages.get(index)
+        if page is not None:
+            return page
+        
+        start = time.perf_counter()
+        page = self.pages[index] = self.PAGE_FACTORIES[index](self)
+        current = self.stack.currentIndex()
+        placeholder = self.stack.widget(index)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(index, page)
+        self.stack.setCurrentIndex(current)
+        self.on_page_built(index, page)
+        
+        perf = get_perf_stats()
+        if perf is not None:
+            perf.record(f"build {PageIndex(index).name.lower()}", time.perf_counter() - start)
+        return page
+    
+    def on_page_built(self, index, page):
+        """Hängt Zuschauer-Spiegel und Performance-HUD an das frisch gebaute Scoreboard."""
+        if index != PageIndex.SCOREBOARD:
+            return
+        if self.spectator is not None:
+            page.spectator = self.spectator
+            page.update_spectator()
+        if self.perf_hud is not None:
+            self.watch_scoreboard_paint(page)
+    
+    def show_page(self, index):
+        """Zeigt die Seite ``index`` (baut sie bei Bedarf)."""
+        self.page(index)
+        self.stack.setCurrentIndex(index)
+    
+    def on_first_frame(self, seconds):
+        """Erstes Bild ist da: Startzeit melden, Seiten im Leerlauf vorwärmen."""
+        self.first_frame_seconds = seconds
+        print(f"⏱️ Bedienbar nach {seconds * 1000:.0f} ms ({len(self.pages)} von {len(PageIndex)} Seiten gebaut)")
+        perf = get_perf_stats()
+        if perf is not None:
+            perf.record("first frame", seconds)
+        mark_startup("first frame")
+        QTimer.singleShot(0, self.connect_database)
+        if get_app_config().page_warmup:
+            QTimer.singleShot(PAGE_WARMUP_INTERVAL_MS, self.warm_up_pages)
+    
+    def connect_database(self):
+        """Verbindet die Datenbank im Hintergrund (lädt dabei mysql.connector).
+        
+        Die GUI bleibt bedienbar, bis MySQL antwortet oder das Timeout greift;
+        bis dahin zeigen die Seiten keine Datenbank-Daten.
+        """
+        self.match_saver.connect_database(self.db)
+    
+    def on_database_connected(self, ok):
+        """Verbindung steht (oder ist gescheitert): sichtbare Seite neu laden."""
+        self.db.connecting = False
+        mark_startup("database connected" if ok else "database unavailable")
+        profile = get_startup_profile()
+        if profile is not None:
+            print(profile.report())
+        
+        # Andere Seiten laden ihre Daten ohnehin beim nächsten Anzeigen
+        page = self.stack.currentWidget()
+        if page is self.pages.get(PageIndex.MATCH_SETUP):
+            page.refresh_autocomplete()
+            if page.turnier_container.isVisible():
+                page.load_turniere()
+        elif page is self.pages.get(PageIndex.TURNIER_LIST):
+            page.load_turniere()
+        elif page is self.pages.get(PageIndex.TURNIER_DETAIL) and page.turnier_id:
+            page.load_turnier(page.turnier_id, page.turnier_name)
+        elif page is self.pages.get(PageIndex.KEYBOARD) and page.btn_dropdown.isVisible():
+            page.load_suggestions()
+            if page.suggestions_list.isVisible():
+                page.update_suggestions()
+    
+    def warm_up_pages(self):
+        """Baut die nächste fehlende Seite, eine pro Leerlauf-Durchgang."""
+        for index in self.WARMUP_ORDER:
+            if index not in self.pages:
+                self.page(index)
+                QTimer.singleShot(PAGE_WARMUP_INTERVAL_MS, self.warm_up_pages)
+                return
+    
+    def setup_spectator(self, screen):
+        """Öffnet den Zuschauer-Spiegel auf ``screen``.
         
-        self.stack.addWidget(self.page_start)          # 0
-        self.stack.addWidget(self.page_setup)          # 1
-        self.stack.addWidget(self.page_turnier_list)   # 2
-        self.stack.addWidget(self.page_turnier_detail) # 3
-        self.stack.addWidget(self.page_scoreboard)     # 4
-        self.stack.addWidget(self.page_keyboard)       # 5
+        Das Scoreboard wird dafür nicht gebaut: der Spiegel zeichnet aus dem
+        Spielstand und wird beim Bau des Scoreboards angehängt (on_page_built).
+        """
+        from src.ui.widgets.spectator_window import SpectatorWindow
+        
+        self.spectator = SpectatorWindow(self, flipped=get_app_config().spectator_flip)
+        self.spectator.show_on(screen)
+        sb = self.pages.get(PageIndex.SCOREBOARD)
+        if sb is not None:
+            sb.spectator = self.spectator
+            sb.update_spectator()
+    
+    def setup_perf_hud(self):
+        """Baut das Performance-HUD; die Scoreboard-Widgets folgen mit dem Scoreboard."""
+        # Nur im Debug-Modus gebraucht, deshalb erst hier importiert
+        from src.ui.widgets.perf_hud import PerfHud
+        
+        self.perf_hud = PerfHud(self)
+        if self.spectator is not None:
+            PerfHud.watch_paint(self.spectator, "spectator")
+        sb = self.pages.get(PageIndex.SCOREBOARD)
+        if sb is not None:
+            self.watch_scoreboard_paint(sb)
+        shortcut = QShortcut(QKeySequence("F12"), self)
+        shortcut.activated.connect(self.perf_hud.toggle)
+        self.perf_hud.set_active(True)
+    
+    def watch_scoreboard_paint(self, sb):
+        """Misst die Zeichenzeit der teuren Scoreboard-Widgets im HUD."""
+        from src.ui.widgets.perf_hud import PerfHud
+        
+        for widget, name in (
+            (sb.lbl_score1, "score1"),
+            (sb.lbl_score2, "score2"),
+            (sb.confetti_overlay1, "confetti1"),
+            (sb.confetti_overlay2, "confetti2"),
+            (sb.result_overlay, "overlay"),
+        ):
+            PerfHud.watch_paint(widget, name)
+    
+    def show_keyboard_for_field(self, target_field, return_index, title="Eingabe", on_close=None, **options):
+        """Öffnet Vollbild-Tastatur für ein Eingabefeld.
+        
+        on_close(accepted) folgt nach der Rückkehr zur Seite ``return_index``;
+        ``options`` gehen an FullscreenKeyboardPage.open_for_field().
+        """
+        def on_keyboard_close(accepted):
+            self.show_page(return_index)
+            if on_close:
+                on_close(accepted)
         
-        self.stack.setCurrentIndex(0)
+        self.page_keyboard.open_for_field(target_field, on_keyboard_close, title, **options)
+        self.show_page(PageIndex.KEYBOARD)
     
-    def show_keyboard_for_field(self, target_field, return_index, title="Eingabe"):
-        """Öffnet Vollbild-Tastatur für ein Eingabefeld."""
-        def on_keyboard_close():
-            self.stack.setCurrentIndex(return_index)
+    def ask_text(self, title, placeholder=""):
+        """Fragt einen Text über die Vollbild-Tastatur ab (ohne Vorschläge).
         
-        self.page_keyboard.open_for_field(target_field, on_keyboard_close, title)
-        self.stack.setCurrentIndex(5)
+        Blockiert wie ein Dialog und kehrt danach zur aktuellen Seite zurück.
+        Returns: (text, ok)
+        """
+        field = QLineEdit()
+        result = []
+        loop = QEventLoop()
+        
+        def on_close(accepted):
+            result.append(accepted)
+            loop.quit()
+        
+        self.show_keyboard_for_field(field, self.stack.currentIndex(), title, on_close,
+                                     placeholder=placeholder, suggestions=False)
+        loop.exec()
+        return field.text(), bool(result and result[0])
     
     def show_start_menu(self):
         self.current_turnier_id = None
         self.current_turnier_name = None
-        self.stack.setCurrentIndex(0)
+        self.show_page(PageIndex.START_MENU)
     
     def show_match_setup(self):
         self.current_turnier_id = None
         self.current_turnier_name = None
         self.page_setup.clear_inputs()
-        self.stack.setCurrentIndex(1)
+        self.show_page(PageIndex.MATCH_SETUP)
     
     def show_turnier_list(self):
         self.page_turnier_list.load_turniere()
-        self.stack.setCurrentIndex(2)
+        self.show_page(PageIndex.TURNIER_LIST)
     
     def show_turnier_detail(self, turnier_id, turnier_name):
         self.page_turnier_detail.load_turnier(turnier_id, turnier_name)
-        self.stack.setCurrentIndex(3)
+        self.show_page(PageIndex.TURNIER_DETAIL)
     
     def start_match(self, player1_id, player1_name, player2_id, player2_name):
-        self.page_scoreboard.reset_match(player1_id, player1_name, player2_id, player2_name)
         self.page_scoreboard.turnier_id = None
-        self.stack.setCurrentIndex(4)
+        self.page_scoreboard.reset_match(player1_id, player1_name, player2_id, player2_name)
+        self.show_page(PageIndex.SCOREBOARD)
+    
+    def restore_running_match(self):
+        """Zeigt ein aus dem Journal wiederhergestelltes Match an."""
+        # Ohne Journal das Scoreboard nicht schon beim Start bauen
+        if not get_app_config().journal_path.exists():
+            return
+        header = self.page_scoreboard.restore_from_journal()
+        if header:
+            self.current_turnier_id = header.turnier_id
+            self.current_turnier_name = header.turnier_name
+            self.show_page(PageIndex.SCOREBOARD)
     
     def start_turnier_match(self, turnier_id, turnier_name):
         self.current_turnier_id = turnier_id
         self.current_turnier_name = turnier_name
         self.page_setup.clear_inputs()
         self.page_setup.setup_for_turnier(turnier_id)
-        self.stack.setCurrentIndex(1)
+        self.show_page(PageIndex.MATCH_SETUP)
+    
+    def on_match_saved(self, turnier_id, ok):
+        """Ein Match ist in der DB: offene Turnieransicht neu laden."""
+        if not ok:
+            print("❌ Match konnte nicht gespeichert werden.")
+            return
+        page = self.pages.get(PageIndex.TURNIER_DETAIL)
+        if turnier_id and page is not None and self.stack.currentWidget() is page and page.turnier_id == turnier_id:
+            page.load_turnier(turnier_id, page.turnier_name)
     
     def closeEvent(self, event):
+        self.match_saver.shutdown()
         self.db.disconnect()
         event.accept()
 
@@ -2928,13 +2462,15 @@ class TTRMainWindow(QMainWindow):
 # ==================== HAUPTPROGRAMM ====================
 def main():
     app = QApplication(sys.argv)
-    app.setStyleSheet(DARK_STYLESHEET)
+    app.setStyleSheet(load_stylesheet())
     
     font = QFont()
     font.setPointSize(14)
     app.setFont(font)
+    mark_startup("QApplication")
     
     window = TTRMainWindow()
+    mark_startup("main window built")
     
     # HIER: Vollbild-Modus aktivieren (Kiosk Mode)
     window.showFullScreen()